@@ -0,0 +1,220 @@
+"""PID autotuning over the Monte Carlo closed-loop ensemble.
+
+Candidate gain sets -- plain ``(kp, ki, kd)`` triples or, with
+``n_tiers > 1``, gain tables interpolated in |error| between breakpoints
+exactly as :class:`~qht.cryocooler.pid.GainScheduledPID` does (the format of
+``PIDTestScenario.GAIN_TABLE``) -- are scored on a shared sample of plants
+drawn from the thermal-mass, heat-leak and sensor-noise ranges. Each batch of
+candidates x plants is one :func:`~qht.cryocooler.ensemble.simulate_ensemble`
+run; batches are spread over a process pool. Every candidate gets the
+``calculate_metrics``-style objectives (settling time, overshoot, steady-state
+error, stability) averaged over the plants, a weighted scalar cost, and the
+non-dominated candidates form the Pareto front.
+
+The cryostat actuator is a cooler: a temperature above setpoint must *raise*
+the output, so with :class:`~qht.cryocooler.pid.PID`'s ``setpoint -
+measurement`` error the tuned gains are negative (``reverse_acting=True``).
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from .ensemble import ScheduledPIDArray, ThermalModelArray, ensemble_metrics, simulate_ensemble
+from .sensor import SensorBank
+
+OBJECTIVES = ('settling_time', 'overshoot', 'steady_state_error', 'stability')
+
+
+@dataclass
+class AutotuneResult:
+    """Scored candidates, the best gain table and the Pareto front."""
+
+    gain_tables: np.ndarray  # (n_candidates, n_tiers, 3) signed (kp, ki, kd)
+    breakpoints: np.ndarray  # (n_candidates, n_tiers) |error| of each table row in K
+    objectives: np.ndarray  # (n_candidates, 4) plant-averaged OBJECTIVES
+    costs: np.ndarray  # (n_candidates,)
+    pareto: np.ndarray  # indices of the non-dominated candidates
+
+    @property
+    def best(self):
+        """Index of the lowest-cost candidate."""
+        return int(np.argmin(self.costs))
+
+    def gain_table(self, index=None):
+        """
+        Gain table of one candidate (default: the best).
+
+        Returns:
+            list: ``(abs_error, kp, ki, kd)`` rows in increasing error order,
+            the ``GainScheduledPID`` breakpoints and gains
+        """
+        i = self.best if index is None else index
+        return [(float(b), *map(float, g)) for b, g in zip(self.breakpoints[i], self.gain_tables[i])]
+
+
+def pareto_front(objectives):
+    """Indices of the rows of ``objectives`` (minimized) no other row dominates."""
+    obj = np.asarray(objectives, dtype=float)
+    dominated = np.zeros(len(obj), dtype=bool)
+    for i in range(len(obj)):
+        better_eq = np.all(obj <= obj[i], axis=1)
+        strictly = np.any(obj < obj[i], axis=1)
+        dominated[i] = np.any(better_eq & strictly)
+    return np.flatnonzero(~dominated)
+
+
+def _sample_plants(n_plants, thermal_mass, heat_leak, sensor_noise, rng):
+    return {
+        'thermal_mass': rng.uniform(*thermal_mass, n_plants),
+        'heat_leak_coefficient': rng.uniform(*heat_leak, n_plants),
+        'noise_level': rng.uniform(*sensor_noise, n_plants),
+    }
+
+
+def _evaluate_batch(gain_tables, breakpoints, plants, setpoint, initial_temp, n_steps, dt,
+                    output_limits, sensor_seed):
+    """Plant-averaged objectives for a batch of candidates (runs in a worker)."""
+    n_cand = len(gain_tables)
+    n_plants = len(plants['thermal_mass'])
+    k = n_cand * n_plants
+    # Member index = candidate * n_plants + plant.
+    per_member = lambda a: np.repeat(a, n_plants, axis=0)  # noqa: E731
+    per_plant = lambda a: np.tile(a, n_cand)  # noqa: E731
+
+    thermal = ThermalModelArray(
+        k, initial_temp=initial_temp,
+        thermal_mass=per_plant(plants['thermal_mass']),
+        heat_leak_coefficient=per_plant(plants['heat_leak_coefficient']),
+    )
+    pid = ScheduledPIDArray(
+        k, per_member(breakpoints), per_member(gain_tables), setpoint, output_limits=output_limits
+    )
+    # The same seed for every batch: all candidates see identical noise.
+    sensors = SensorBank(
+        k, base_temp=initial_temp, noise_level=per_plant(plants['noise_level']),
+        response_time=0.5, fail_rate=0.0, seed=sensor_seed,
+    )
+    res = simulate_ensemble(thermal, pid, n_steps=n_steps, dt=dt, sensors=sensors, dtype=np.float32)
+    m = ensemble_metrics(res.times, res.measurement, setpoint)
+
+    # Overshoot past the setpoint in the direction of travel (below it for a
+    # cool-down); ensemble_metrics' peak-minus-setpoint would only measure
+    # the starting offset of a step from above.
+    direction = 1.0 if setpoint >= initial_temp else -1.0
+    overshoot = np.max(direction * (res.measurement - setpoint), axis=1)
+
+    duration = n_steps * dt
+    per_candidate = np.stack([
+        np.where(np.isnan(m['settling_time']), duration, m['settling_time']),  # never settled
+        np.maximum(overshoot, 0.0),
+        np.abs(m['steady_state_error']),
+        m['stability'],
+    ], axis=1).reshape(n_cand, n_plants, len(OBJECTIVES))
+    return per_candidate.mean(axis=1)
+
+
+def _increasing(breakpoints):
+    """Sort each row and separate ties (e.g. two breakpoints clipped to the
+    same end of the range) so the rows are strictly increasing."""
+    return np.sort(breakpoints, axis=1) + 1e-6 * np.arange(breakpoints.shape[1])
+
+
+def _random_candidates(n, n_tiers, kp_range, ki_range, kd_range, breakpoint_range, rng):
+    lo = np.log10([kp_range[0], ki_range[0], kd_range[0]])
+    hi = np.log10([kp_range[1], ki_range[1], kd_range[1]])
+    tables = 10.0 ** rng.uniform(lo, hi, size=(n, n_tiers, 3))
+    breakpoints = _increasing(rng.uniform(*breakpoint_range, size=(n, n_tiers)))
+    return tables, breakpoints
+
+
+def autotune(setpoint=4.0, initial_temp=4.2, n_candidates=256, n_tiers=1, n_rounds=3,
+             n_plants=16, thermal_mass=(500.0, 1500.0), heat_leak=(0.0005, 0.002),
+             sensor_noise=(0.001, 0.01), kp_range=(0.01, 20.0), ki_range=(1e-4, 2.0),
+             kd_range=(1e-4, 2.0), breakpoint_range=(0.05, 1.5), reverse_acting=True,
+             output_limits=(0, 2), n_steps=2000, dt=0.1, weights=(1.0, 1.0, 1.0, 1.0),
+             batch_size=64, n_workers=1, seed=None):
+    """
+    Search PID gains (optionally gain-scheduled) against a robustness cost.
+
+    The first round samples ``n_candidates`` gain sets log-uniformly from the
+    ranges; each later round samples as many again in a box around the best
+    candidates so far, shrinking by half per round.
+
+    Args:
+        setpoint, initial_temp (float): Step-response target and start in Kelvin
+        n_candidates (int): Candidates evaluated per round
+        n_tiers (int): Gain-schedule tiers (1 = fixed gains)
+        n_rounds (int): Search rounds
+        n_plants (int): Plants each candidate is evaluated on
+        thermal_mass, heat_leak, sensor_noise (tuple): Uniform plant ranges
+        kp_range, ki_range, kd_range (tuple): Gain *magnitude* ranges
+        breakpoint_range (tuple): Range of the |error| breakpoints in Kelvin
+        reverse_acting (bool): Negate the gains (cooling actuator)
+        output_limits (tuple): Controller output limits (the cooling multiplier)
+        n_steps, dt: Closed-loop simulation length and step
+        weights (tuple): Cost weights for OBJECTIVES; settling time is scaled
+            by the run duration, the other objectives by the setpoint
+        batch_size (int): Candidates per ensemble run
+        n_workers (int): Worker processes (1 evaluates in this process)
+        seed (int): Seed for plants, candidates and sensor noise
+
+    Returns:
+        AutotuneResult: All evaluated candidates with signed gains
+    """
+    rng = np.random.default_rng(seed)
+    plants = _sample_plants(n_plants, thermal_mass, heat_leak, sensor_noise, rng)
+    sensor_seed = int(rng.integers(2**32))
+    sign = -1.0 if reverse_acting else 1.0
+    ranges = np.array([kp_range, ki_range, kd_range], dtype=float)
+    scale = np.array([n_steps * dt, setpoint, setpoint, setpoint])
+
+    tables = np.empty((0, n_tiers, 3))
+    bps = np.empty((0, n_tiers))
+    objectives = np.empty((0, len(OBJECTIVES)))
+    executor = ProcessPoolExecutor(n_workers) if n_workers > 1 else None
+    try:
+        for rnd in range(n_rounds):
+            if rnd == 0:
+                new_t, new_b = _random_candidates(
+                    n_candidates, n_tiers, *ranges, breakpoint_range, rng
+                )
+            else:
+                costs = (objectives / scale) @ np.asarray(weights, dtype=float)
+                elite = np.argsort(costs)[:max(1, n_candidates // 16)]
+                parent = rng.choice(elite, n_candidates)
+                # Log-space perturbation whose width halves every round.
+                width = 0.5 ** rnd * np.log10(ranges[:, 1] / ranges[:, 0])
+                log_t = np.log10(tables[parent]) + rng.uniform(-1, 1, (n_candidates, n_tiers, 3)) * width
+                new_t = 10.0 ** np.clip(log_t, np.log10(ranges[:, 0]), np.log10(ranges[:, 1]))
+                bp_width = 0.5 ** rnd * (breakpoint_range[1] - breakpoint_range[0])
+                new_b = _increasing(np.clip(
+                    bps[parent] + rng.uniform(-1, 1, (n_candidates, n_tiers)) * bp_width,
+                    *breakpoint_range,
+                ))
+
+            batches = [
+                (sign * new_t[i:i + batch_size], new_b[i:i + batch_size], plants, setpoint,
+                 initial_temp, n_steps, dt, output_limits, sensor_seed)
+                for i in range(0, n_candidates, batch_size)
+            ]
+            if executor is None:
+                results = [_evaluate_batch(*b) for b in batches]
+            else:
+                results = list(executor.map(_evaluate_batch, *zip(*batches)))
+            tables = np.concatenate([tables, new_t])
+            bps = np.concatenate([bps, new_b])
+            objectives = np.concatenate([objectives] + results)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    costs = (objectives / scale) @ np.asarray(weights, dtype=float)
+    return AutotuneResult(
+        gain_tables=sign * tables,
+        breakpoints=bps,
+        objectives=objectives,
+        costs=costs,
+        pareto=pareto_front(objectives),
+    )
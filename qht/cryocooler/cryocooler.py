@@ -1,20 +1,45 @@
 import argparse
 import time
-import pandas as pd
-import matplotlib.pyplot as plt
 import numpy as np
-from datetime import datetime
 from pathlib import Path
 from .sensor import Sensor
 from ..daq.daq_system import DAQ
 from .pid import PID
-from ..utils.report import generate_csv_report, generate_pdf_report
+from .fusion import KalmanFusion
+from .metrics import OnlineMetrics
+from .telemetry import TelemetryBuffer
 from ..utils.logger import simple_logger
 
 class CryocoolerTest:
-    def __init__(self, test_duration=3600, setpoint=4.0):
+    TIME_STEP = 0.2  # Simulation time step in seconds
+    # Variance of the periodic terms every Sensor.read shares (0.02 K and 0.01 K sines).
+    SENSOR_COMMON_VARIANCE = (0.02 ** 2 + 0.01 ** 2) / 2
+
+    def __init__(self, test_duration=3600, setpoint=4.0, ring_capacity=None, plant=None,
+                 stage=None, heater_full_scale=1.0, fusion=True, process_variance=1e-6):
+        """
+        Args:
+            test_duration (float): Simulated test length in seconds
+            setpoint (float): Temperature setpoint in Kelvin
+            ring_capacity (int): If given, keep only the most recent
+                ``ring_capacity`` telemetry rows (for unbounded soak runs)
+            plant (ThermalNetwork): Optional thermal network to control; the
+                sensors then track ``stage`` and the PID drives its heater.
+                Without a plant the sensors sit at the setpoint.
+            stage (str or int): Stage of ``plant`` under test
+            heater_full_scale (float): Heater power in Watts at full PID output
+            fusion (bool): Feed the PID the Kalman-fused sensor estimate
+                (:class:`KalmanFusion`) instead of the plain mean of the
+                sensors that answered. The metrics are unaffected by this
+                choice: they always describe the measured temperature.
+            process_variance (float): Fusion filter process noise in K^2 per
+                step; smaller values filter harder but respond more slowly
+        """
         self.test_duration = test_duration
         self.setpoint = setpoint
+        self.plant = plant
+        self.stage = None if plant is None else plant.index(stage if stage is not None else 0)
+        self.heater_full_scale = heater_full_scale
         self.sensors = [Sensor(i, base_temp=setpoint) for i in range(4)]
         self.daq = DAQ(self.sensors, network_latency=0.1)
         self.pid = PID(
@@ -26,7 +51,26 @@ class CryocoolerTest:
             sample_time=0.1,
             anti_windup=True
         )
-        self.log_entries = []
+        self.fusion = None
+        extra_columns = ()
+        if fusion:
+            self.fusion = KalmanFusion(
+                [s.noise_level ** 2 for s in self.sensors],
+                process_variance=process_variance,
+                common_variance=self.SENSOR_COMMON_VARIANCE,
+            )
+            extra_columns = ('fused_temp', 'fused_variance')
+        if plant is not None:
+            extra_columns += ('stage_temp',)
+        if ring_capacity is not None:
+            self.telemetry = TelemetryBuffer(len(self.sensors), capacity=ring_capacity, ring=True,
+                                             extra_columns=extra_columns)
+        else:
+            n_steps = int(np.ceil(test_duration / self.TIME_STEP)) + 1
+            self.telemetry = TelemetryBuffer(len(self.sensors), capacity=n_steps,
+                                             extra_columns=extra_columns)
+        # Updated every step; query self.metrics.results() for a live view.
+        self.metrics = OnlineMetrics(setpoint)
         self.test_start_time = None
         self.test_results = {
             'stability': None,
@@ -36,7 +80,19 @@ class CryocoolerTest:
             'temperature_variance': None
         }
 
-    def calculate_metrics(self, times, temps, pid_outs):
+    def calculate_metrics(self, telemetry=None):
+        """
+        Compute the summary metrics from a telemetry buffer (default: this test's).
+
+        Metrics describe the measured temperature, whichever estimate the
+        controller acted on: the plant stage temperature when the buffer has a
+        ``stage_temp`` column, else the sensor average.
+        """
+        if telemetry is None:
+            telemetry = self.telemetry
+        times = telemetry['elapsed_time']
+        temps = telemetry['stage_temp' if 'stage_temp' in telemetry.columns else 'avg_temp']
+
         # Calculate stability (standard deviation of temperature)
         self.test_results['stability'] = np.std(temps[-100:])  # Last 100 readings
         
@@ -46,43 +102,49 @@ class CryocoolerTest:
             self.test_results['cooling_rate'] = cooling_rate
         
         # Calculate overshoot
-        max_temp = max(temps)
+        max_temp = np.max(temps)
         self.test_results['overshoot'] = max_temp - self.setpoint
         
         # Calculate settling time (time to reach within 5% of setpoint)
         settling_threshold = self.setpoint * 0.05
-        for i, temp in enumerate(temps):
-            if abs(temp - self.setpoint) <= settling_threshold:
-                self.test_results['settling_time'] = times[i]
-                break
+        settled = np.abs(temps - self.setpoint) <= settling_threshold
+        if settled.any():
+            self.test_results['settling_time'] = times[np.argmax(settled)]
         
         # Calculate temperature variance
         self.test_results['temperature_variance'] = np.var(temps)
 
     def run_test_cycle(self, plot=True):
         self.test_start_time = 0.0  # Start at 0 for simulated time
-        times, temps, pid_outs = [], [], []
         sim_time = 0.0
-        time_step = 0.2  # Simulation time step
+        time_step = self.TIME_STEP
+        sensor_row = np.empty(len(self.sensors))
+        pid_out = 0.0
+        stage_row = ()
         
         while sim_time < self.test_duration:
+            if self.plant is not None:
+                stage_temp = self.plant.temperature[self.stage]
+                stage_row = (stage_temp,)
+                for sensor in self.sensors:
+                    sensor.base_temp = stage_temp
             try:
                 temp_readings = self.daq.read_all(current_time=sim_time)
                 avg_temp = sum(temp_readings) / len(temp_readings)
-                pid_out = self.pid.update(avg_temp, current_time=sim_time)
                 
-                entry = {
-                    'timestamp': datetime.now().isoformat(),
-                    'avg_temp': avg_temp,
-                    'pid_output': pid_out,
-                    'sensor_data': temp_readings,
-                    'elapsed_time': sim_time
-                }
-                self.log_entries.append(entry)
+                # Failed sensors are recorded as NaN in their column.
+                sensor_row.fill(np.nan)
+                sensor_row[self.daq.last_valid] = temp_readings
                 
-                times.append(sim_time)
-                temps.append(avg_temp)
-                pid_outs.append(pid_out)
+                if self.fusion is not None:
+                    fused_temp, fused_var = self.fusion.update(sensor_row, self.daq.last_valid)
+                    pid_out = self.pid.update(fused_temp, current_time=sim_time)
+                    self.telemetry.append(sim_time, avg_temp, pid_out, sensor_row,
+                                          (fused_temp, fused_var) + stage_row)
+                else:
+                    pid_out = self.pid.update(avg_temp, current_time=sim_time)
+                    self.telemetry.append(sim_time, avg_temp, pid_out, sensor_row, stage_row)
+                self.metrics.update(sim_time, stage_row[0] if stage_row else avg_temp)
                 
                 simple_logger(f"Time: {sim_time:.1f}s, Temp: {avg_temp:.3f} K, PID: {pid_out:.3f}")
                 
@@ -90,16 +152,32 @@ class CryocoolerTest:
                 simple_logger(f"Error: {e}")
                 self.daq.reconnect()
             
+            if self.plant is not None:
+                # The heater holds its last setting through a failed read.
+                self.plant.set_heater_power(
+                    pid_out / self.pid.output_limits[1] * self.heater_full_scale, self.stage
+                )
+                self.plant.update(time_step)
+            
             sim_time += time_step
         
-        self.calculate_metrics(times, temps, pid_outs)
+        # The streaming metrics cover the whole run, even with a ring buffer.
+        self.test_results.update(self.metrics.results())
         
         if plot:
-            self.plot_results(times, temps, pid_outs)
+            self.plot_results(
+                self.telemetry['elapsed_time'],
+                self.telemetry['avg_temp'],
+                self.telemetry['pid_output'],
+            )
         
-        return self.log_entries
+        return self.telemetry
 
     def plot_results(self, times, temps, pid_outs):
+        # Plotting/report libraries are imported on first use so headless
+        # runs and worker processes don't pay for them at import time.
+        import matplotlib.pyplot as plt
+
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
         
         # Temperature plot
@@ -124,11 +202,13 @@ class CryocoolerTest:
         plt.close()
 
     def generate_report(self):
+        from ..utils.report import generate_pdf_report
+
         # Create reports directory if it doesn't exist
         Path('reports').mkdir(exist_ok=True)
         
         # Generate CSV report
-        df = pd.DataFrame(self.log_entries)
+        df = self.telemetry.to_dataframe()
         df.to_csv('reports/test_data.csv', index=False)
         
         # Generate PDF report with test results
@@ -139,17 +219,56 @@ class CryocoolerTest:
             output_file='reports/test_report.pdf'
         )
 
+def run_autotune(args):
+    """Run the gain search and print the tuned table and the Pareto front."""
+    from .autotune import OBJECTIVES, autotune
+
+    result = autotune(
+        setpoint=args.setpoint,
+        n_candidates=args.candidates,
+        n_tiers=args.tiers,
+        n_workers=args.workers,
+        seed=args.seed,
+    )
+    print(f"Tuned gain table (setpoint {args.setpoint} K, cost {result.costs[result.best]:.4f}):")
+    print(f"  {'|error|':>10s} {'kp':>10s} {'ki':>10s} {'kd':>10s}")
+    for abs_error, kp, ki, kd in result.gain_table():
+        print(f"  {abs_error:10.3f} {kp:10.4f} {ki:10.4f} {kd:10.4f}")
+    print(f"Pareto front ({len(result.pareto)} of {len(result.costs)} candidates):")
+    print("  " + " ".join(f"{name:>18s}" for name in OBJECTIVES) + f" {'cost':>8s}")
+    for i in result.pareto[np.argsort(result.costs[result.pareto])]:
+        print("  " + " ".join(f"{v:18.4f}" for v in result.objectives[i]) + f" {result.costs[i]:8.4f}")
+    return result
+
 def main():
     parser = argparse.ArgumentParser(description='Cryocooler Test System')
     parser.add_argument('--run-test', action='store_true', help='Run the test cycle')
     parser.add_argument('--duration', type=int, default=3600, help='Test duration in seconds')
     parser.add_argument('--setpoint', type=float, default=4.0, help='Temperature setpoint in Kelvin')
     parser.add_argument('--generate-report', action='store_true', help='Generate test report')
+    parser.add_argument('--stage', default=None,
+                        help='Control this stage of a simulated dilution refrigerator '
+                             '(50K, 4K, still, cold_plate, mixing_chamber)')
+    parser.add_argument('--heater-power', type=float, default=1.0,
+                        help='Stage heater power in Watts at full PID output')
+    parser.add_argument('--autotune', action='store_true',
+                        help='Tune PID gains on a Monte Carlo ensemble of plants')
+    parser.add_argument('--candidates', type=int, default=256, help='Autotune candidates per round')
+    parser.add_argument('--tiers', type=int, default=1, help='Autotune gain-schedule tiers (1 = fixed gains)')
+    parser.add_argument('--workers', type=int, default=1, help='Autotune worker processes')
+    parser.add_argument('--seed', type=int, default=None, help='Autotune random seed')
     
     args = parser.parse_args()
     
-    if args.run_test:
-        test = CryocoolerTest(test_duration=args.duration, setpoint=args.setpoint)
+    if args.autotune:
+        run_autotune(args)
+    elif args.run_test:
+        plant = None
+        if args.stage is not None:
+            from .thermal_network import ThermalNetwork
+            plant = ThermalNetwork.dilution_refrigerator()
+        test = CryocoolerTest(test_duration=args.duration, setpoint=args.setpoint, plant=plant,
+                              stage=args.stage, heater_full_scale=args.heater_power)
         test.run_test_cycle()
         
         if args.generate_report:
@@ -0,0 +1,367 @@
+"""Monte Carlo ensembles of the PID + ThermalModel closed loop.
+
+:class:`ThermalModelArray` and :class:`PIDArray` are array-state versions of
+:class:`~qht.cryocooler.thermal_model.ThermalModel` and
+:class:`~qht.cryocooler.pid.PID`: every attribute is a ``(K,)`` array and one
+``update`` call advances K independent systems in lockstep, step for step the
+same arithmetic as the scalar classes. :func:`simulate_ensemble` wires them to
+a :class:`~qht.cryocooler.sensor.SensorBank` and records ``(K, n_steps)``
+trajectories; :func:`ensemble_metrics` reduces them to per-member settling
+time, overshoot and steady-state error.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .sensor import SensorBank
+
+
+def _param(value, k):
+    return np.broadcast_to(np.asarray(value, dtype=float), (k,)).copy()
+
+
+class ThermalModelArray:
+    """K independent :class:`ThermalModel` instances advanced together."""
+
+    def __init__(self, n_members, initial_temp=4.0, thermal_mass=1000.0, cooling_power=5.0,
+                 ambient_temp=300.0, heat_leak_coefficient=0.001):
+        """
+        Initialize the ensemble.
+
+        Args:
+            n_members (int): Number of ensemble members K
+            initial_temp, thermal_mass, cooling_power, ambient_temp, heat_leak_coefficient:
+                As for :class:`ThermalModel`; scalars or ``(K,)`` arrays
+        """
+        self.n_members = int(n_members)
+        k = self.n_members
+        self.temperature = _param(initial_temp, k)
+        self.thermal_mass = _param(thermal_mass, k)
+        self.cooling_power = _param(cooling_power, k)
+        self.ambient_temp = _param(ambient_temp, k)
+        self.heat_leak_coefficient = _param(heat_leak_coefficient, k)
+        self.cooling_power_multiplier = np.ones(k)  # Controlled by PID
+        self.min_temp = 2.0  # Minimum achievable temperature
+        self.max_temp = 300.0  # Maximum temperature (ambient)
+
+    def update(self, dt):
+        """
+        Update every member's thermal state for one time step.
+
+        Args:
+            dt (float): Time step in seconds
+
+        Returns:
+            np.ndarray: New temperatures in Kelvin, shape ``(K,)``
+        """
+        temp_diff = self.ambient_temp - self.temperature
+        heat_transfer_coef = self.heat_leak_coefficient * (1 + 0.01 * np.abs(temp_diff))
+        heat_leak = heat_transfer_coef * temp_diff
+
+        cooling_efficiency = 1.0 - (self.temperature - self.min_temp) / (self.ambient_temp - self.min_temp)
+        cooling = self.cooling_power * self.cooling_power_multiplier * np.maximum(0, cooling_efficiency)
+
+        dT = np.clip((heat_leak - cooling) * dt / self.thermal_mass, -0.1, 0.1)
+        self.temperature = np.clip(self.temperature + dT, self.min_temp, self.max_temp)
+        return self.temperature
+
+    def set_cooling_power(self, multiplier):
+        """
+        Set the cooling power multipliers (rate-limited as in ThermalModel).
+
+        Args:
+            multiplier (float or np.ndarray): Cooling power multipliers (0 to 2)
+        """
+        max_change = 0.1
+        target = np.clip(multiplier, 0, 2)
+        step = np.clip(target - self.cooling_power_multiplier, -max_change, max_change)
+        self.cooling_power_multiplier = np.clip(self.cooling_power_multiplier + step, 0, 2)
+
+
+class PIDArray:
+    """K independent :class:`PID` controllers sharing one clock."""
+
+    def __init__(self, n_members, kp, ki, kd, setpoint, output_limits=(0, 100),
+                 sample_time=None, anti_windup=True):
+        """
+        Initialize the controllers.
+
+        Args:
+            n_members (int): Number of ensemble members K
+            kp, ki, kd, setpoint: Scalars or ``(K,)`` arrays
+            output_limits (tuple): Min and max output limits
+            sample_time (float): Fixed sample time (None for variable)
+            anti_windup (bool): Enable anti-windup protection
+        """
+        self.n_members = int(n_members)
+        k = self.n_members
+        self.kp = _param(kp, k)
+        self.ki = _param(ki, k)
+        self.kd = _param(kd, k)
+        self.setpoint = _param(setpoint, k)
+        self.output_limits = output_limits
+        self.sample_time = sample_time
+        self.anti_windup = anti_windup
+        self.reset()
+
+    def update(self, measurement, current_time):
+        """
+        Update every controller; the arithmetic matches :meth:`PID.update`.
+
+        Args:
+            measurement (np.ndarray): Process variable measurements, shape ``(K,)``
+            current_time (float): Current time, common to the ensemble
+
+        Returns:
+            np.ndarray: Controller outputs, shape ``(K,)``
+        """
+        if self._last_time is None:
+            self._last_time = current_time
+            return self._last_output.copy()
+
+        dt = current_time - self._last_time
+        if self.sample_time is not None:
+            if dt < self.sample_time:
+                return self._last_output.copy()
+            dt = self.sample_time
+
+        error = self.setpoint - measurement
+        p_term = self.kp * error
+        self._integral = self._integral + error * dt
+        i_term = self.ki * self._integral
+        # Same derivative term as PID.update (which differences against the
+        # stored last error), so ensemble statistics describe the real controller.
+        d_term = -self.kd * (measurement - self._last_error) / dt if dt > 0 else np.zeros(self.n_members)
+
+        raw = p_term + i_term + d_term
+        output = np.clip(raw, *self.output_limits)
+        if self.anti_windup:
+            saturated = output != raw
+            safe_ki = np.where(self.ki != 0, self.ki, 1.0)
+            wound = np.where(self.ki != 0, (output - p_term - d_term) / safe_ki, 0.0)
+            self._integral = np.where(saturated, wound, self._integral)
+
+        self._last_error = error
+        self._last_time = current_time
+        self._last_output = output
+        return output
+
+    def reset(self):
+        """Reset every controller's internal state."""
+        k = self.n_members
+        self._last_time = None
+        self._last_error = np.zeros(k)
+        self._integral = np.zeros(k)
+        self._last_output = np.zeros(k)
+
+
+class ScheduledPIDArray(PIDArray):
+    """K :class:`~qht.cryocooler.pid.GainScheduledPID` controllers advanced together.
+
+    Gains follow the same schedule in ``|setpoint - measurement|``: row ``i``
+    of member ``i``'s table applies at its ``breakpoints[i]``, values in
+    between are interpolated and values beyond either end are held. As in
+    :meth:`GainScheduledPID.update`, the derivative acts on the measurement and
+    the integrator accumulates the integral term (bumpless transfer), so a
+    table tuned on the ensemble behaves the same in the scalar loop.
+    """
+
+    def __init__(self, n_members, breakpoints, gains, setpoint, output_limits=(0, 100),
+                 sample_time=None, anti_windup=True):
+        """
+        Initialize the controllers.
+
+        Args:
+            n_members (int): Number of ensemble members K
+            breakpoints (np.ndarray): ``(n_rows,)`` or ``(K, n_rows)`` strictly
+                increasing |error| values of the table rows
+            gains (np.ndarray): ``(n_rows, 3)`` or ``(K, n_rows, 3)`` rows of (kp, ki, kd)
+            setpoint, output_limits, sample_time, anti_windup: As for :class:`PIDArray`
+        """
+        k = int(n_members)
+        gains = np.asarray(gains, dtype=float)
+        n_rows = gains.shape[-2]
+        self.gain_table = np.broadcast_to(gains, (k, n_rows, 3)).copy()
+        self.breakpoints = np.broadcast_to(np.asarray(breakpoints, dtype=float), (k, n_rows)).copy()
+        widths = np.diff(self.breakpoints, axis=1)
+        if np.any(widths <= 0):
+            raise ValueError("breakpoints must be strictly increasing")
+        # Per-segment slopes d(gain)/d|error|, as GainScheduledPID precomputes them.
+        self._slopes = np.diff(self.gain_table, axis=1) / widths[..., None]
+        kp, ki, kd = self.gain_table[:, 0].T
+        super().__init__(k, kp, ki, kd, setpoint, output_limits, sample_time, anti_windup)
+
+    def gains(self, abs_error):
+        """
+        Interpolated gains of every member, as :meth:`GainScheduledPID.gains`.
+
+        Args:
+            abs_error (np.ndarray): ``|setpoint - measurement|``, shape ``(K,)``
+
+        Returns:
+            np.ndarray: ``(K, 3)`` rows of (kp, ki, kd)
+        """
+        first, last = self.gain_table[:, 0], self.gain_table[:, -1]
+        n_rows = self.breakpoints.shape[1]
+        if n_rows == 1:
+            return first.copy()
+        members = np.arange(self.n_members)
+        # bisect_right(bp, e) - 1, kept on a valid segment for the held ends.
+        seg = np.clip((abs_error[:, None] >= self.breakpoints).sum(axis=1) - 1, 0, n_rows - 2)
+        x = abs_error - self.breakpoints[members, seg]
+        gains = self.gain_table[members, seg] + self._slopes[members, seg] * x[:, None]
+        gains = np.where((abs_error >= self.breakpoints[:, -1])[:, None], last, gains)
+        return np.where((abs_error <= self.breakpoints[:, 0])[:, None], first, gains)
+
+    def update(self, measurement, current_time):
+        """
+        Update every controller; the arithmetic matches :meth:`GainScheduledPID.update`.
+
+        Args:
+            measurement (np.ndarray): Process variable measurements, shape ``(K,)``
+            current_time (float): Current time, common to the ensemble
+
+        Returns:
+            np.ndarray: Controller outputs, shape ``(K,)``
+        """
+        if self._last_time is None:
+            self._last_time = current_time
+            self._last_measurement = np.array(measurement, dtype=float)
+            return self._last_output.copy()
+
+        dt = current_time - self._last_time
+        if self.sample_time is not None:
+            if dt < self.sample_time:
+                return self._last_output.copy()
+            dt = self.sample_time
+
+        error = self.setpoint - measurement
+        self.kp, self.ki, self.kd = self.gains(np.abs(error)).T
+
+        p_term = self.kp * error
+        self._i_term = self._i_term + self.ki * error * dt
+        d_term = -self.kd * (measurement - self._last_measurement) / dt if dt > 0 else np.zeros(self.n_members)
+
+        raw = p_term + self._i_term + d_term
+        output = np.clip(raw, *self.output_limits)
+        if self.anti_windup:
+            self._i_term = np.where(output != raw, output - p_term - d_term, self._i_term)
+
+        self._last_measurement = np.array(measurement, dtype=float)
+        self._last_time = current_time
+        self._last_output = output
+        return output
+
+    def reset(self):
+        """Reset every controller's internal state."""
+        super().reset()
+        self._last_measurement = np.zeros(self.n_members)
+        self._i_term = np.zeros(self.n_members)
+
+
+@dataclass
+class EnsembleResult:
+    """``(K, n_steps)`` trajectories of a closed-loop ensemble run."""
+
+    times: np.ndarray
+    temperature: np.ndarray  # true plant temperature
+    measurement: np.ndarray  # what the controller saw
+    output: np.ndarray  # controller output
+
+    def metrics(self, setpoint, band=0.05, tail=100):
+        """Per-member summary metrics of the measured trajectories (see :func:`ensemble_metrics`)."""
+        return ensemble_metrics(self.times, self.measurement, setpoint, band=band, tail=tail)
+
+
+def simulate_ensemble(thermal, pid, n_steps, dt=0.1, sensors=None, disturbance=None,
+                      dtype=np.float64):
+    """
+    Run K closed loops in lockstep: plant update, sensor read, PID, actuation.
+
+    Each step mirrors the scalar loop in ``PIDTestScenario``: the thermal model
+    advances, the sensor tracks the new temperature, and the controller output
+    is applied as the cooling power multiplier.
+
+    Args:
+        thermal (ThermalModelArray): Plants, advanced in place
+        pid (PIDArray): Controllers, advanced in place
+        n_steps (int): Number of time steps
+        dt (float): Time step in seconds
+        sensors (SensorBank): Sensors whose ``base_temp`` follows the plant
+            (with lag and noise); None measures the plant temperature directly
+        disturbance (callable): Optional ``disturbance(step, thermal)`` hook
+            called before each plant update, e.g. to step the heat leak
+        dtype: Storage dtype of the recorded trajectories
+
+    Returns:
+        EnsembleResult: Trajectories of shape ``(K, n_steps)``
+    """
+    k = thermal.n_members
+    if pid.n_members != k or (sensors is not None and len(sensors) != k):
+        raise ValueError("thermal, pid and sensors must have the same number of members")
+
+    # Time-major storage so each step writes one contiguous row.
+    temperature = np.empty((n_steps, k), dtype=dtype)
+    measurement = np.empty((n_steps, k), dtype=dtype)
+    output = np.empty((n_steps, k), dtype=dtype)
+    times = np.arange(n_steps) * dt
+
+    for step in range(n_steps):
+        t = times[step]
+        if disturbance is not None:
+            disturbance(step, thermal)
+        temp = thermal.update(dt)
+        if sensors is not None:
+            sensors.base_temp = temp
+            reading, valid = sensors.read(current_time=t)
+            if not valid.all():
+                # Hold the last good value for sensors that dropped out.
+                reading = np.where(valid, reading, measurement[step - 1] if step else temp)
+                sensors.reset(~valid)
+        else:
+            reading = temp
+        out = pid.update(reading, current_time=t)
+        thermal.set_cooling_power(out)
+
+        temperature[step] = temp
+        measurement[step] = reading
+        output[step] = out
+
+    return EnsembleResult(times=times, temperature=temperature.T, measurement=measurement.T, output=output.T)
+
+
+def ensemble_metrics(times, temps, setpoint, band=0.05, tail=100):
+    """
+    Vectorized closed-loop metrics for a ``(K, n_steps)`` trajectory block.
+
+    Args:
+        times (np.ndarray): Time axis, shape ``(n_steps,)``
+        temps (np.ndarray): Temperatures, shape ``(K, n_steps)``
+        setpoint (float or np.ndarray): Target temperature (scalar or ``(K,)``)
+        band (float): Settling band as a fraction of the setpoint
+        tail (int): Number of final samples treated as steady state
+
+    Returns:
+        dict: ``(K,)`` arrays ``settling_time`` (first time after which the
+        trajectory stays within the band; NaN if it ends outside),
+        ``overshoot`` (peak minus setpoint), ``steady_state_error`` (mean of
+        the tail minus setpoint) and ``stability`` (std of the tail).
+    """
+    temps = np.atleast_2d(temps)
+    setpoint = np.broadcast_to(np.asarray(setpoint, dtype=float), temps.shape[:1])[:, None]
+    outside = np.abs(temps - setpoint) > band * setpoint
+    n_steps = temps.shape[1]
+    # Index of the last out-of-band sample (-1 if always inside).
+    last_out = n_steps - 1 - np.argmax(outside[:, ::-1], axis=1)
+    last_out = np.where(outside.any(axis=1), last_out, -1)
+    settled = last_out < n_steps - 1
+    settling_time = np.where(settled, np.asarray(times)[np.minimum(last_out + 1, n_steps - 1)], np.nan)
+
+    steady = temps[:, -tail:]
+    return {
+        'settling_time': settling_time,
+        'overshoot': temps.max(axis=1) - setpoint[:, 0],
+        'steady_state_error': steady.mean(axis=1) - setpoint[:, 0],
+        'stability': steady.std(axis=1),
+    }
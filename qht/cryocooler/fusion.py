@@ -0,0 +1,107 @@
+"""Kalman-filter fusion of redundant temperature sensors.
+
+The control loop used to feed the PID the arithmetic mean of whatever
+sensors answered, so a dropout shifted the mean by that sensor's offset and
+the periodic terms of :meth:`Sensor.read` reached the controller unfiltered.
+:class:`KalmanFusion` instead combines the N readings by inverse-variance
+weighting (one masked dot product, so the Python-level cost per step does not
+grow with N) and tracks the temperature with a scalar random-walk Kalman
+filter. The gain for the full sensor set is the precomputed steady-state
+solution of the scalar Riccati equation; dropouts raise the effective
+measurement variance for that step and the covariance relaxes back to the
+steady state once the sensors return.
+"""
+
+import numpy as np
+
+
+def steady_state_gain(process_variance, measurement_variance):
+    """
+    Steady-state gain and posterior variance of a scalar random-walk filter.
+
+    Args:
+        process_variance (float): Variance q added to the state per step
+        measurement_variance (float): Variance r of each measurement
+
+    Returns:
+        tuple: ``(gain, variance)`` fixed point of ``P = (P + q) r / (P + q + r)``
+    """
+    q, r = process_variance, measurement_variance
+    predicted = 0.5 * (q + np.sqrt(q * q + 4.0 * q * r))
+    gain = predicted / (predicted + r)
+    return gain, (1.0 - gain) * predicted
+
+
+class KalmanFusion:
+    """Fuses N temperature sensors into one filtered estimate and its variance."""
+
+    def __init__(self, noise_variances, process_variance=1e-6, common_variance=0.0):
+        """
+        Initialize the filter.
+
+        Args:
+            noise_variances (sequence of float): Independent noise variance of
+                each sensor in K^2
+            process_variance (float): Variance in K^2 by which the true
+                temperature may wander per update
+            common_variance (float): Variance in K^2 of disturbances shared
+                by all sensors (e.g. the periodic terms of ``Sensor.read``),
+                which averaging over sensors cannot remove
+        """
+        self.weights = 1.0 / np.asarray(noise_variances, dtype=float)
+        self.n_sensors = len(self.weights)
+        self.process_variance = process_variance
+        self.common_variance = common_variance
+        self.full_weight = float(self.weights.sum())
+        self.steady_gain, self.steady_variance = steady_state_gain(
+            process_variance, 1.0 / self.full_weight + common_variance
+        )
+        self.reset()
+
+    def reset(self):
+        """Forget the estimate; the next update starts from the measurement."""
+        self.estimate = None
+        self.variance = np.inf
+        self.gain = 1.0
+
+    def update(self, readings, valid=None):
+        """
+        Fuse one set of readings.
+
+        Args:
+            readings (np.ndarray): One reading per sensor in Kelvin; entries
+                that are not ``valid`` (NaN by default) are ignored
+            valid (np.ndarray): Boolean mask of sensors that produced a reading
+
+        Returns:
+            tuple: ``(estimate, variance)`` of the temperature in K and K^2;
+            with no valid reading the filter only predicts
+        """
+        readings = np.asarray(readings, dtype=float)
+        if valid is None:
+            valid = np.isfinite(readings)
+        weights = np.where(valid, self.weights, 0.0)
+        weight = weights.sum()
+        if weight == 0.0:
+            self.variance += self.process_variance
+            return self.estimate, self.variance
+
+        measurement = np.dot(weights, np.where(valid, readings, 0.0)) / weight
+        measurement_variance = 1.0 / weight + self.common_variance
+        if self.estimate is None:
+            # Start at the steady-state covariance so a full sensor set runs
+            # at the precomputed gain from the first step.
+            self.estimate = measurement
+            self.variance = self.steady_variance if weight == self.full_weight else measurement_variance
+            return self.estimate, self.variance
+
+        if weight == self.full_weight and abs(self.variance - self.steady_variance) <= 1e-9 * self.steady_variance:
+            # Full sensor set at (or relaxed back to) steady state.
+            self.gain = self.steady_gain
+            self.variance = self.steady_variance
+        else:
+            predicted = self.variance + self.process_variance
+            self.gain = predicted / (predicted + measurement_variance)
+            self.variance = (1.0 - self.gain) * predicted
+        self.estimate += self.gain * (measurement - self.estimate)
+        return self.estimate, self.variance
@@ -0,0 +1,136 @@
+"""Streaming test metrics for the cryocooler control loop.
+
+:class:`OnlineMetrics` maintains the ``CryocoolerTest.test_results`` metrics
+incrementally, in O(1) time and O(window) memory per step, so they are
+available at any point of a run (e.g. for a live dashboard) and cover the
+whole run even when the telemetry is kept in a ring buffer. With the default
+``hold_time=0`` its results match :meth:`CryocoolerTest.calculate_metrics`
+on the same samples.
+"""
+
+import numpy as np
+
+METRIC_NAMES = ('stability', 'cooling_rate', 'overshoot', 'settling_time', 'temperature_variance')
+
+
+class OnlineMetrics:
+    """Incremental stability, cooling rate, overshoot, settling time and variance."""
+
+    def __init__(self, setpoint, window=100, band=0.05, hold_time=0.0):
+        """
+        Initialize the accumulator.
+
+        Args:
+            setpoint (float): Temperature setpoint in Kelvin
+            window (int): Number of most recent samples in the stability window
+            band (float): Settling band as a fraction of the setpoint
+            hold_time (float): Time in seconds the temperature must stay in
+                the band before the first in-band sample counts as settled
+        """
+        self.setpoint = setpoint
+        self.window = int(window)
+        self.band = band
+        self.hold_time = hold_time
+        self._buffer = np.empty(self.window)
+        self.reset()
+
+    def reset(self):
+        """Forget all samples."""
+        self.count = 0
+        self.first_time = self.first_temp = None
+        self.last_time = self.last_temp = None
+        self.max_temp = -np.inf
+        # Welford accumulators over the whole run and over the window.
+        self._mean = self._m2 = 0.0
+        self._w_mean = self._w_m2 = 0.0
+        self._w_pos = 0
+        # Start of the current in-band stretch, and the settling time once locked.
+        self._band_start = None
+        self.settling_time = None
+
+    def update(self, elapsed_time, temperature):
+        """
+        Add one sample.
+
+        Args:
+            elapsed_time (float): Simulation time in seconds
+            temperature (float): Temperature in Kelvin
+        """
+        x = float(temperature)
+        self.count += 1
+        if self.first_time is None:
+            self.first_time, self.first_temp = elapsed_time, x
+        self.last_time, self.last_temp = elapsed_time, x
+        if x > self.max_temp:
+            self.max_temp = x
+
+        delta = x - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (x - self._mean)
+
+        if self.count <= self.window:
+            w_delta = x - self._w_mean
+            self._w_mean += w_delta / self.count
+            self._w_m2 += w_delta * (x - self._w_mean)
+        else:
+            # Slide the window: replace the oldest sample by x.
+            old = self._buffer[self._w_pos]
+            old_mean = self._w_mean
+            self._w_mean += (x - old) / self.window
+            self._w_m2 += (x - old) * (x - self._w_mean + old - old_mean)
+        self._buffer[self._w_pos] = x
+        self._w_pos = (self._w_pos + 1) % self.window
+        if self._w_pos == 0 and self.count > self.window:
+            # Once per window, recompute exactly so rounding in the sliding
+            # update cannot accumulate over long soaks (amortized O(1)).
+            self._w_mean = self._buffer.mean()
+            self._w_m2 = float(np.sum((self._buffer - self._w_mean) ** 2))
+
+        if self.settling_time is None:
+            if abs(x - self.setpoint) <= self.setpoint * self.band:
+                if self._band_start is None:
+                    self._band_start = elapsed_time
+                if elapsed_time - self._band_start >= self.hold_time:
+                    self.settling_time = self._band_start
+            else:
+                self._band_start = None
+
+    @property
+    def mean(self):
+        return self._mean if self.count else np.nan
+
+    @property
+    def variance(self):
+        """Population variance of every sample so far."""
+        return self._m2 / self.count if self.count else np.nan
+
+    @property
+    def stability(self):
+        """Standard deviation of the last ``window`` samples."""
+        n = min(self.count, self.window)
+        return np.sqrt(max(self._w_m2, 0.0) / n) if n else np.nan
+
+    @property
+    def cooling_rate(self):
+        """Average cooling rate in K/min since the first sample (None before two)."""
+        if self.count < 2 or self.last_time == self.first_time:
+            return None
+        return (self.first_temp - self.last_temp) / ((self.last_time - self.first_time) / 60)
+
+    def results(self):
+        """
+        Current metric values.
+
+        Returns:
+            dict: The ``CryocoolerTest.test_results`` keys; ``settling_time``
+            and ``cooling_rate`` are None until they are defined
+        """
+        if not self.count:
+            return dict.fromkeys(METRIC_NAMES)
+        return {
+            'stability': self.stability,
+            'cooling_rate': self.cooling_rate,
+            'overshoot': self.max_temp - self.setpoint,
+            'settling_time': self.settling_time,
+            'temperature_variance': self.variance,
+        }
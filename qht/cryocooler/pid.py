@@ -1,6 +1,7 @@
 import time
+from bisect import bisect_right
 import numpy as np
-from typing import Tuple, Optional
+from typing import Sequence, Tuple, Optional
 
 class PID:
     """Industrial-grade PID controller with anti-windup and bumpless transfer."""
@@ -104,4 +105,122 @@ class PID:
         
     def set_setpoint(self, setpoint: float):
         """Update the target setpoint."""
-        self.setpoint = setpoint 
\ No newline at end of file
+        self.setpoint = setpoint 
+
+
+class GainScheduledPID:
+    """PID controller whose gains are interpolated from a breakpoint table.
+
+    Gains are a piecewise-linear function of ``|setpoint - measurement|``:
+    row ``i`` of ``gains`` applies at ``breakpoints[i]``, values in between are
+    interpolated and values beyond either end are held. The table is
+    precomputed into plain Python lists, so :meth:`update` does no NumPy calls
+    or allocations beyond float arithmetic.
+
+    The integrator accumulates the *integral term* ``ki * e * dt`` rather than
+    the raw error integral, so a change of ``ki`` between steps does not step
+    the output (bumpless transfer). One instance keeps its state for the whole
+    run.
+    """
+
+    def __init__(self, breakpoints: Sequence[float], gains: Sequence[Sequence[float]],
+                 setpoint: float, output_limits: Tuple[float, float] = (0, 100),
+                 sample_time: Optional[float] = None, anti_windup: bool = True):
+        """
+        Initialize the controller.
+
+        Args:
+            breakpoints (sequence): Increasing |error| values of the table rows
+            gains (sequence): One (kp, ki, kd) row per breakpoint
+            setpoint (float): Target value
+            output_limits (tuple): Min and max output limits
+            sample_time (float): Fixed sample time (None for variable)
+            anti_windup (bool): Enable anti-windup protection
+        """
+        bp = [float(b) for b in breakpoints]
+        rows = [tuple(float(g) for g in row) for row in gains]
+        if len(bp) == 0 or len(rows) != len(bp) or any(len(r) != 3 for r in rows):
+            raise ValueError("need one (kp, ki, kd) row per breakpoint")
+        if any(b1 <= b0 for b0, b1 in zip(bp, bp[1:])):
+            raise ValueError("breakpoints must be strictly increasing")
+        self._bp = bp
+        self._rows = rows
+        # Per-segment slopes d(gain)/d|error| for the interpolation.
+        self._slopes = [
+            tuple((g1 - g0) / (b1 - b0) for g0, g1 in zip(r0, r1))
+            for b0, b1, r0, r1 in zip(bp, bp[1:], rows, rows[1:])
+        ]
+        self.setpoint = setpoint
+        self.output_limits = output_limits
+        self.sample_time = sample_time
+        self.anti_windup = anti_windup
+        self.reset()
+
+    def gains(self, abs_error: float) -> Tuple[float, float, float]:
+        """Interpolated (kp, ki, kd) at ``|error| = abs_error``."""
+        bp = self._bp
+        if abs_error <= bp[0]:
+            return self._rows[0]
+        if abs_error >= bp[-1]:
+            return self._rows[-1]
+        i = bisect_right(bp, abs_error) - 1
+        x = abs_error - bp[i]
+        (kp, ki, kd), (skp, ski, skd) = self._rows[i], self._slopes[i]
+        return kp + skp * x, ki + ski * x, kd + skd * x
+
+    def update(self, measurement: float, current_time: Optional[float] = None) -> float:
+        """
+        Update the controller.
+
+        Args:
+            measurement (float): Process variable measurement
+            current_time (float): Current time (None for automatic)
+
+        Returns:
+            float: Controller output
+        """
+        if current_time is None:
+            current_time = time.time()
+
+        if self._last_time is None:
+            self._last_time = current_time
+            self._last_measurement = measurement
+            return 0.0
+
+        dt = current_time - self._last_time
+        if self.sample_time is not None:
+            if dt < self.sample_time:
+                return self._last_output
+            dt = self.sample_time
+
+        error = self.setpoint - measurement
+        kp, ki, kd = self.gains(error if error >= 0 else -error)
+
+        p_term = kp * error
+        self._i_term += ki * error * dt
+        # Derivative on measurement to avoid derivative kick
+        d_term = -kd * (measurement - self._last_measurement) / dt if dt > 0 else 0.0
+
+        raw = p_term + self._i_term + d_term
+        lo, hi = self.output_limits
+        output = lo if raw < lo else hi if raw > hi else raw
+
+        # Anti-windup: hold the integral term at the value that saturates
+        if self.anti_windup and output != raw:
+            self._i_term = output - p_term - d_term
+
+        self._last_measurement = measurement
+        self._last_time = current_time
+        self._last_output = output
+        return output
+
+    def reset(self):
+        """Reset the controller's internal state."""
+        self._last_time = None
+        self._last_measurement = 0.0
+        self._i_term = 0.0
+        self._last_output = 0.0
+
+    def set_setpoint(self, setpoint: float):
+        """Update the target setpoint."""
+        self.setpoint = setpoint
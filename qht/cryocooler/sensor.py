@@ -80,4 +80,84 @@ class Sensor:
         self.failed = False
         self.last_reading = self.base_temp
         self.last_read_time = 0.0
-        self.start_time = 0.0 
\ No newline at end of file
+        self.start_time = 0.0 
+
+class SensorBank:
+    """Array-backed bank of N simulated temperature sensors.
+
+    Same physics as :class:`Sensor` (drift, periodic terms, Gaussian noise and
+    first-order thermal inertia), but the state of every sensor lives in NumPy
+    arrays and one :meth:`read` call updates the whole bank. Noise and failures
+    are drawn from a per-bank ``numpy.random.Generator``, and failures are
+    reported through a validity mask instead of exceptions.
+    """
+
+    def __init__(self, n_sensors, base_temp=4.0, noise_level=0.01, drift_rate=0.0002,
+                 response_time=0.1, fail_rate=0.001, seed=None):
+        """
+        Initialize the bank.
+
+        Args:
+            n_sensors (int): Number of sensors
+            base_temp, noise_level, drift_rate, response_time, fail_rate:
+                As for :class:`Sensor`; scalars or per-sensor arrays
+            seed (int or numpy.random.Generator): Seed for the bank's generator
+        """
+        self.n_sensors = int(n_sensors)
+        shape = (self.n_sensors,)
+        self.ids = np.arange(self.n_sensors)
+        self.base_temp = np.broadcast_to(np.asarray(base_temp, dtype=float), shape).copy()
+        self.noise_level = np.broadcast_to(np.asarray(noise_level, dtype=float), shape).copy()
+        self.drift_rate = np.broadcast_to(np.asarray(drift_rate, dtype=float), shape).copy()
+        self.response_time = np.broadcast_to(np.asarray(response_time, dtype=float), shape).copy()
+        self.fail_rate = np.broadcast_to(np.asarray(fail_rate, dtype=float), shape).copy()
+        self.rng = np.random.default_rng(seed)
+
+        self.failed = np.zeros(shape, dtype=bool)
+        self.last_reading = self.base_temp + self.rng.uniform(-0.05, 0.05, shape)
+        self.last_read_time = np.zeros(shape)
+        self.start_time = time.time()
+
+    def __len__(self):
+        return self.n_sensors
+
+    def read(self, current_time=None):
+        """
+        Read every sensor at once.
+
+        Args:
+            current_time (float): Current simulation time in seconds
+
+        Returns:
+            tuple: ``(readings, valid)`` -- temperatures in Kelvin (NaN where
+            invalid) and a boolean mask of the sensors that produced a reading.
+            A sensor that fails on this read, or is still in a failed state,
+            is invalid until :meth:`reset`.
+        """
+        if current_time is None:
+            current_time = time.time() - self.start_time
+
+        self.failed |= self.rng.random(self.n_sensors) < self.fail_rate
+        valid = ~self.failed
+
+        drift = self.drift_rate * (current_time / 3600)
+        noise = self.rng.normal(0.0, self.noise_level)
+        # Periodic terms are common to every sensor: evaluate them once.
+        periodic = (0.02 * np.sin(2 * np.pi * current_time / 5)
+                    + 0.01 * np.sin(2 * np.pi * current_time / 30))
+
+        dt = current_time - self.last_read_time
+        alpha = -np.expm1(-dt / self.response_time)
+        target_temp = self.base_temp + drift + noise + periodic
+        new_temp = self.last_reading + alpha * (target_temp - self.last_reading)
+
+        self.last_reading = np.where(valid, new_temp, self.last_reading)
+        self.last_read_time = np.where(valid, current_time, self.last_read_time)
+        return np.where(valid, new_temp, np.nan), valid
+
+    def reset(self, mask=None):
+        """Reset failed sensors (or only those selected by ``mask``)."""
+        mask = self.failed.copy() if mask is None else np.asarray(mask, dtype=bool) & self.failed
+        self.failed[mask] = False
+        self.last_reading[mask] = self.base_temp[mask]
+        self.last_read_time[mask] = 0.0
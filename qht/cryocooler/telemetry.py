@@ -0,0 +1,117 @@
+import numpy as np
+from datetime import datetime
+
+BASE_COLUMNS = ('elapsed_time', 'avg_temp', 'pid_output')
+
+
+class TelemetryBuffer:
+    """Columnar, preallocated store for per-step cryocooler telemetry.
+
+    Rows hold the elapsed simulation time, the average temperature, the PID
+    output, any ``extra_columns`` and one reading per sensor (NaN where a
+    sensor returned nothing).
+    Data live in a single ``(n_columns, capacity)`` float64 block, so each
+    column is a contiguous view and :meth:`to_dataframe` wraps the block
+    without copying.
+
+    In the default growable mode the capacity doubles when it runs out. In
+    ring mode the buffer keeps only the most recent ``capacity`` rows: every
+    row is written twice, ``capacity`` columns apart, so the retained window
+    is always one contiguous slice and stays zero-copy after wrapping.
+
+    Views returned by :meth:`column`, :meth:`to_numpy` or :meth:`to_dataframe`
+    share memory with the buffer; they are invalidated by a later append that
+    grows the storage (growable mode) or overwrites old rows (ring mode).
+    """
+
+    def __init__(self, n_sensors, capacity=4096, ring=False, extra_columns=()):
+        """
+        Initialize the buffer.
+
+        Args:
+            n_sensors (int): Number of per-sensor columns
+            capacity (int): Initial number of rows (the window size in ring mode)
+            ring (bool): Keep only the most recent ``capacity`` rows
+            extra_columns (sequence of str): Additional scalar columns, stored
+                between the base columns and the sensor columns
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.n_sensors = int(n_sensors)
+        self.capacity = int(capacity)
+        self.ring = ring
+        self.extra_columns = tuple(extra_columns)
+        self._sensor_start = len(BASE_COLUMNS) + len(self.extra_columns)
+        self.columns = (BASE_COLUMNS + self.extra_columns
+                        + tuple(f'sensor_{i}' for i in range(self.n_sensors)))
+        self._index = {name: i for i, name in enumerate(self.columns)}
+        width = 2 * self.capacity if ring else self.capacity
+        self._data = np.full((len(self.columns), width), np.nan)
+        self.total_rows = 0  # rows ever appended (exceeds len(self) once a ring wraps)
+        self.started_at = datetime.now()
+
+    def __len__(self):
+        return min(self.total_rows, self.capacity) if self.ring else self.total_rows
+
+    def append(self, elapsed_time, avg_temp, pid_output, sensor_readings, extra=()):
+        """
+        Append one row.
+
+        Args:
+            elapsed_time (float): Simulation time in seconds
+            avg_temp (float): Average temperature in Kelvin
+            pid_output (float): Controller output
+            sensor_readings (sequence of float): One reading per sensor, NaN if missing
+            extra (sequence of float): One value per extra column
+        """
+        if self.ring:
+            pos = self.total_rows % self.capacity
+            cols = slice(pos, pos + self.capacity + 1, self.capacity)
+        else:
+            if self.total_rows == self.capacity:
+                self._grow()
+            cols = slice(self.total_rows, self.total_rows + 1)
+        target = self._data[:, cols]
+        target[:3] = np.array([[elapsed_time], [avg_temp], [pid_output]])
+        if self.extra_columns:
+            target[3:self._sensor_start] = np.reshape(np.asarray(extra, dtype=float), (-1, 1))
+        target[self._sensor_start:] = np.reshape(np.asarray(sensor_readings, dtype=float), (self.n_sensors, 1))
+        self.total_rows += 1
+
+    def _grow(self):
+        data = np.full((len(self.columns), 2 * self.capacity), np.nan)
+        data[:, :self.capacity] = self._data
+        self._data = data
+        self.capacity *= 2
+
+    def _window(self):
+        if self.ring and self.total_rows > self.capacity:
+            start = self.total_rows % self.capacity
+            return slice(start, start + self.capacity)
+        return slice(0, len(self))
+
+    def column(self, name):
+        """Return a view of one column in time order."""
+        return self._data[self._index[name], self._window()]
+
+    __getitem__ = column
+
+    @property
+    def sensor_readings(self):
+        """``(n_rows, n_sensors)`` view of the per-sensor columns."""
+        return self._data[self._sensor_start:, self._window()].T
+
+    def to_numpy(self):
+        """``(n_columns, n_rows)`` view of the whole retained table."""
+        return self._data[:, self._window()]
+
+    def to_dataframe(self):
+        """Wrap the retained rows in a :class:`pandas.DataFrame` without copying."""
+        import pandas as pd
+
+        return pd.DataFrame(self.to_numpy().T, columns=list(self.columns), copy=False)
+
+    def clear(self):
+        """Drop all rows, keeping the allocated storage."""
+        self.total_rows = 0
+        self._data.fill(np.nan)
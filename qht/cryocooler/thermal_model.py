@@ -34,21 +34,8 @@ class ThermalModel:
         Returns:
             float: New temperature in Kelvin
         """
-        # Temperature-dependent heat transfer coefficient
-        # Increases with temperature difference to model convection
-        temp_diff = self.ambient_temp - self.temperature
-        heat_transfer_coef = self.heat_leak_coefficient * (1 + 0.01 * abs(temp_diff))
-        
-        # Calculate heat flows
-        heat_leak = heat_transfer_coef * temp_diff
-        
-        # Temperature-dependent cooling efficiency
-        # Cooling power decreases as temperature approaches minimum
-        cooling_efficiency = 1.0 - (self.temperature - self.min_temp) / (self.ambient_temp - self.min_temp)
-        cooling = self.cooling_power * self.cooling_power_multiplier * max(0, cooling_efficiency)
-        
         # Calculate temperature change with stability limits
-        dT = (heat_leak - cooling) * dt / self.thermal_mass
+        dT = self.derivative(self.temperature) * dt
         
         # Limit temperature change for stability
         max_dT = 0.1  # Maximum temperature change per step
@@ -59,6 +46,35 @@ class ThermalModel:
         
         return self.temperature
     
+    def derivative(self, temperature, multiplier=None):
+        """
+        Continuous-time rate of change dT/dt of the lumped model.
+
+        Args:
+            temperature (float): Temperature in Kelvin
+            multiplier (float): Cooling power multiplier (default: the current one)
+
+        Returns:
+            float: dT/dt in K/s, before the per-step stability clamp
+        """
+        if multiplier is None:
+            multiplier = self.cooling_power_multiplier
+
+        # Temperature-dependent heat transfer coefficient
+        # Increases with temperature difference to model convection
+        temp_diff = self.ambient_temp - temperature
+        heat_transfer_coef = self.heat_leak_coefficient * (1 + 0.01 * abs(temp_diff))
+        
+        # Calculate heat flows
+        heat_leak = heat_transfer_coef * temp_diff
+        
+        # Temperature-dependent cooling efficiency
+        # Cooling power decreases as temperature approaches minimum
+        cooling_efficiency = 1.0 - (temperature - self.min_temp) / (self.ambient_temp - self.min_temp)
+        cooling = self.cooling_power * multiplier * max(0, cooling_efficiency)
+        
+        return (heat_leak - cooling) / self.thermal_mass
+
     def set_cooling_power(self, multiplier):
         """
         Set cooling power multiplier (controlled by PID).
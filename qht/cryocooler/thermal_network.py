@@ -0,0 +1,286 @@
+"""Multi-stage lumped thermal network of a dilution refrigerator.
+
+:class:`ThermalNetwork` generalizes :class:`~qht.cryocooler.thermal_model.ThermalModel`
+from one mass against ambient to N stages (50 K, 4 K, still, cold plate,
+mixing chamber, ...) joined by conductive links. Each stage has a heat
+capacity, a cooler modelled as a conductance to its base temperature (scaled
+by the same rate-limited ``cooling_power_multiplier`` as ``ThermalModel``), a
+constant parasitic load and a heater that a per-stage PID loop can drive.
+
+Heat capacities and link conductances may follow power laws in temperature
+(``C = c T**a``, ``G = g T_mean**n``); they are evaluated for all stages and
+links at once every step. :meth:`ThermalNetwork.update` takes a linearly
+implicit (backward Euler) step, solving the sparse system
+``(C + dt J) dT = dt q(T)`` where ``J`` is the conductance matrix. The sparse
+LU factorization of that matrix is reused until ``dt``, a cooler multiplier
+or a temperature-dependent parameter has moved by more than ``refactor_tol``;
+since the right-hand side is always the current net heat flow, a slightly
+stale factorization only affects the transient, never the steady state.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+AMBIENT = 'ambient'
+
+
+@dataclass
+class Stage:
+    """One thermal stage (node) of the network."""
+
+    name: str
+    heat_capacity: float  # J/K, or the prefactor c of C = c T**a
+    initial_temp: float  # K
+    cooler_conductance: float = 0.0  # W/K from the stage to its cooler
+    base_temp: float = 0.0  # K, temperature the cooler pulls towards
+    heat_load: float = 0.0  # W, constant parasitic load
+    capacity_exponent: float = 0.0  # a in C = c T**a
+
+
+@dataclass
+class Link:
+    """Conductive link between two stages, or a stage and ambient."""
+
+    a: str
+    b: str  # a stage name or AMBIENT
+    conductance: float  # W/K, or the prefactor g of G = g T_mean**n
+    exponent: float = 0.0  # n in G = g T_mean**n
+
+
+class ThermalNetwork:
+    """Simulates the coupled thermal behavior of a multi-stage cryostat."""
+
+    def __init__(self, stages, links, ambient_temp=300.0, refactor_tol=0.01):
+        """
+        Initialize the network.
+
+        Args:
+            stages (list of Stage): Stages, in node order
+            links (list of Link): Conductive links; ``b=AMBIENT`` links a
+                stage to the ambient bath
+            ambient_temp (float): Ambient temperature in Kelvin
+            refactor_tol (float): Relative change of any matrix parameter
+                (heat capacity, conductance, cooler strength) that forces a
+                new LU factorization
+        """
+        self.stages = list(stages)
+        self.names = [s.name for s in self.stages]
+        self._index = {name: i for i, name in enumerate(self.names)}
+        if len(self._index) != len(self.names):
+            raise ValueError("stage names must be unique")
+        self.ambient_temp = ambient_temp
+        self.refactor_tol = refactor_tol
+
+        as_array = lambda field: np.array([getattr(s, field) for s in self.stages], dtype=float)  # noqa: E731
+        self.temperature = as_array('initial_temp')
+        self.heat_capacity = as_array('heat_capacity')
+        self.capacity_exponent = as_array('capacity_exponent')
+        self.cooler_conductance = as_array('cooler_conductance')
+        self.base_temp = as_array('base_temp')
+        self.heat_load = as_array('heat_load')
+        self.cooling_power_multiplier = np.ones(self.n_stages)
+        self.heater_power = np.zeros(self.n_stages)
+
+        internal = [l for l in links if l.b != AMBIENT]
+        bath = [l for l in links if l.b == AMBIENT]
+        self._ia = np.array([self.index(l.a) for l in internal], dtype=int)
+        self._ib = np.array([self.index(l.b) for l in internal], dtype=int)
+        self._g = np.array([l.conductance for l in internal], dtype=float)
+        self._g_exp = np.array([l.exponent for l in internal], dtype=float)
+        self._bath = np.array([self.index(l.a) for l in bath], dtype=int)
+        self._bath_g = np.array([l.conductance for l in bath], dtype=float)
+        self._bath_exp = np.array([l.exponent for l in bath], dtype=float)
+
+        self._lu = None
+        self._factored = None  # (dt, parameter vector) of the current factorization
+        self.n_factorizations = 0
+
+    @classmethod
+    def dilution_refrigerator(cls, **kwargs):
+        """
+        A five-stage dilution refrigerator: 50 K and 4 K pulse-tube stages,
+        still, cold plate and mixing chamber, linked in a chain.
+
+        Args:
+            **kwargs: Passed to the constructor (``ambient_temp``, ``refactor_tol``)
+
+        Returns:
+            ThermalNetwork: The network, started in thermal equilibrium
+        """
+        stages = [
+            Stage('50K', heat_capacity=5000.0, initial_temp=45.0, cooler_conductance=20.0, base_temp=38.0),
+            Stage('4K', heat_capacity=500.0, initial_temp=3.2, cooler_conductance=2.0, base_temp=3.0),
+            Stage('still', heat_capacity=0.5, initial_temp=0.8, cooler_conductance=0.05,
+                  base_temp=0.75, capacity_exponent=1.0),
+            Stage('cold_plate', heat_capacity=0.05, initial_temp=0.1, cooler_conductance=0.01,
+                  base_temp=0.09, capacity_exponent=1.0),
+            Stage('mixing_chamber', heat_capacity=0.01, initial_temp=0.01, cooler_conductance=1e-3,
+                  base_temp=0.008, capacity_exponent=1.0),
+        ]
+        links = [
+            Link('50K', AMBIENT, 0.5),
+            Link('50K', '4K', 0.01),
+            Link('4K', 'still', 5e-5, exponent=1.0),
+            Link('still', 'cold_plate', 2e-5, exponent=1.0),
+            Link('cold_plate', 'mixing_chamber', 2e-5, exponent=1.0),
+        ]
+        net = cls(stages, links, **kwargs)
+        net.temperature = net.steady_state()
+        return net
+
+    @property
+    def n_stages(self):
+        return len(self.stages)
+
+    def index(self, stage):
+        """Node index of a stage given by name or index."""
+        if isinstance(stage, str):
+            try:
+                return self._index[stage]
+            except KeyError:
+                raise KeyError(f"Unknown stage {stage!r}; stages are {self.names}") from None
+        return int(stage)
+
+    def _parameters(self, temperature):
+        """Temperature-dependent capacities and conductances, vectorized."""
+        capacity = self.heat_capacity * temperature ** self.capacity_exponent
+        t_mean = 0.5 * (temperature[self._ia] + temperature[self._ib])
+        g = self._g * t_mean ** self._g_exp
+        bath_mean = 0.5 * (temperature[self._bath] + self.ambient_temp)
+        bath_g = self._bath_g * bath_mean ** self._bath_exp
+        return capacity, g, bath_g
+
+    def _per_stage(self, index, values):
+        """Sum per-link values onto their stages (float even with no links)."""
+        return np.bincount(index, values, self.n_stages).astype(float, copy=False)
+
+    def _net_heat(self, temperature, g, bath_g):
+        flow = g * (temperature[self._ia] - temperature[self._ib])  # a -> b
+        heat = self._per_stage(self._ib, flow) - self._per_stage(self._ia, flow)
+        heat += self._per_stage(self._bath, bath_g * (self.ambient_temp - temperature[self._bath]))
+        cooling = self.cooling_power_multiplier * self.cooler_conductance * (temperature - self.base_temp)
+        return heat + self.heat_load + self.heater_power - cooling
+
+    def net_heat(self, temperature=None):
+        """
+        Net heat flow into each stage.
+
+        Args:
+            temperature (np.ndarray): Stage temperatures (default: the current ones)
+
+        Returns:
+            np.ndarray: Heat flow in Watts per stage
+        """
+        temperature = self.temperature if temperature is None else np.asarray(temperature, dtype=float)
+        _, g, bath_g = self._parameters(temperature)
+        return self._net_heat(temperature, g, bath_g)
+
+    def derivative(self, temperature=None):
+        """
+        Continuous-time rate of change dT/dt of every stage.
+
+        Args:
+            temperature (np.ndarray): Stage temperatures (default: the current ones)
+
+        Returns:
+            np.ndarray: dT/dt in K/s
+        """
+        temperature = self.temperature if temperature is None else np.asarray(temperature, dtype=float)
+        capacity, g, bath_g = self._parameters(temperature)
+        return self._net_heat(temperature, g, bath_g) / capacity
+
+    def _conductance_matrix(self, g, bath_g, cooler):
+        """Sparse (CSC) conductance matrix J, so that ``q(T) = -J T + sources``."""
+        from scipy.sparse import coo_matrix
+
+        n = self.n_stages
+        diag = cooler + self._per_stage(self._bath, bath_g)
+        diag += self._per_stage(self._ia, g) + self._per_stage(self._ib, g)
+        rows = np.concatenate([np.arange(n), self._ia, self._ib])
+        cols = np.concatenate([np.arange(n), self._ib, self._ia])
+        return coo_matrix((np.concatenate([diag, -g, -g]), (rows, cols)), shape=(n, n)).tocsc()
+
+    def _factorize(self, dt, capacity, g, bath_g, cooler):
+        from scipy.sparse import diags
+        from scipy.sparse.linalg import splu
+
+        matrix = diags(capacity, format='csc') + dt * self._conductance_matrix(g, bath_g, cooler)
+        self._lu = splu(matrix.tocsc())
+        self.n_factorizations += 1
+
+    def update(self, dt):
+        """
+        Update the thermal state of every stage for one time step.
+
+        Args:
+            dt (float): Time step in seconds
+
+        Returns:
+            np.ndarray: New stage temperatures in Kelvin
+        """
+        temperature = self.temperature
+        capacity, g, bath_g = self._parameters(temperature)
+        cooler = self.cooling_power_multiplier * self.cooler_conductance
+
+        params = np.concatenate([capacity, g, bath_g, cooler])
+        if self._factored is None or self._factored[0] != dt or np.any(
+                np.abs(params - self._factored[1]) > self.refactor_tol * np.abs(self._factored[1])):
+            self._factorize(dt, capacity, g, bath_g, cooler)
+            self._factored = (dt, params)
+
+        delta = self._lu.solve(dt * self._net_heat(temperature, g, bath_g))
+        self.temperature = np.maximum(temperature + delta, 0.0)
+        return self.temperature
+
+    def steady_state(self, tol=1e-12, max_iter=200):
+        """
+        Equilibrium temperatures for the current multipliers, heaters and loads.
+
+        Args:
+            tol (float): Convergence tolerance on the temperature change in Kelvin
+            max_iter (int): Maximum fixed-point iterations
+
+        Returns:
+            np.ndarray: Stage temperatures in Kelvin (the state is not modified)
+        """
+        from scipy.sparse.linalg import spsolve
+
+        temperature = self.temperature.copy()
+        for _ in range(max_iter):
+            _, g, bath_g = self._parameters(temperature)
+            cooler = self.cooling_power_multiplier * self.cooler_conductance
+            matrix = self._conductance_matrix(g, bath_g, cooler)
+            rhs = (self.heat_load + self.heater_power + cooler * self.base_temp
+                   + self._per_stage(self._bath, bath_g * self.ambient_temp))
+            new = np.maximum(spsolve(matrix, rhs), 0.0)
+            if np.max(np.abs(new - temperature)) < tol:
+                return new
+            temperature = new
+        return temperature
+
+    def set_cooling_power(self, multiplier, stage=None):
+        """
+        Set cooler multipliers, rate-limited as in :meth:`ThermalModel.set_cooling_power`.
+
+        Args:
+            multiplier (float or np.ndarray): Cooling power multiplier (0 to 2)
+            stage (str or int): Stage to set (default: all stages)
+        """
+        idx = slice(None) if stage is None else self.index(stage)
+        max_change = 0.1
+        current = self.cooling_power_multiplier[idx]
+        step = np.clip(np.clip(multiplier, 0, 2) - current, -max_change, max_change)
+        self.cooling_power_multiplier[idx] = np.clip(current + step, 0, 2)
+
+    def set_heater_power(self, power, stage=None):
+        """
+        Set heater power; heaters only enter the right-hand side, so this
+        never triggers a refactorization.
+
+        Args:
+            power (float or np.ndarray): Heater power in Watts (negative values are clipped to 0)
+            stage (str or int): Stage to set (default: all stages)
+        """
+        idx = slice(None) if stage is None else self.index(stage)
+        self.heater_power[idx] = np.maximum(power, 0.0)
@@ -0,0 +1,212 @@
+"""Asyncio data acquisition with concurrent sensor reads.
+
+:class:`~qht.daq.daq_system.DAQ` reads sensors one after another, so with
+real instruments N slow queries serialize into N x latency per control tick.
+:class:`AsyncDAQ` issues every sensor query at once, bounds each with a
+timeout, retries failed or timed-out reads with jittered exponential backoff,
+and :meth:`AsyncDAQ.run` schedules control ticks against the wall clock so
+the loop holds its period regardless of how long a read takes.
+
+:class:`LatencySensor` is the local stand-in for an instrument link: it wraps
+a :class:`~qht.cryocooler.sensor.Sensor` and answers after a random network
+latency, or never (a hung query).
+"""
+
+import asyncio
+import inspect
+import math
+import random
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+
+class LatencySensor:
+    """A :class:`Sensor` behind a simulated slow, occasionally hanging link."""
+
+    def __init__(self, sensor, latency=0.05, jitter=0.1, hang_rate=0.0, seed=None):
+        """
+        Initialize the stand-in.
+
+        Args:
+            sensor (Sensor): Sensor whose ``read`` produces the values
+            latency (float): Mean query latency in seconds
+            jitter (float): Standard deviation of the latency as a fraction of it
+            hang_rate (float): Probability that a query never answers
+            seed (int): Seed for the latency and hang draws
+        """
+        self.sensor = sensor
+        self.id = sensor.id
+        self.latency = latency
+        self.jitter = jitter
+        self.hang_rate = hang_rate
+        self.rng = np.random.default_rng(seed)
+
+    async def read(self, current_time=None):
+        """Read the wrapped sensor after the simulated latency (or hang)."""
+        if self.rng.random() < self.hang_rate:
+            await asyncio.Event().wait()  # never set: the caller's timeout fires
+        delay = self.latency * (1.0 + self.jitter * self.rng.standard_normal())
+        await asyncio.sleep(max(delay, 0.0))
+        return self.sensor.read(current_time)
+
+    def reset(self):
+        self.sensor.reset()
+
+
+@dataclass
+class ScheduleReport:
+    """Timing of the control ticks run by :meth:`AsyncDAQ.run` (seconds from the first tick)."""
+
+    period: float
+    tick_times: np.ndarray  # wall-clock start of each tick
+    deadlines: np.ndarray  # nominal start of each tick
+    read_durations: np.ndarray  # time each read_all took
+    overruns: int  # deadlines skipped because a tick ran past them
+
+    @property
+    def lateness(self):
+        """Delay of each tick behind its deadline."""
+        return self.tick_times - self.deadlines
+
+    @property
+    def jitter(self):
+        """Standard deviation of the tick lateness."""
+        return float(np.std(self.lateness)) if len(self.tick_times) else 0.0
+
+    def summary(self):
+        """One-line timing summary."""
+        return (f"{len(self.tick_times)} ticks at {self.period * 1e3:.1f} ms: jitter "
+                f"{self.jitter * 1e3:.2f} ms, max lateness {np.max(self.lateness, initial=0.0) * 1e3:.2f} ms, "
+                f"mean read {np.mean(self.read_durations) * 1e3:.2f} ms, {self.overruns} overruns")
+
+
+class AsyncDAQ:
+    """Data acquisition that queries every sensor concurrently."""
+
+    def __init__(self, sensors, timeout=0.5, retries=2, backoff=0.02, backoff_jitter=0.5, seed=None):
+        """
+        Initialize the DAQ.
+
+        Args:
+            sensors (list): Sensors with an ``async read(current_time)``
+                (e.g. :class:`LatencySensor`); a failed read may raise
+                ``RuntimeError`` or ``ConnectionError``
+            timeout (float): Per-read timeout in seconds
+            retries (int): Extra attempts after a failed or timed-out read
+            backoff (float): Base retry delay in seconds, doubled per attempt
+            backoff_jitter (float): Retry delays are scaled by a uniform
+                factor in ``[1 - backoff_jitter, 1 + backoff_jitter]``
+            seed (int): Seed for the backoff jitter
+        """
+        self.sensors = sensors
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.backoff_jitter = backoff_jitter
+        self._rng = random.Random(seed)
+        self.connected = True
+        self.last_read_time = 0.0
+        # Which sensors contributed to the most recent read_all() result.
+        self.last_valid = np.ones(len(sensors), dtype=bool)
+        self.n_timeouts = 0
+        self.n_errors = 0
+        self.n_retries = 0
+
+    def _retry_delay(self, attempt):
+        spread = self._rng.uniform(1.0 - self.backoff_jitter, 1.0 + self.backoff_jitter)
+        return self.backoff * 2 ** attempt * spread
+
+    async def _read_one(self, sensor, current_time) -> Optional[float]:
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self.n_retries += 1
+                await asyncio.sleep(self._retry_delay(attempt - 1))
+            try:
+                return await asyncio.wait_for(sensor.read(current_time), self.timeout)
+            except asyncio.TimeoutError:
+                self.n_timeouts += 1
+            except (RuntimeError, ConnectionError) as e:
+                self.n_errors += 1
+                print(f"Sensor error: {e}")
+                if isinstance(e, RuntimeError) and hasattr(sensor, 'reset'):
+                    sensor.reset()
+        return None
+
+    async def read_all(self, current_time=None) -> List[float]:
+        """
+        Read all sensors concurrently.
+
+        Args:
+            current_time (float): Current time in seconds, passed to every sensor
+
+        Returns:
+            List[float]: Readings of the sensors that answered, in sensor
+            order; ``last_valid`` marks which ones
+
+        Raises:
+            ConnectionError: If the DAQ is disconnected
+        """
+        if not self.connected:
+            raise ConnectionError("DAQ is disconnected")
+        readings = await asyncio.gather(*(self._read_one(s, current_time) for s in self.sensors))
+        self.last_read_time = current_time
+        self.last_valid = np.array([r is not None for r in readings], dtype=bool)
+        return [r for r in readings if r is not None]
+
+    async def run(self, callback, period, n_ticks, clock=None, sleep=None):
+        """
+        Run ``n_ticks`` control ticks on a fixed wall-clock period.
+
+        Each tick reads all sensors and calls ``callback(elapsed, readings,
+        valid)`` (a plain function or a coroutine function). Deadlines are
+        absolute (``start + k * period``), so read and callback time does not
+        accumulate into drift; a tick that runs past the next deadline skips
+        the deadlines it missed instead of bursting to catch up.
+
+        Args:
+            callback (callable): Called once per tick with the elapsed time in
+                seconds, the list of readings and the validity mask
+            period (float): Control period in seconds
+            n_ticks (int): Number of ticks to run
+            clock (callable): Returns the current time in seconds (default:
+                the running event loop's ``time``)
+            sleep (callable): Coroutine function that waits a number of
+                seconds (default: ``asyncio.sleep``); inject both to run the
+                scheduler on a simulated clock
+
+        Returns:
+            ScheduleReport: Tick timing, read durations and overrun count
+        """
+        clock = clock or asyncio.get_running_loop().time
+        sleep = sleep or asyncio.sleep
+        start = clock()
+        ticks, deadlines, durations = [], [], []
+        overruns = 0
+        k = 0  # index of the current deadline, start + k * period
+        for _ in range(n_ticks):
+            now = clock()
+            ticks.append(now - start)
+            deadlines.append(k * period)
+            readings = await self.read_all(current_time=now - start)
+            durations.append(clock() - now)
+            result = callback(now - start, readings, self.last_valid.copy())
+            if inspect.isawaitable(result):
+                await result
+
+            k += 1
+            now = clock()
+            if now > start + k * period:
+                # Resume at the first deadline after now.
+                missed = math.floor((now - start) / period) + 1 - k
+                overruns += missed
+                k += missed
+            await sleep(start + k * period - now)
+        return ScheduleReport(period=period, tick_times=np.array(ticks), deadlines=np.array(deadlines),
+                              read_durations=np.array(durations), overruns=overruns)
+
+    def reconnect(self):
+        """Attempt to reconnect the DAQ system."""
+        self.connected = True
+        print("DAQ reconnected successfully")
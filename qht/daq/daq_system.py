@@ -1,18 +1,19 @@
 import time
 import random
 import numpy as np
-from typing import List
-from ..cryocooler.sensor import Sensor
+from typing import List, Union
+from ..cryocooler.sensor import Sensor, SensorBank
 
 class DAQ:
     """Data Acquisition system simulator with realistic network behavior."""
     
-    def __init__(self, sensors: List[Sensor], network_latency=0.1, packet_loss_rate=0.01):
+    def __init__(self, sensors: Union[List[Sensor], SensorBank], network_latency=0.1, packet_loss_rate=0.01):
         """
         Initialize the DAQ system.
         
         Args:
-            sensors (List[Sensor]): List of temperature sensors
+            sensors (List[Sensor] or SensorBank): Temperature sensors; a
+                SensorBank is read in one vectorized call
             network_latency (float): Simulated network latency in seconds
             packet_loss_rate (float): Probability of packet loss
         """
@@ -21,6 +22,8 @@ class DAQ:
         self.packet_loss_rate = packet_loss_rate
         self.connected = True
         self.last_read_time = 0.0
+        # Which sensors contributed to the most recent read_all() result.
+        self.last_valid = np.ones(len(sensors), dtype=bool)
         
     def read_all(self, current_time=None) -> List[float]:
         """
@@ -49,6 +52,9 @@ class DAQ:
         if random.random() < self.packet_loss_rate:
             raise ConnectionError("Network packet loss")
             
+        if isinstance(self.sensors, SensorBank):
+            return self._read_bank(current_time)
+
         readings = []
         for sensor in self.sensors:
             try:
@@ -61,8 +67,20 @@ class DAQ:
                 readings.append(None)
                 
         self.last_read_time = current_time
+        self.last_valid = np.array([r is not None for r in readings], dtype=bool)
         return [r for r in readings if r is not None]
     
+    def _read_bank(self, current_time) -> List[float]:
+        values, valid = self.sensors.read(current_time)
+        if not valid.all():
+            # Log sensor failures and try to recover, as for Sensor objects
+            for sensor_id in self.sensors.ids[~valid]:
+                print(f"Sensor error: Sensor {sensor_id} has failed")
+            self.sensors.reset(~valid)
+        self.last_read_time = current_time
+        self.last_valid = valid
+        return values[valid].tolist()
+
     def reconnect(self):
         """Attempt to reconnect the DAQ system."""
         # No need to sleep in simulation mode
@@ -13,68 +13,259 @@ trapped-ion hardware inside a dilution refrigerator:
 All simulators inject realistic readout shot noise (binomial sampling of N
 single-shot measurements per point), and all fitters report parameter
 uncertainties derived from the covariance matrix returned by
-``scipy.optimize.curve_fit`` (``perr = sqrt(diag(pcov))``).
+``scipy.optimize.curve_fit`` (``perr = sqrt(diag(pcov))``). Each fitter also
+has a ``*_batch`` variant that fits a whole ``(n_curves, n_points)`` block in
+lockstep with the vectorized Levenberg-Marquardt solver ``fit_curve_batch``,
+and each simulator a ``simulate_*_batch`` variant that takes per-qubit
+parameter vectors and returns a whole synthetic chip in one call.
 
 An optional QuTiP Lindblad-master-equation engine (``lindblad``) lets T1/T2
 emerge from open-system dynamics; it is imported lazily so the rest of the
 package works with only numpy/scipy installed.
+
+Submodules are loaded lazily (PEP 562): ``import qht.qubit`` only builds the
+name table below, and each public name imports its module -- and, for the
+fitters, ``scipy.optimize`` -- on first attribute access.
 """
 
-from .models import (
-    FitResult,
-    exp_decay,
-    ramsey_decay,
-    rabi_cosine,
-    fit_curve,
-)
-from .relaxation import simulate_t1, fit_t1, T1Result
-from .ramsey import simulate_ramsey, fit_ramsey, RamseyResult
-from .rabi import simulate_rabi, fit_rabi, RabiResult
-from .hahn_echo import simulate_hahn_echo, fit_hahn_echo
-from .readout import simulate_readout_iq, assignment_fidelity, ReadoutFidelityResult
-from .randomized_benchmarking import (
-    simulate_rb,
-    fit_rb,
-    RBResult,
-    epc_from_p,
-)
-from .fidelity import (
-    average_gate_fidelity_from_rb,
-    error_per_clifford_from_rb,
-    coherence_limit_error,
-    error_budget,
-    CoherenceLimit,
-    ErrorBudget,
-)
-
-__all__ = [
-    "FitResult",
-    "exp_decay",
-    "ramsey_decay",
-    "rabi_cosine",
-    "fit_curve",
-    "simulate_t1",
-    "fit_t1",
-    "T1Result",
-    "simulate_ramsey",
-    "fit_ramsey",
-    "RamseyResult",
-    "simulate_rabi",
-    "fit_rabi",
-    "RabiResult",
-    "simulate_hahn_echo",
-    "fit_hahn_echo",
-    "simulate_readout_iq",
-    "assignment_fidelity",
-    "ReadoutFidelityResult",
-    "simulate_rb",
-    "fit_rb",
-    "RBResult",
-    "epc_from_p",
-    "average_gate_fidelity_from_rb",
-    "error_per_clifford_from_rb",
-    "coherence_limit_error",
-    "error_budget",
-    "CoherenceLimit",
-    "ErrorBudget",
-]
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+# Submodule -> public names it defines: the single list behind ``__all__``,
+# the lazy ``_EXPORTS`` table and the ``TYPE_CHECKING`` imports below (a
+# test checks that those static imports match it).
+_SUBMODULE_EXPORTS = {
+    "models": (
+        "FitResult",
+        "BatchFitResult",
+        "exp_decay",
+        "ramsey_decay",
+        "rabi_cosine",
+        "fit_curve",
+        "fit_curve_batch",
+        "ModelSpec",
+        "SeparableForm",
+        "register_model",
+        "get_model_spec",
+        "qubit_rngs",
+    ),
+    "prony": (
+        "prony_decay",
+        "prony_fit",
+        "decay_guess",
+    ),
+    "template": (
+        "DecayTemplate",
+    ),
+    "relaxation": (
+        "simulate_t1",
+        "simulate_t1_stream",
+        "simulate_t1_batch",
+        "fit_t1",
+        "fit_t1_batch",
+        "t1_delays",
+        "T1Result",
+    ),
+    "ramsey": (
+        "ramsey_delays",
+        "simulate_ramsey",
+        "simulate_ramsey_stream",
+        "simulate_ramsey_batch",
+        "fit_ramsey",
+        "fit_ramsey_batch",
+        "RamseyResult",
+    ),
+    "rabi": (
+        "simulate_rabi",
+        "simulate_rabi_batch",
+        "fit_rabi",
+        "fit_rabi_batch",
+        "rabi_durations",
+        "RabiResult",
+    ),
+    "hahn_echo": (
+        "simulate_hahn_echo",
+        "simulate_hahn_echo_batch",
+        "fit_hahn_echo",
+        "fit_hahn_echo_batch",
+    ),
+    "streaming": (
+        "StreamingT1Estimator",
+        "StreamingRamseyEstimator",
+    ),
+    "planning": (
+        "fisher_information",
+        "predicted_errors",
+        "min_shots",
+    ),
+    "adaptive": (
+        "AdaptiveT1Design",
+        "AdaptiveRamseyDesign",
+        "simulated_measurement",
+    ),
+    "readout": (
+        "simulate_readout_iq",
+        "assignment_fidelity",
+        "ReadoutFidelityResult",
+    ),
+    "randomized_benchmarking": (
+        "simulate_rb",
+        "simulate_rb_gate_level",
+        "simulate_rb_2q",
+        "fit_rb",
+        "fit_rb_batch",
+        "RBResult",
+        "epc_from_p",
+    ),
+    "rb_modes": (
+        "simulate_interleaved_rb",
+        "fit_interleaved_rb",
+        "InterleavedRBResult",
+        "simulate_simultaneous_rb",
+    ),
+    "ptm": (
+        "depolarizing_ptm",
+        "rotation_ptm",
+        "amplitude_damping_ptm",
+    ),
+    "fidelity": (
+        "average_gate_fidelity_from_rb",
+        "error_per_clifford_from_rb",
+        "coherence_limit_error",
+        "error_budget",
+        "CoherenceLimit",
+        "ErrorBudget",
+    ),
+}
+
+# Public name -> submodule that defines it.
+_EXPORTS = {name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        # Submodules (``qht.qubit.relaxation``) stay reachable as attributes,
+        # as they were when the package imported them eagerly.
+        try:
+            value = importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    else:
+        value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # cache: later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:  # static analysers and IDEs see the eager imports; must mirror _SUBMODULE_EXPORTS
+    from .models import (
+        FitResult,
+        BatchFitResult,
+        exp_decay,
+        ramsey_decay,
+        rabi_cosine,
+        fit_curve,
+        fit_curve_batch,
+        ModelSpec,
+        SeparableForm,
+        register_model,
+        get_model_spec,
+        qubit_rngs,
+    )
+    from .prony import (
+        prony_decay,
+        prony_fit,
+        decay_guess,
+    )
+    from .template import (
+        DecayTemplate,
+    )
+    from .relaxation import (
+        simulate_t1,
+        simulate_t1_stream,
+        simulate_t1_batch,
+        fit_t1,
+        fit_t1_batch,
+        t1_delays,
+        T1Result,
+    )
+    from .ramsey import (
+        ramsey_delays,
+        simulate_ramsey,
+        simulate_ramsey_stream,
+        simulate_ramsey_batch,
+        fit_ramsey,
+        fit_ramsey_batch,
+        RamseyResult,
+    )
+    from .rabi import (
+        simulate_rabi,
+        simulate_rabi_batch,
+        fit_rabi,
+        fit_rabi_batch,
+        rabi_durations,
+        RabiResult,
+    )
+    from .hahn_echo import (
+        simulate_hahn_echo,
+        simulate_hahn_echo_batch,
+        fit_hahn_echo,
+        fit_hahn_echo_batch,
+    )
+    from .streaming import (
+        StreamingT1Estimator,
+        StreamingRamseyEstimator,
+    )
+    from .planning import (
+        fisher_information,
+        predicted_errors,
+        min_shots,
+    )
+    from .adaptive import (
+        AdaptiveT1Design,
+        AdaptiveRamseyDesign,
+        simulated_measurement,
+    )
+    from .readout import (
+        simulate_readout_iq,
+        assignment_fidelity,
+        ReadoutFidelityResult,
+    )
+    from .randomized_benchmarking import (
+        simulate_rb,
+        simulate_rb_gate_level,
+        simulate_rb_2q,
+        fit_rb,
+        fit_rb_batch,
+        RBResult,
+        epc_from_p,
+    )
+    from .rb_modes import (
+        simulate_interleaved_rb,
+        fit_interleaved_rb,
+        InterleavedRBResult,
+        simulate_simultaneous_rb,
+    )
+    from .ptm import (
+        depolarizing_ptm,
+        rotation_ptm,
+        amplitude_damping_ptm,
+    )
+    from .fidelity import (
+        average_gate_fidelity_from_rb,
+        error_per_clifford_from_rb,
+        coherence_limit_error,
+        error_budget,
+        CoherenceLimit,
+        ErrorBudget,
+    )
@@ -7,6 +7,7 @@ without any hardware attached.
 
     qubit-characterize                 # default injected parameters
     qubit-characterize --shots 8192    # tighter error bars
+    qubit-characterize --plan          # predicted shot budget, no simulation
     python -m qht.qubit --t1-us 75
 """
 
@@ -14,9 +15,11 @@ from __future__ import annotations
 
 import argparse
 
-from .relaxation import simulate_t1, fit_t1
-from .ramsey import simulate_ramsey, fit_ramsey
-from .rabi import simulate_rabi, fit_rabi
+from .models import exp_decay, get_model_spec, rabi_cosine, ramsey_decay
+from .planning import min_shots, predicted_errors
+from .relaxation import simulate_t1, fit_t1, t1_delays
+from .ramsey import simulate_ramsey, fit_ramsey, ramsey_delays
+from .rabi import simulate_rabi, fit_rabi, rabi_durations
 from .readout import simulate_readout_iq, assignment_fidelity
 from .hahn_echo import simulate_hahn_echo, fit_hahn_echo
 from .randomized_benchmarking import simulate_rb, fit_rb
@@ -76,6 +79,31 @@ def run_battery(args: argparse.Namespace) -> None:
     print(f"QuTiP Lindblad engine available: {have_qutip()}")
 
 
+def run_plan(args: argparse.Namespace) -> None:
+    """Print the Cramer-Rao shot budget for the default sweeps (no simulation)."""
+    t1_true = args.t1_us * 1e-6
+    t2_true, df_true = args.t2_us * 1e-6, args.detuning_mhz * 1e6
+    fr_true = args.rabi_mhz * 1e6
+    target = args.target_rel_err
+    # (label, model, grid, injected params (simulator defaults), parameter)
+    rows = [
+        ("T1", exp_decay, t1_delays(t1_true), (0.98, t1_true, 0.02), "T1"),
+        ("Ramsey T2*", ramsey_decay, ramsey_delays(t2_true, df_true), (0.48, t2_true, df_true, 0.0, 0.5), "T2"),
+        ("  detuning", ramsey_decay, ramsey_delays(t2_true, df_true), (0.48, t2_true, df_true, 0.0, 0.5), "delta_f"),
+        ("Rabi rate", rabi_cosine, rabi_durations(fr_true), (0.97, fr_true, 0.015), "f_rabi"),
+    ]
+
+    print(f"Shot budget plan (Cramer-Rao), target {target:.2%} relative 1-sigma")
+    print("=" * 60)
+    print(f"{'':14s}{'points':>7s}{'err @ ' + str(args.shots):>14s}{'shots/pt':>10s}{'total':>12s}")
+    for label, model, grid, params, name in rows:
+        idx = get_model_spec(model).names.index(name)
+        rel = predicted_errors(model, grid, params, args.shots)[idx] / abs(params[idx])
+        n_min = int(min_shots(model, grid, params, target, param=name, relative=True))
+        print(f"{label:14s}{grid.size:7d}{rel:13.3%} {n_min:10d}{n_min * grid.size:12d}")
+    print("=" * 60)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Single-qubit characterization bench (T1/T2*/Rabi/echo/readout/RB)."
@@ -90,8 +118,17 @@ def main() -> None:
     parser.add_argument("--t2-intrinsic-us", type=float, default=100.0)
     parser.add_argument("--snr", type=float, default=6.0, help="readout blob separation / sigma")
     parser.add_argument("--rb-p", type=float, default=0.99, help="RB depolarizing parameter")
+    parser.add_argument(
+        "--plan", action="store_true", help="print the predicted shot budget instead of simulating"
+    )
+    parser.add_argument(
+        "--target-rel-err", type=float, default=0.01, help="relative 1-sigma goal for --plan"
+    )
     args = parser.parse_args()
-    run_battery(args)
+    if args.plan:
+        run_plan(args)
+    else:
+        run_battery(args)
 
 
 if __name__ == "__main__":
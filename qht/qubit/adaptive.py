@@ -0,0 +1,151 @@
+"""Adaptive (sequential, Fisher-information) sweep design for T1 and Ramsey.
+
+A uniform ``0..4*T1`` grid with equal shots per point spends most of its
+budget where the curve says little about T1: near ``t = 0`` the population
+hardly depends on T1, and far out on the tail it is all offset. The designers
+here run the sweep in rounds instead. After a short uniform pilot, every round
+
+1. takes the current fit (the posterior mode) as the working point,
+2. computes the per-shot binomial Fisher information of each candidate delay,
+   ``F_c = g_c g_c^T / (p_c (1 - p_c))`` (:mod:`.planning`),
+3. greedily hands out the next batch of shots, chunk by chunk, to whichever
+   candidate most reduces the predicted variance of the target parameter
+   ``[(M + n F_c)^-1]_TT`` (``M`` the information already collected), and
+4. measures, refits (warm-started) and checks the precision goal.
+
+The accumulation, warm-start and stopping logic is that of the streaming
+estimators in :mod:`.streaming`; the designers add the choice of *where* the
+next shots go.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+
+from .models import exp_decay, ramsey_decay
+from .planning import per_shot_information
+from .streaming import StreamingRamseyEstimator, StreamingT1Estimator
+
+
+def simulated_measurement(simulate: Callable, *args, seed: int | None = None, **kwargs):
+    """Wrap a ``simulate_*`` function as a ``measure(delays, n_shots) -> counts`` callable.
+
+    ``simulate`` is called as ``simulate(*args, delays=..., n_shots=..., seed=rng)``
+    with one generator shared across rounds, so successive rounds draw fresh noise.
+    """
+    rng = np.random.default_rng(seed)
+
+    def measure(delays: np.ndarray, n_shots: np.ndarray) -> np.ndarray:
+        _, p_hat, _ = simulate(*args, delays=delays, n_shots=n_shots, seed=rng, **kwargs)
+        return np.rint(p_hat * n_shots).astype(np.int64)
+
+    return measure
+
+
+class _AdaptiveDesign:
+    """Greedy Fisher-information shot allocation over a fixed candidate grid."""
+
+    model: Callable[..., np.ndarray]
+    target_index: int = 1
+
+    def __init__(
+        self,
+        candidates: np.ndarray,
+        p0: np.ndarray,
+        target_rel_err: float = 0.02,
+        pilot_shots: int = 32,
+        n_chunks: int = 16,
+        method: str = "curve_fit",
+    ):
+        super().__init__(candidates, target_rel_err=target_rel_err, method=method)
+        self.prior = np.asarray(p0, dtype=float)
+        self.pilot_shots = int(pilot_shots)
+        self.n_chunks = int(n_chunks)
+
+    def _information(self) -> np.ndarray:
+        # Keep the variance away from zero: a fitted model can overshoot [0, 1]
+        # (e.g. ``A + C > 1`` at t=0), which would otherwise claim near-infinite
+        # information at a point whose measured counts are far from noiseless.
+        return per_shot_information(self.model, self.delays, self.params, p_clip=0.02)
+
+    @property
+    def candidates(self) -> np.ndarray:
+        return self.delays
+
+    @property
+    def params(self) -> np.ndarray:
+        """Working point for the design: latest trustworthy fit, else the prior."""
+        if self.result is not None and np.isfinite(self.rel_err):
+            return self.result.fit.popt
+        return self.prior
+
+    def information(self) -> np.ndarray:
+        """Fisher information of the shots collected so far, at :attr:`params`."""
+        return np.einsum("m,mij->ij", self.shots, self._information())
+
+    def propose(self, n_shots: int) -> np.ndarray:
+        """Shots per candidate for the next round (a uniform pilot on the first).
+
+        The pilot gives every candidate ``min(pilot_shots, n_shots // n_candidates)``
+        shots, so a round never exceeds ``n_shots``.
+
+        Raises
+        ------
+        ValueError
+            If ``n_shots`` cannot give every candidate at least one pilot shot.
+        """
+        if self.total_shots == 0:
+            per_delay = min(self.pilot_shots, n_shots // self.delays.size)
+            if per_delay < 1:
+                raise ValueError(
+                    f"{n_shots} shots cannot cover a pilot over {self.delays.size} candidates"
+                )
+            return np.full(self.delays.shape, per_delay, dtype=np.int64)
+        F = self._information()
+        M = np.einsum("m,mij->ij", self.shots, F)
+        alloc = np.zeros(self.delays.shape, dtype=np.int64)
+        chunks = np.full(self.n_chunks, n_shots // self.n_chunks)
+        chunks[: n_shots % self.n_chunks] += 1
+        t = self.target_index
+        for chunk in chunks[chunks > 0]:
+            var = np.linalg.pinv(M + chunk * F, hermitian=True)[:, t, t]
+            var = np.where(var > 0, var, np.inf)
+            c = int(np.argmin(var))
+            M = M + chunk * F[c]
+            alloc[c] += chunk
+        return alloc
+
+    def acquire(
+        self,
+        measure: Callable[[np.ndarray, np.ndarray], np.ndarray],
+        batch_shots: int = 4096,
+        max_shots: int = 1_000_000,
+    ):
+        """Run propose/measure/refit rounds until the goal or ``max_shots`` is reached.
+
+        ``measure(delays, n_shots)`` returns excited counts for the requested
+        delays (only candidates with shots allocated are measured).
+        """
+        while self.total_shots < max_shots:
+            alloc = self.propose(min(batch_shots, max_shots - self.total_shots))
+            sel = alloc > 0
+            counts = np.zeros_like(alloc)
+            counts[sel] = measure(self.delays[sel], alloc[sel])
+            self.update(counts, alloc)
+            if self.done:
+                break
+        return self.result
+
+
+class AdaptiveT1Design(_AdaptiveDesign, StreamingT1Estimator):
+    """Adaptive T1 sweep; ``p0`` is the prior ``(A, T1, C)`` guess."""
+
+    model = staticmethod(exp_decay)
+
+
+class AdaptiveRamseyDesign(_AdaptiveDesign, StreamingRamseyEstimator):
+    """Adaptive Ramsey sweep targeting T2*; ``p0`` is ``(A, T2, delta_f, phi, C)``."""
+
+    model = staticmethod(ramsey_decay)
@@ -24,8 +24,17 @@ from __future__ import annotations
 
 import numpy as np
 
-from .models import exp_decay, fit_curve, sample_shots
+from .models import (
+    FitResult,
+    exp_decay,
+    fit_curve,
+    fit_curve_batch,
+    qubit_rngs,
+    sample_shots,
+)
+from .prony import decay_guess, prony_fit
 from .relaxation import T1Result
+from .template import DecayTemplate
 
 
 def _ensemble_envelope(
@@ -45,6 +54,18 @@ def _ensemble_envelope(
     return intrinsic * inhom
 
 
+def _echo_delays(
+    sigma_f: float | np.ndarray, t2_intrinsic: float | np.ndarray, n_points: int, span: float
+) -> np.ndarray:
+    """Default decay axis: ``span`` times the Ramsey 1/e time (row per qubit)."""
+    sigma_f = np.asarray(sigma_f, dtype=float)
+    # Ramsey 1/e time from the Gaussian inhomogeneous envelope.
+    with np.errstate(divide="ignore"):
+        t2_star_inhom = np.where(sigma_f > 0, 1.0 / (np.sqrt(2.0) * np.pi * sigma_f), t2_intrinsic)
+    t_ref = np.minimum(t2_star_inhom, t2_intrinsic)
+    return np.linspace(0.0, span * t_ref, n_points, axis=-1)
+
+
 def simulate_hahn_echo(
     sigma_f: float,
     t2_intrinsic: float,
@@ -75,10 +96,7 @@ def simulate_hahn_echo(
     """
     rng = np.random.default_rng(seed)
     if delays is None:
-        # Ramsey 1/e time from the Gaussian inhomogeneous envelope.
-        t2_star_inhom = 1.0 / (np.sqrt(2.0) * np.pi * sigma_f) if sigma_f > 0 else t2_intrinsic
-        t_ref = min(t2_star_inhom, t2_intrinsic)
-        delays = np.linspace(0.0, span * t_ref, n_points)
+        delays = _echo_delays(sigma_f, t2_intrinsic, n_points, span)
     delays = np.asarray(delays, dtype=float)
 
     env = _ensemble_envelope(delays, sigma_f, t2_intrinsic, echo)
@@ -89,36 +107,104 @@ def simulate_hahn_echo(
     return delays, p_hat, sigma
 
 
+def simulate_hahn_echo_batch(
+    sigma_f: np.ndarray,
+    t2_intrinsic: np.ndarray,
+    echo: bool,
+    delays: np.ndarray | None = None,
+    A: float | np.ndarray = 0.49,
+    C: float | np.ndarray = 0.5,
+    n_shots: int | np.ndarray = 8192,
+    n_points: int = 60,
+    span: float = 3.0,
+    seed: int | None = None,
+    independent_streams: bool = True,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Chip-scale :func:`simulate_hahn_echo` over per-qubit noise vectors (see
+    :func:`~qht.qubit.relaxation.simulate_t1_batch` for the RNG streams)."""
+    sigma_f, t2_intrinsic = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(sigma_f, dtype=float)), np.asarray(t2_intrinsic, dtype=float)
+    )
+    n = sigma_f.size
+    if delays is None:
+        delays = _echo_delays(sigma_f, t2_intrinsic, n_points, span)
+    delays = np.asarray(delays, dtype=float)
+    A, C = (np.broadcast_to(v, (n,))[:, None] for v in (A, C))
+    env = _ensemble_envelope(delays, sigma_f[:, None], t2_intrinsic[:, None], echo)
+    rng = qubit_rngs(seed, n) if independent_streams else np.random.default_rng(seed)
+    p_hat, sigma = sample_shots(A * env + C, n_shots, rng)
+    return delays, p_hat, sigma
+
+
+# Physical box for the (A, T2, C) envelope fit.
+_ECHO_BOUNDS = ([0.0, 1e-12, -0.5], [1.5, np.inf, 1.5])
+
+
+def _echo_result(fit: FitResult) -> T1Result:
+    return T1Result(
+        T1=fit.value("T2"),
+        T1_err=fit.error("T2"),
+        A=fit.value("A"),
+        C=fit.value("C"),
+        fit=fit,
+    )
+
+
 def fit_hahn_echo(
-    delays: np.ndarray, p_hat: np.ndarray, sigma: np.ndarray | None = None
+    delays: np.ndarray,
+    p_hat: np.ndarray,
+    sigma: np.ndarray | None = None,
+    method: str = "curve_fit",
+    template: DecayTemplate | None = None,
 ) -> T1Result:
     """Fit the coherence envelope to ``A*exp(-t/T2)+C``; return T2 + uncertainty.
 
     Reuses the exponential model/result container; ``T1Result.T1`` here holds the
-    fitted T2 (the field is generic to a single decay constant).
+    fitted T2 (the field is generic to a single decay constant). ``method`` is
+    passed to :func:`fit_curve` (``"varpro"`` searches T2 alone), except
+    ``"prony"``, which returns the closed-form estimate without iterating.
+    ``template`` seeds the fit from a precompiled lookup table, as in
+    :func:`~qht.qubit.relaxation.fit_t1`.
     """
     delays = np.asarray(delays, dtype=float)
     p_hat = np.asarray(p_hat, dtype=float)
-
-    c0 = float(np.min(p_hat))
-    a0 = float(np.clip(p_hat[0] - c0, 1e-3, 1.0))
-    target = c0 + a0 / np.e
-    idx = int(np.argmin(np.abs(p_hat - target)))
-    t2_0 = max(delays[idx], (delays[-1] - delays[0]) / 4.0, 1e-9)
+    if method == "prony":
+        return _echo_result(prony_fit(delays, p_hat, sigma, names=("A", "T2", "C")))
 
     fit = fit_curve(
         exp_decay,
         delays,
         p_hat,
-        p0=[a0, t2_0, c0],
+        p0=decay_guess(delays, p_hat, _ECHO_BOUNDS, template),
         names=("A", "T2", "C"),
         sigma=sigma,
-        bounds=([0.0, 1e-12, -0.5], [1.5, np.inf, 1.5]),
+        bounds=_ECHO_BOUNDS,
+        method=method,
     )
-    return T1Result(
-        T1=fit.value("T2"),
-        T1_err=fit.error("T2"),
-        A=fit.value("A"),
-        C=fit.value("C"),
-        fit=fit,
+    return _echo_result(fit)
+
+
+def fit_hahn_echo_batch(
+    delays: np.ndarray,
+    p_hat: np.ndarray,
+    sigma: np.ndarray | None = None,
+    template: DecayTemplate | None = None,
+) -> list[T1Result]:
+    """Batched :func:`fit_hahn_echo` over the rows of ``p_hat`` ``(n_curves, n_points)``.
+
+    Curves the lockstep solver could not converge report
+    ``res.fit.converged = False``.
+    """
+    delays = np.asarray(delays, dtype=float)
+    p_hat = np.atleast_2d(np.asarray(p_hat, dtype=float))
+
+    batch = fit_curve_batch(
+        exp_decay,
+        delays,
+        p_hat,
+        p0=decay_guess(delays, p_hat, _ECHO_BOUNDS, template),
+        names=("A", "T2", "C"),
+        sigma=sigma,
+        bounds=_ECHO_BOUNDS,
     )
+    return [_echo_result(batch[i]) for i in range(len(batch))]
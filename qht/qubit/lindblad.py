@@ -27,17 +27,20 @@ closed-form models used elsewhere are the master-equation result.
 
 from __future__ import annotations
 
+import importlib.util
+from functools import lru_cache
+
 import numpy as np
 
 
+@lru_cache(maxsize=1)
 def have_qutip() -> bool:
-    """True if QuTiP is importable in this environment."""
-    try:
-        import qutip  # noqa: F401
+    """True if QuTiP is installed in this environment.
 
-        return True
-    except Exception:
-        return False
+    Only the import machinery is queried (QuTiP itself takes seconds to
+    import), and the answer is cached for the life of the process.
+    """
+    return importlib.util.find_spec("qutip") is not None
 
 
 def _rates(t1: float, tphi: float) -> tuple[float, float, float]:
@@ -0,0 +1,85 @@
+"""Shot-budget planning from the binomial Fisher information (Cramer-Rao).
+
+Every point of a characterization sweep is a binomial measurement: ``n`` shots
+of a population ``p(t; theta)``. Its Fisher information about the model
+parameters is
+
+    I(theta) = sum_t n_t * g_t g_t^T / (p_t (1 - p_t)),   g_t = dp/dtheta
+
+and the Cramer-Rao bound ``cov >= I^-1`` is what a weighted least-squares fit
+attains asymptotically -- the ``perr`` the fitters report. So the 1-sigma
+error bar of any sweep can be predicted analytically, before a single shot is
+simulated or measured, from the model's registered Jacobian alone.
+
+All functions broadcast over leading axes: ``delays`` may be a stack of
+candidate grids ``(..., m)`` and ``n_shots`` any array broadcastable against
+it (a scalar, per-point counts, or ``n[:, None]`` to scan shot counts).
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Sequence
+
+import numpy as np
+
+from .models import get_model_spec
+
+
+def per_shot_information(
+    model: Callable[..., np.ndarray],
+    delays: np.ndarray,
+    params: Sequence[float],
+    p_clip: float = 1e-6,
+) -> np.ndarray:
+    """Fisher information of one shot at each delay, shape ``(..., m, k, k)``.
+
+    ``p_clip`` keeps ``p (1 - p)`` away from zero where the model touches (or,
+    away from the truth, overshoots) 0 or 1.
+    """
+    f, J = get_model_spec(model).value_and_jac(np.asarray(delays, dtype=float), *params)
+    p = np.clip(f, p_clip, 1.0 - p_clip)
+    return J[..., :, None] * J[..., None, :] / (p * (1.0 - p))[..., None, None]
+
+
+def fisher_information(
+    model: Callable[..., np.ndarray],
+    delays: np.ndarray,
+    params: Sequence[float],
+    n_shots: np.ndarray | int = 1,
+) -> np.ndarray:
+    """Total Fisher information of a sweep, shape ``(..., k, k)``."""
+    F = per_shot_information(model, delays, params)
+    n = np.asarray(n_shots, dtype=float)[..., None, None]
+    return np.sum(n * F, axis=-3)
+
+
+def predicted_errors(
+    model: Callable[..., np.ndarray],
+    delays: np.ndarray,
+    params: Sequence[float],
+    n_shots: np.ndarray | int,
+) -> np.ndarray:
+    """Cramer-Rao 1-sigma errors of every parameter, shape ``(..., k)``."""
+    cov = np.linalg.inv(fisher_information(model, delays, params, n_shots))
+    return np.sqrt(np.diagonal(cov, axis1=-2, axis2=-1))
+
+
+def min_shots(
+    model: Callable[..., np.ndarray],
+    delays: np.ndarray,
+    params: Sequence[float],
+    target_err: float,
+    param: str | int = 1,
+    relative: bool = False,
+) -> np.ndarray:
+    """Fewest shots *per delay point* for ``param``'s error to reach ``target_err``.
+
+    With equal shots per point the information scales as ``n``, so the error
+    scales as ``1/sqrt(n)`` and the answer is ``ceil((err_1 / target)^2)``
+    where ``err_1`` is the single-shot error. ``relative=True`` reads
+    ``target_err`` as a fraction of the parameter value.
+    """
+    idx = get_model_spec(model).names.index(param) if isinstance(param, str) else param
+    err_1 = predicted_errors(model, delays, params, 1)[..., idx]
+    target = target_err * abs(params[idx]) if relative else target_err
+    return np.ceil((err_1 / target) ** 2).astype(np.int64)
@@ -0,0 +1,67 @@
+"""Single-qubit Pauli transfer matrices (PTMs) for gate-level simulation.
+
+A channel acting on ``rho = (I + x X + y Y + z Z) / 2`` is a real 4x4 matrix on
+the Pauli vector ``(1, x, y, z)``. Unitary gates are ``diag(1, R)`` with ``R``
+the SO(3) Bloch rotation -- exactly the representation
+:mod:`.randomized_benchmarking` already uses for the Clifford group -- and
+noise channels compose by plain matrix products, so a whole block of gate
+sequences can be propagated with stacked ``np.matmul``.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def unitary_ptm(rotation: np.ndarray) -> np.ndarray:
+    """PTM(s) ``diag(1, R)`` of Bloch rotation(s) ``R`` of shape ``(..., 3, 3)``."""
+    rotation = np.asarray(rotation, dtype=float)
+    out = np.zeros(rotation.shape[:-2] + (4, 4))
+    out[..., 0, 0] = 1.0
+    out[..., 1:, 1:] = rotation
+    return out
+
+
+def rotation_ptm(axis: np.ndarray, angle: float) -> np.ndarray:
+    """Coherent rotation by ``angle`` (rad) about Bloch ``axis`` (over-rotation errors)."""
+    n = np.asarray(axis, dtype=float)
+    n = n / np.linalg.norm(n)
+    K = np.array([[0.0, -n[2], n[1]], [n[2], 0.0, -n[0]], [-n[1], n[0], 0.0]])
+    R = np.eye(3) + np.sin(angle) * K + (1.0 - np.cos(angle)) * (K @ K)
+    return unitary_ptm(R)
+
+
+def depolarizing_ptm(p: float) -> np.ndarray:
+    """Depolarizing channel shrinking the Bloch vector by ``p`` (1 = noiseless)."""
+    return np.diag([1.0, p, p, p])
+
+
+def amplitude_damping_ptm(gamma: float) -> np.ndarray:
+    """Amplitude damping toward |0> with decay probability ``gamma`` per gate."""
+    s = np.sqrt(1.0 - gamma)
+    return np.array(
+        [
+            [1.0, 0.0, 0.0, 0.0],
+            [0.0, s, 0.0, 0.0],
+            [0.0, 0.0, s, 0.0],
+            [gamma, 0.0, 0.0, 1.0 - gamma],
+        ]
+    )
+
+
+def tree_matmul(mats: np.ndarray) -> np.ndarray:
+    """Ordered product of ``mats[..., k, :, :]`` with ``k = 0`` applied first.
+
+    Pairs are merged level by level (``log2(L)`` batched matmuls over every
+    leading row) instead of a Python loop over the ``L`` factors.
+    """
+    mats = np.asarray(mats, dtype=float)
+    d = mats.shape[-1]
+    if mats.shape[-3] == 0:
+        return np.broadcast_to(np.eye(d), mats.shape[:-3] + (d, d)).copy()
+    while mats.shape[-3] > 1:
+        if mats.shape[-3] % 2:
+            eye = np.broadcast_to(np.eye(d), mats.shape[:-3] + (1, d, d))
+            mats = np.concatenate([mats, eye], axis=-3)
+        mats = np.matmul(mats[..., 1::2, :, :], mats[..., 0::2, :, :])
+    return mats[..., 0, :, :]
@@ -18,7 +18,14 @@ from dataclasses import dataclass
 
 import numpy as np
 
-from .models import FitResult, fit_curve, rabi_cosine, sample_shots
+from .models import (
+    FitResult,
+    fit_curve,
+    fit_curve_batch,
+    qubit_rngs,
+    rabi_cosine,
+    sample_shots,
+)
 
 
 @dataclass
@@ -38,19 +45,28 @@ class RabiResult:
         return self.t_pi * 1e9
 
 
-def _guess_rabi_freq(tau: np.ndarray, y: np.ndarray) -> float:
-    y = y - np.mean(y)
-    n = len(tau)
-    dt = float(np.mean(np.diff(tau)))
-    if dt <= 0 or n < 4:
-        return 1.0 / (tau[-1] - tau[0] + 1e-12)
-    freqs = np.fft.rfftfreq(n, d=dt)
-    amp = np.abs(np.fft.rfft(y))
-    amp[0] = 0.0
-    f0 = freqs[int(np.argmax(amp))]
-    if f0 <= 0:
-        f0 = 1.0 / (tau[-1] - tau[0] + 1e-12)
-    return float(f0)
+def _guess_rabi_freq(tau: np.ndarray, y: np.ndarray) -> np.ndarray:
+    tau = np.broadcast_to(tau, y.shape)
+    y = y - np.mean(y, axis=-1, keepdims=True)
+    n = y.shape[-1]
+    fallback = 1.0 / (tau[..., -1] - tau[..., 0] + 1e-12)
+    if n < 4:
+        return fallback
+    dt = np.mean(np.diff(tau, axis=-1), axis=-1)
+    amp = np.abs(np.fft.rfft(y, axis=-1))
+    amp[..., 0] = 0.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f0 = np.argmax(amp, axis=-1) / (n * dt)
+    return np.where((dt > 0) & (f0 > 0), f0, fallback)
+
+
+def rabi_durations(
+    f_rabi_true: float | np.ndarray, n_periods: float = 3.0, n_points: int = 80
+) -> np.ndarray:
+    """Default Rabi sweep spanning ``n_periods`` full oscillations (one row per
+    frequency if ``f_rabi_true`` is an array)."""
+    t_max = n_periods / np.asarray(f_rabi_true, dtype=float)
+    return np.linspace(0.0, t_max, n_points, axis=-1)
 
 
 def simulate_rabi(
@@ -70,35 +86,51 @@ def simulate_rabi(
     """
     rng = np.random.default_rng(seed)
     if durations is None:
-        t_max = n_periods / f_rabi_true
-        durations = np.linspace(0.0, t_max, n_points)
+        durations = rabi_durations(f_rabi_true, n_periods=n_periods, n_points=n_points)
     durations = np.asarray(durations, dtype=float)
     p_true = rabi_cosine(durations, A, f_rabi_true, C)
     p_hat, sigma = sample_shots(p_true, n_shots, rng)
     return durations, p_hat, sigma
 
 
-def fit_rabi(
-    durations: np.ndarray, p_hat: np.ndarray, sigma: np.ndarray | None = None
-) -> RabiResult:
-    """Fit the Rabi model and derive the pi-pulse duration with uncertainty."""
+def simulate_rabi_batch(
+    f_rabi_true: np.ndarray,
+    durations: np.ndarray | None = None,
+    A: float | np.ndarray = 0.97,
+    C: float | np.ndarray = 0.015,
+    n_shots: int | np.ndarray = 4096,
+    n_periods: float = 3.0,
+    n_points: int = 80,
+    seed: int | None = None,
+    independent_streams: bool = True,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Chip-scale :func:`simulate_rabi` over a vector of Rabi frequencies (see
+    :func:`~qht.qubit.relaxation.simulate_t1_batch` for the RNG streams)."""
+    fr = np.atleast_1d(np.asarray(f_rabi_true, dtype=float))
+    n = fr.size
+    if durations is None:
+        durations = rabi_durations(fr, n_periods=n_periods, n_points=n_points)
     durations = np.asarray(durations, dtype=float)
-    p_hat = np.asarray(p_hat, dtype=float)
+    A, C = (np.broadcast_to(v, (n,))[:, None] for v in (A, C))
+    p_true = rabi_cosine(durations, A, fr[:, None], C)
+    rng = qubit_rngs(seed, n) if independent_streams else np.random.default_rng(seed)
+    p_hat, sigma = sample_shots(p_true, n_shots, rng)
+    return durations, p_hat, sigma
 
-    c0 = float(np.min(p_hat))
-    a0 = float(np.clip(np.max(p_hat) - np.min(p_hat), 1e-3, 1.0))
+
+# Physical box for the (A, f_rabi, C) fit.
+_RABI_BOUNDS = ([0.0, 0.0, -0.5], [1.5, np.inf, 1.0])
+
+
+def _initial_guess(durations: np.ndarray, p_hat: np.ndarray) -> np.ndarray:
+    """``(A, f_rabi, C)`` seeds, row-wise on the last axis."""
+    c0 = np.min(p_hat, axis=-1)
+    a0 = np.clip(np.max(p_hat, axis=-1) - c0, 1e-3, 1.0)
     f0 = _guess_rabi_freq(durations, p_hat)
+    return np.stack([a0, f0, c0], axis=-1)
 
-    fit = fit_curve(
-        rabi_cosine,
-        durations,
-        p_hat,
-        p0=[a0, f0, c0],
-        names=("A", "f_rabi", "C"),
-        sigma=sigma,
-        bounds=([0.0, 0.0, -0.5], [1.5, np.inf, 1.0]),
-    )
 
+def _rabi_result(fit: FitResult) -> RabiResult:
     f_rabi = fit.value("f_rabi")
     f_rabi_err = fit.error("f_rabi")
     t_pi = 1.0 / (2.0 * f_rabi)
@@ -114,3 +146,53 @@ def fit_rabi(
         C=fit.value("C"),
         fit=fit,
     )
+
+
+def fit_rabi(
+    durations: np.ndarray,
+    p_hat: np.ndarray,
+    sigma: np.ndarray | None = None,
+    method: str = "curve_fit",
+) -> RabiResult:
+    """Fit the Rabi model and derive the pi-pulse duration with uncertainty.
+
+    ``method="varpro"`` searches ``f_rabi`` alone, solving ``A``/``C`` in closed
+    form; ``t_pi_err`` is propagated from the same joint covariance.
+    """
+    durations = np.asarray(durations, dtype=float)
+    p_hat = np.asarray(p_hat, dtype=float)
+
+    fit = fit_curve(
+        rabi_cosine,
+        durations,
+        p_hat,
+        p0=_initial_guess(durations, p_hat),
+        names=("A", "f_rabi", "C"),
+        sigma=sigma,
+        bounds=_RABI_BOUNDS,
+        method=method,
+    )
+    return _rabi_result(fit)
+
+
+def fit_rabi_batch(
+    durations: np.ndarray, p_hat: np.ndarray, sigma: np.ndarray | None = None
+) -> list[RabiResult]:
+    """Batched :func:`fit_rabi` over the rows of ``p_hat`` ``(n_curves, n_points)``.
+
+    Curves the lockstep solver could not converge report
+    ``res.fit.converged = False``.
+    """
+    durations = np.asarray(durations, dtype=float)
+    p_hat = np.atleast_2d(np.asarray(p_hat, dtype=float))
+
+    batch = fit_curve_batch(
+        rabi_cosine,
+        durations,
+        p_hat,
+        p0=_initial_guess(durations, p_hat),
+        names=("A", "f_rabi", "C"),
+        sigma=sigma,
+        bounds=_RABI_BOUNDS,
+    )
+    return [_rabi_result(batch[i]) for i in range(len(batch))]
@@ -14,10 +14,18 @@ Fitting recovers BOTH the envelope time constant T2* and the detuning
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Iterator
 
 import numpy as np
 
-from .models import FitResult, fit_curve, ramsey_decay, sample_shots
+from .models import (
+    FitResult,
+    fit_curve,
+    fit_curve_batch,
+    qubit_rngs,
+    ramsey_decay,
+    sample_shots,
+)
 
 
 @dataclass
@@ -38,20 +46,41 @@ class RamseyResult:
         return self.T2 * 1e6
 
 
-def _guess_detuning(t: np.ndarray, y: np.ndarray) -> float:
-    """Estimate fringe frequency from the real FFT of the (de-meaned) signal."""
-    y = y - np.mean(y)
-    n = len(t)
-    dt = float(np.mean(np.diff(t)))
-    if dt <= 0 or n < 4:
-        return 1.0 / (t[-1] - t[0] + 1e-12)
-    freqs = np.fft.rfftfreq(n, d=dt)
-    amp = np.abs(np.fft.rfft(y))
-    amp[0] = 0.0  # ignore DC
-    f0 = freqs[int(np.argmax(amp))]
-    if f0 <= 0:
-        f0 = 1.0 / (t[-1] - t[0] + 1e-12)
-    return float(f0)
+def _guess_detuning(t: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Estimate fringe frequency from the real FFT of the (de-meaned) signal.
+
+    Works row-wise on the last axis, so ``y`` may be one curve or a batch.
+    """
+    t = np.broadcast_to(t, y.shape)
+    y = y - np.mean(y, axis=-1, keepdims=True)
+    n = y.shape[-1]
+    fallback = 1.0 / (t[..., -1] - t[..., 0] + 1e-12)
+    if n < 4:
+        return fallback
+    dt = np.mean(np.diff(t, axis=-1), axis=-1)
+    amp = np.abs(np.fft.rfft(y, axis=-1))
+    amp[..., 0] = 0.0  # ignore DC
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f0 = np.argmax(amp, axis=-1) / (n * dt)
+    return np.where((dt > 0) & (f0 > 0), f0, fallback)
+
+
+def ramsey_delays(
+    t2_true: float | np.ndarray,
+    delta_f_true: float | np.ndarray,
+    n_points: int = 80,
+    span: float = 3.0,
+) -> np.ndarray:
+    """Default Ramsey sweep: 0 out to ``span`` * T2*, sampled finely enough
+    (>= 10 points per fringe) to resolve the detuning.
+
+    Array inputs give one sweep per row; all rows share the point count of the
+    most demanding one.
+    """
+    t_max = span * np.asarray(t2_true, dtype=float)
+    n_fringe = np.maximum(1.0, np.asarray(delta_f_true, dtype=float) * t_max)
+    n_points = int(max(n_points, 10 * np.max(n_fringe)))
+    return np.linspace(0.0, t_max, n_points, axis=-1)
 
 
 def simulate_ramsey(
@@ -74,41 +103,83 @@ def simulate_ramsey(
     """
     rng = np.random.default_rng(seed)
     if delays is None:
-        # Nyquist-respecting sampling: enough points to resolve the fringe.
-        t_max = span * t2_true
-        n_fringe = max(1.0, delta_f_true * t_max)
-        n_points = int(max(n_points, 10 * n_fringe))
-        delays = np.linspace(0.0, t_max, n_points)
+        delays = ramsey_delays(t2_true, delta_f_true, n_points=n_points, span=span)
     delays = np.asarray(delays, dtype=float)
     p_true = ramsey_decay(delays, A, t2_true, delta_f_true, phi, C)
     p_hat, sigma = sample_shots(p_true, n_shots, rng)
     return delays, p_hat, sigma
 
 
-def fit_ramsey(
-    delays: np.ndarray, p_hat: np.ndarray, sigma: np.ndarray | None = None
-) -> RamseyResult:
-    """Fit the Ramsey model, returning T2* and detuning with uncertainties."""
+def simulate_ramsey_batch(
+    t2_true: np.ndarray,
+    delta_f_true: np.ndarray,
+    delays: np.ndarray | None = None,
+    A: float | np.ndarray = 0.48,
+    C: float | np.ndarray = 0.5,
+    phi: float | np.ndarray = 0.0,
+    n_shots: int | np.ndarray = 4096,
+    n_points: int = 80,
+    span: float = 3.0,
+    seed: int | None = None,
+    independent_streams: bool = True,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Chip-scale :func:`simulate_ramsey`: per-qubit parameter vectors in,
+    ``(n_qubits, n_points)`` blocks out (see
+    :func:`~qht.qubit.relaxation.simulate_t1_batch` for the RNG streams)."""
+    t2 = np.atleast_1d(np.asarray(t2_true, dtype=float))
+    n = t2.size
+    df = np.broadcast_to(delta_f_true, (n,))
+    if delays is None:
+        delays = ramsey_delays(t2, df, n_points=n_points, span=span)
     delays = np.asarray(delays, dtype=float)
-    p_hat = np.asarray(p_hat, dtype=float)
+    A, C, phi = (np.broadcast_to(v, (n,))[:, None] for v in (A, C, phi))
+    p_true = ramsey_decay(delays, A, t2[:, None], df[:, None], phi, C)
+    rng = qubit_rngs(seed, n) if independent_streams else np.random.default_rng(seed)
+    p_hat, sigma = sample_shots(p_true, n_shots, rng)
+    return delays, p_hat, sigma
 
-    c0 = float(np.mean(p_hat))
-    a0 = float(np.clip((np.max(p_hat) - np.min(p_hat)) / 2.0, 1e-3, 1.0))
+
+def simulate_ramsey_stream(
+    t2_true: float,
+    delta_f_true: float,
+    delays: np.ndarray,
+    A: float = 0.48,
+    C: float = 0.5,
+    phi: float = 0.0,
+    batch_shots: int = 128,
+    max_shots: int = 4096,
+    seed: int | None = None,
+) -> Iterator[tuple[np.ndarray, int]]:
+    """Stream ``(counts, batch_shots)`` passes over a Ramsey sweep.
+
+    The streaming counterpart of :func:`simulate_ramsey`; see
+    :func:`~qht.qubit.relaxation.simulate_t1_stream`.
+    """
+    rng = np.random.default_rng(seed)
+    delays = np.asarray(delays, dtype=float)
+    p_true = np.clip(ramsey_decay(delays, A, t2_true, delta_f_true, phi, C), 0.0, 1.0)
+    for _ in range(max_shots // batch_shots):
+        yield rng.binomial(batch_shots, p_true), batch_shots
+
+
+# Physical box for the (A, T2, delta_f, phi, C) fit.
+_RAMSEY_BOUNDS = (
+    [0.0, 1e-12, 0.0, -2.0 * np.pi, -0.5],
+    [1.5, np.inf, np.inf, 2.0 * np.pi, 1.5],
+)
+
+
+def _initial_guess(delays: np.ndarray, p_hat: np.ndarray) -> np.ndarray:
+    """``(A, T2, delta_f, phi, C)`` seeds, row-wise on the last axis."""
+    d = np.broadcast_to(delays, p_hat.shape)
+    c0 = np.mean(p_hat, axis=-1)
+    a0 = np.clip((np.max(p_hat, axis=-1) - np.min(p_hat, axis=-1)) / 2.0, 1e-3, 1.0)
     f0 = _guess_detuning(delays, p_hat)
-    t2_0 = max((delays[-1] - delays[0]) / 2.0, 1e-9)
+    t2_0 = np.maximum((d[..., -1] - d[..., 0]) / 2.0, 1e-9)
+    return np.stack([a0, t2_0, f0, np.zeros_like(c0), c0], axis=-1)
 
-    fit = fit_curve(
-        ramsey_decay,
-        delays,
-        p_hat,
-        p0=[a0, t2_0, f0, 0.0, c0],
-        names=("A", "T2", "delta_f", "phi", "C"),
-        sigma=sigma,
-        bounds=(
-            [0.0, 1e-12, 0.0, -2.0 * np.pi, -0.5],
-            [1.5, np.inf, np.inf, 2.0 * np.pi, 1.5],
-        ),
-    )
+
+def _ramsey_result(fit: FitResult) -> RamseyResult:
     return RamseyResult(
         T2=fit.value("T2"),
         T2_err=fit.error("T2"),
@@ -119,3 +190,56 @@ def fit_ramsey(
         phi=fit.value("phi"),
         fit=fit,
     )
+
+
+def fit_ramsey(
+    delays: np.ndarray,
+    p_hat: np.ndarray,
+    sigma: np.ndarray | None = None,
+    method: str = "curve_fit",
+    p0: np.ndarray | None = None,
+) -> RamseyResult:
+    """Fit the Ramsey model, returning T2* and detuning with uncertainties.
+
+    With ``method="varpro"`` the amplitude, phase and offset enter linearly
+    (``A*cos(wt+phi)`` as a cos/sin pair), so only ``(T2, delta_f)`` are
+    searched iteratively. ``p0`` overrides the FFT-based starting point, e.g.
+    to warm-start from a previous fit.
+    """
+    delays = np.asarray(delays, dtype=float)
+    p_hat = np.asarray(p_hat, dtype=float)
+
+    fit = fit_curve(
+        ramsey_decay,
+        delays,
+        p_hat,
+        p0=_initial_guess(delays, p_hat) if p0 is None else p0,
+        names=("A", "T2", "delta_f", "phi", "C"),
+        sigma=sigma,
+        bounds=_RAMSEY_BOUNDS,
+        method=method,
+    )
+    return _ramsey_result(fit)
+
+
+def fit_ramsey_batch(
+    delays: np.ndarray, p_hat: np.ndarray, sigma: np.ndarray | None = None
+) -> list[RamseyResult]:
+    """Batched :func:`fit_ramsey` over the rows of ``p_hat`` ``(n_curves, n_points)``.
+
+    Curves the lockstep solver could not converge report
+    ``res.fit.converged = False``.
+    """
+    delays = np.asarray(delays, dtype=float)
+    p_hat = np.atleast_2d(np.asarray(p_hat, dtype=float))
+
+    batch = fit_curve_batch(
+        ramsey_decay,
+        delays,
+        p_hat,
+        p0=_initial_guess(delays, p_hat),
+        names=("A", "T2", "delta_f", "phi", "C"),
+        sigma=sigma,
+        bounds=_RAMSEY_BOUNDS,
+    )
+    return [_ramsey_result(batch[i]) for i in range(len(batch))]
@@ -19,9 +19,10 @@ where ``p`` is the depolarizing parameter. The error per Clifford is
 
 The Clifford group is represented by its action on the Pauli operators (a
 signed permutation of {X, Y, Z}); composition and inversion are exact, so the
-recovery gate is computed correctly. The noise model is a depolarizing channel
-applied in the Bloch picture, which yields the exact ``A*p^m+B`` form -- letting
-the test recover the injected ``p`` / EPC.
+recovery gate is computed correctly. :func:`simulate_rb` evaluates the
+depolarizing model in closed form, which yields the exact ``A*p^m+B`` form --
+letting the test recover the injected ``p`` / EPC -- while
+:func:`simulate_rb_gate_level` draws the sequences and propagates every gate.
 """
 
 from __future__ import annotations
@@ -31,7 +32,16 @@ from functools import lru_cache
 
 import numpy as np
 
-from .models import FitResult, fit_curve
+from .clifford2q import N_PAULI, clifford_2q_tables, random_sequences_2q
+from .ptm import tree_matmul, unitary_ptm
+from .models import (
+    FitResult,
+    SeparableForm,
+    _stack_jac,
+    fit_curve,
+    fit_curve_batch,
+    register_model,
+)
 
 # --------------------------------------------------------------------------- #
 # Single-qubit Clifford group as 3x3 signed permutation matrices acting on the
@@ -88,6 +98,56 @@ def _inverse_index(group: np.ndarray, lookup: dict, a: int) -> int:
     return lookup[_key(inv)]
 
 
+@lru_cache(maxsize=1)
+def _cayley_tables() -> tuple[np.ndarray, np.ndarray]:
+    """Precomputed group tables: ``(mult, inv)``.
+
+    ``mult[a, b]`` is the index of ``group[a] @ group[b]`` (apply ``b`` then
+    ``a``) and ``inv[a]`` the index of ``group[a]^-1``, so composition and
+    inversion become integer gathers that vectorize over whole sequence blocks.
+    """
+    group, lookup = _clifford_group()
+    n = len(group)
+    mult = np.array(
+        [[_compose_index(group, lookup, a, b) for b in range(n)] for a in range(n)],
+        dtype=np.intp,
+    )
+    inv = np.array([_inverse_index(group, lookup, a) for a in range(n)], dtype=np.intp)
+    return mult, inv
+
+
+def _compose_sequences(gates: np.ndarray, mult: np.ndarray, identity: int) -> np.ndarray:
+    """Net element of each row of ``gates`` (``gates[..., 0]`` applied first).
+
+    Tree reduction: adjacent pairs are merged with one table gather per level,
+    ``log2(m)`` levels in total, each vectorized over every row.
+    """
+    net = np.asarray(gates, dtype=np.intp)
+    if net.shape[-1] == 0:
+        return np.full(net.shape[:-1], identity, dtype=np.intp)
+    while net.shape[-1] > 1:
+        if net.shape[-1] % 2:
+            pad = np.full(net.shape[:-1] + (1,), identity, dtype=np.intp)
+            net = np.concatenate([net, pad], axis=-1)
+        # The later gate of each pair multiplies from the left.
+        net = mult[net[..., 1::2], net[..., 0::2]]
+    return net[..., 0]
+
+
+def _random_sequences(
+    rng: np.random.Generator, length: int, n_sequences: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """``(gates, recovery)`` for ``n_sequences`` random Clifford sequences.
+
+    ``gates`` has shape ``(n_sequences, length)``; ``recovery[s]`` inverts the
+    net Clifford of row ``s`` so the ideal circuit is the identity.
+    """
+    mult, inv = _cayley_tables()
+    gates = rng.integers(0, len(inv), size=(n_sequences, int(length)))
+    net = _compose_sequences(gates, mult, _identity_index_cached())
+    return gates, inv[net]
+
+
 @dataclass
 class RBResult:
     """Randomized-benchmarking fit result."""
@@ -111,17 +171,43 @@ def rb_survival_model(m: np.ndarray, A: float, p: float, B: float) -> np.ndarray
     return A * np.power(p, m) + B
 
 
+def _rb_survival_value_and_jac(m, A, p, B):
+    pm = np.power(p, m)
+    value = A * pm + B
+    # d(p^m)/dp = m * p^(m-1); written without dividing by p so p = 0 is safe.
+    dp = A * m * np.power(p, np.maximum(m - 1, 0))
+    return value, _stack_jac(value, pm, dp, 1.0)
+
+
+def _rb_basis(m, p):
+    return np.column_stack([np.power(p, m), np.ones_like(m)])
+
+
+register_model(
+    rb_survival_model,
+    _rb_survival_value_and_jac,
+    ("A", "p", "B"),
+    SeparableForm(("p",), _rb_basis, lambda theta, c: np.array([c[0], theta[0], c[1]])),
+)
+
+
 def simulate_rb(
     p_depol: float,
     lengths: np.ndarray | None = None,
-    n_sequences: int = 40,
+    n_sequences: int | np.ndarray = 40,
     n_shots: int = 4096,
     A: float = 0.5,
     B: float = 0.5,
     seed: int | None = None,
-) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    return_per_sequence: bool = False,
+) -> tuple[np.ndarray, ...]:
     """Simulate an RB experiment and return averaged survival vs length.
 
+    The model is analytic: under depolarizing noise every random sequence has
+    the same survival, so no gate sequences are drawn and only the shot noise
+    is sampled. :func:`simulate_rb_gate_level` propagates drawn sequences
+    through per-gate PTMs for gate-dependent or coherent errors.
+
     Parameters
     ----------
     p_depol:
@@ -131,54 +217,206 @@ def simulate_rb(
         Sequence lengths (number of random Cliffords). Defaults to a log-spaced
         sweep.
     n_sequences:
-        Random sequences averaged per length.
+        Random sequences averaged per length: one count for every length, or
+        an array with one entry per length.
     A, B:
         SPAM-determined offsets of the ideal curve (``A+B`` is the m=0 survival).
+    return_per_sequence:
+        Also return the ``(n_lengths, max(n_sequences))`` per-sequence survival
+        matrix (NaN-padded where a length has fewer sequences), e.g. for
+        bootstrap analysis.
 
     Returns
     -------
-    (lengths, survival, sigma):
+    (lengths, survival, sigma[, per_sequence]):
         Length axis, mean survival probability, std error across sequences.
     """
     rng = np.random.default_rng(seed)
-    group, lookup = _clifford_group()
     if lengths is None:
         lengths = np.unique(
             np.round(np.geomspace(1, 200, 12)).astype(int)
         )
     lengths = np.asarray(lengths, dtype=int)
+    n_seq = np.broadcast_to(np.asarray(n_sequences, dtype=int), lengths.shape)
+
+    # Ideal circuit returns to |0>; depolarizing noise per applied Clifford
+    # (m random gates + 1 recovery) shrinks the Bloch vector, so
+    #   P(0) = 0.5 * (1 + p^(m+1))   (ideal end state is |0>, z=+1).
+    p0 = 0.5 * (1.0 + p_depol ** (lengths + 1.0))
+    # Shot noise for every (length, sequence) pair in one draw; rows with
+    # fewer sequences are padded with NaN.
+    width = int(n_seq.max()) if n_seq.size else 0
+    counts = rng.binomial(n_shots, p0[:, None], size=(len(lengths), width))
+    seq_survivals = np.where(np.arange(width) < n_seq[:, None], counts / n_shots, np.nan)
+    survival_mean, survival_sem = _survival_stats(seq_survivals, n_shots)
+    if return_per_sequence:
+        return lengths.astype(float), survival_mean, survival_sem, seq_survivals
+    return lengths.astype(float), survival_mean, survival_sem
+
+
+def _survival_stats(seq_survivals: np.ndarray, n_shots: int) -> tuple[np.ndarray, np.ndarray]:
+    """Mean survival and its std error over the last (sequence) axis.
+
+    NaN entries are padding (fewer sequences at that length) and are skipped.
+    The error is floored at half a shot so a degenerate zero-variance length
+    does not break the weighted fit.
+    """
+    valid = ~np.isnan(seq_survivals)
+    n_seq = valid.sum(axis=-1)
+    mean = np.where(valid, seq_survivals, 0.0).sum(axis=-1) / np.maximum(n_seq, 1)
+    dev = np.where(valid, seq_survivals - mean[..., None], 0.0)
+    var = (dev**2).sum(axis=-1) / np.maximum(n_seq - 1, 1)
+    sem = np.where(n_seq > 1, np.sqrt(var / np.maximum(n_seq, 1)), 0.0)
+    return mean, np.maximum(sem, 0.5 / n_shots)
+
+
+def _ptm_survival(seqs: np.ndarray, ptms: np.ndarray, max_block: int) -> np.ndarray:
+    """Ideal |0> survival of each row of ``seqs`` (indices into ``ptms``).
+
+    Rows are processed in chunks of at most ``max_block`` matrices and each
+    chunk is reduced with :func:`~qht.qubit.ptm.tree_matmul`.
+    """
+    chunk = max(1, max_block // max(seqs.shape[1], 1))
+    p0 = np.empty(seqs.shape[0])
+    for start in range(0, seqs.shape[0], chunk):
+        net = tree_matmul(ptms[seqs[start : start + chunk]])
+        # Start in |0> = (1, 0, 0, 1); survival is (1 + z_final) / 2.
+        p0[start : start + chunk] = 0.5 * (1.0 + net[:, 3, 0] + net[:, 3, 3])
+    return np.clip(p0, 0.0, 1.0)
+
+
+def simulate_rb_gate_level(
+    error: np.ndarray | None = None,
+    lengths: np.ndarray | None = None,
+    n_sequences: int = 40,
+    n_shots: int = 4096,
+    seed: int | None = None,
+    max_block: int = 1 << 18,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Gate-level RB: propagate every drawn Clifford through a noisy PTM.
+
+    Unlike :func:`simulate_rb`, which applies ``p^(m+1)`` analytically, each
+    Clifford here is its 4x4 Pauli transfer matrix followed by an injectable
+    error channel (see :mod:`.ptm`), so gate-dependent, coherent and
+    non-unital errors show up in the survival exactly as the drawn sequences
+    dictate.
+
+    Parameters
+    ----------
+    error:
+        Error PTM applied after every Clifford: one ``(4, 4)`` channel for all
+        gates, or ``(24, 4, 4)`` indexed by Clifford for gate-dependent errors.
+        ``None`` is noiseless.
+    max_block:
+        Cap on the number of 4x4 matrices materialised at once; sequences are
+        processed in chunks of at most ``max_block // (m + 1)`` rows, each
+        reduced by :func:`~qht.qubit.ptm.tree_matmul`.
+
+    Returns
+    -------
+    (lengths, survival, sigma):
+        As :func:`simulate_rb`, ready for :func:`fit_rb`.
+    """
+    rng = np.random.default_rng(seed)
+    if lengths is None:
+        lengths = np.unique(np.round(np.geomspace(1, 200, 12)).astype(int))
+    lengths = np.asarray(lengths, dtype=int)
+
+    group, _ = _clifford_group()
+    noisy = unitary_ptm(group)
+    if error is not None:
+        noisy = np.matmul(error, noisy)
+
+    p0 = np.empty((len(lengths), n_sequences))
+    for li, m in enumerate(lengths):
+        gates, recovery = _random_sequences(rng, m, n_sequences)
+        seqs = np.concatenate([gates, recovery[:, None]], axis=1)
+        p0[li] = _ptm_survival(seqs, noisy, max_block)
+
+    survival_mean, survival_sem = _survival_stats(rng.binomial(n_shots, p0) / n_shots, n_shots)
+    return lengths.astype(float), survival_mean, survival_sem
+
+
+def _pauli_frame_survival(seqs: np.ndarray, pauli_error: np.ndarray) -> np.ndarray:
+    """Exact |00> survival of two-qubit Clifford sequences under Pauli noise.
 
-    survival_mean = np.zeros(len(lengths))
-    survival_sem = np.zeros(len(lengths))
+    ``seqs`` are rows of element indices (recovery included) whose ideal
+    product is the identity, and ``pauli_error[e]`` is the probability of the
+    Pauli ``P_e`` after every gate. Each row carries the distribution of its
+    Pauli error frame: a Clifford ``P_a C_s`` maps the frame ``e`` to
+    ``conj[s, e]``, and the Pauli channel mixes it by XOR convolution with
+    ``pauli_error``. The sequence survives when the final frame has no X
+    component on either qubit.
+    """
+    tables = clifford_2q_tables()
+    # Where each frame comes from: inv_conj[s, conj[s, e]] = e.
+    inv_conj = np.argsort(tables.conj, axis=1)
+    paulis = np.arange(N_PAULI)
+    channel = np.asarray(pauli_error, dtype=float)[paulis[:, None] ^ paulis]
+    frames = np.zeros((seqs.shape[0], N_PAULI))
+    frames[:, 0] = 1.0
+    rows = np.arange(seqs.shape[0])[:, None]
+    for gate in np.asarray(seqs).T:
+        frames = frames[rows, inv_conj[gate // N_PAULI]] @ channel
+    return frames[:, (paulis & 0b0011) == 0].sum(axis=1)
+
+
+def simulate_rb_2q(
+    p_depol: float,
+    lengths: np.ndarray | None = None,
+    n_sequences: int = 40,
+    n_shots: int = 4096,
+    seed: int | None = None,
+    pauli_error: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Two-qubit Clifford RB (11,520-element group, see :mod:`.clifford2q`).
+
+    Sequences of uniformly random two-qubit Cliffords and their recovery gates
+    are generated with the symplectic-encoding tables, and every applied
+    Clifford (including the recovery) is followed by a two-qubit Pauli
+    channel, tracked exactly through the tables as a Pauli error frame. The
+    default channel is depolarizing, ``rho -> p rho + (1 - p) I/4``, for which
+    the |00> survival is ``0.75 * p^(m+1) + 0.25``. Fit with
+    ``fit_rb(..., d=4)``.
 
+    Parameters
+    ----------
+    p_depol:
+        Two-qubit depolarizing parameter per Clifford (1 = noiseless).
+    pauli_error:
+        Optional ``(16,)`` probabilities of the Pauli applied after every
+        Clifford, indexed by the :mod:`.clifford2q` Pauli encoding (index 0
+        = no error); overrides ``p_depol``. Biased channels make the
+        survival depend on the drawn sequence.
+
+    Raises
+    ------
+    ValueError
+        If ``pauli_error`` is not a probability distribution over the 16 Paulis.
+    """
+    if pauli_error is None:
+        pauli_error = np.full(N_PAULI, (1.0 - p_depol) / N_PAULI)
+        pauli_error[0] += p_depol
+    pauli_error = np.asarray(pauli_error, dtype=float)
+    if (
+        pauli_error.shape != (N_PAULI,)
+        or np.any(pauli_error < 0)
+        or not np.isclose(pauli_error.sum(), 1.0)
+    ):
+        raise ValueError("pauli_error must be 16 non-negative probabilities summing to 1")
+
+    rng = np.random.default_rng(seed)
+    if lengths is None:
+        lengths = np.unique(np.round(np.geomspace(1, 200, 12)).astype(int))
+    lengths = np.asarray(lengths, dtype=int)
+
+    p0 = np.empty((len(lengths), n_sequences))
     for li, m in enumerate(lengths):
-        seq_survivals = np.empty(n_sequences)
-        for s in range(n_sequences):
-            gates = rng.integers(0, 24, size=int(m))
-            # Net Clifford of the random sequence (apply gates[0] first).
-            net = 0  # identity index
-            # Identity is the unique matrix equal to I; find it once.
-            net = _identity_index(group, lookup)
-            for g in gates:
-                net = _compose_index(group, lookup, int(g), net)
-            recovery = _inverse_index(group, lookup, net)
-
-            # Ideal circuit returns to |0>; depolarizing noise per applied
-            # Clifford (m random gates + 1 recovery) shrinks the Bloch vector.
-            n_gates = int(m) + 1
-            # Survival of |0> under n_gates depolarizing events:
-            #   P(0) = 0.5 * (1 + p^n_gates)   (ideal end state is |0>, z=+1)
-            p0 = 0.5 * (1.0 + p_depol ** n_gates)
-            # Shot noise on the survival estimate.
-            counts = rng.binomial(n_shots, p0)
-            seq_survivals[s] = counts / n_shots
-        survival_mean[li] = seq_survivals.mean()
-        survival_sem[li] = seq_survivals.std(ddof=1) / np.sqrt(n_sequences) if n_sequences > 1 else 0.0
-
-    # Floor the per-point sigma so a degenerate zero-variance length does not
-    # break the weighted fit.
-    floor = (0.5 / n_shots)
-    survival_sem = np.maximum(survival_sem, floor)
+        gates, recovery = random_sequences_2q(rng, m, n_sequences)
+        seqs = np.concatenate([gates, recovery[:, None]], axis=1)
+        p0[li] = _pauli_frame_survival(seqs, pauli_error)
+    counts = rng.binomial(n_shots, np.clip(p0, 0.0, 1.0))
+    survival_mean, survival_sem = _survival_stats(counts / n_shots, n_shots)
     return lengths.astype(float), survival_mean, survival_sem
 
 
@@ -192,30 +430,22 @@ def _identity_index(group: np.ndarray, lookup: dict) -> int:
     return _identity_index_cached()
 
 
-def fit_rb(
-    lengths: np.ndarray, survival: np.ndarray, sigma: np.ndarray | None = None
-) -> RBResult:
-    """Fit ``A*p^m+B`` and return p / EPC with covariance-based uncertainty."""
-    lengths = np.asarray(lengths, dtype=float)
-    survival = np.asarray(survival, dtype=float)
+# Physical box for the (A, p, B) fit.
+_RB_BOUNDS = ([0.0, 0.0, 0.0], [1.0, 1.0, 1.0])
 
-    b0 = float(np.min(survival))
-    a0 = float(np.clip(survival[0] - b0, 1e-3, 1.0))
-    p0 = 0.99
 
-    fit = fit_curve(
-        rb_survival_model,
-        lengths,
-        survival,
-        p0=[a0, p0, b0],
-        names=("A", "p", "B"),
-        sigma=sigma,
-        bounds=([0.0, 0.0, 0.0], [1.0, 1.0, 1.0]),
-    )
+def _initial_guess(lengths: np.ndarray, survival: np.ndarray) -> np.ndarray:
+    """``(A, p, B)`` seeds, row-wise on the last axis."""
+    b0 = np.min(survival, axis=-1)
+    a0 = np.clip(survival[..., 0] - b0, 1e-3, 1.0)
+    return np.stack([a0, np.full_like(b0, 0.99), b0], axis=-1)
+
+
+def _rb_result(fit: FitResult, d: int = 2) -> RBResult:
     p = fit.value("p")
     p_err = fit.error("p")
-    epc = epc_from_p(p)
-    epc_err = p_err * 0.5  # EPC = (1-p)/2  =>  d EPC = dp / 2
+    epc = epc_from_p(p, d)
+    epc_err = p_err * (d - 1) / d  # EPC = (1-p)(d-1)/d  =>  d EPC = dp (d-1)/d
     return RBResult(
         p=p,
         p_err=p_err,
@@ -225,3 +455,57 @@ def fit_rb(
         B=fit.value("B"),
         fit=fit,
     )
+
+
+def fit_rb(
+    lengths: np.ndarray,
+    survival: np.ndarray,
+    sigma: np.ndarray | None = None,
+    method: str = "curve_fit",
+    d: int = 2,
+) -> RBResult:
+    """Fit ``A*p^m+B`` and return p / EPC with covariance-based uncertainty.
+
+    ``method="varpro"`` solves ``A``/``B`` in closed form and searches ``p`` alone.
+    ``d`` is the Hilbert-space dimension used for the EPC (4 for two-qubit RB).
+    """
+    lengths = np.asarray(lengths, dtype=float)
+    survival = np.asarray(survival, dtype=float)
+
+    fit = fit_curve(
+        rb_survival_model,
+        lengths,
+        survival,
+        p0=_initial_guess(lengths, survival),
+        names=("A", "p", "B"),
+        sigma=sigma,
+        bounds=_RB_BOUNDS,
+        method=method,
+    )
+    return _rb_result(fit, d)
+
+
+def fit_rb_batch(
+    lengths: np.ndarray,
+    survival: np.ndarray,
+    sigma: np.ndarray | None = None,
+    d: int = 2,
+) -> list[RBResult]:
+    """Batched :func:`fit_rb` over the rows of ``survival`` ``(n_curves, n_lengths)``.
+
+    Curves the lockstep solver could not converge report
+    ``res.fit.converged = False``.
+    """
+    lengths = np.asarray(lengths, dtype=float)
+    survival = np.atleast_2d(np.asarray(survival, dtype=float))
+
+    batch = fit_curve_batch(
+        rb_survival_model,
+        lengths,
+        survival,
+        p0=_initial_guess(lengths, survival),
+        names=("A", "p", "B"),
+        sigma=sigma,
+        bounds=_RB_BOUNDS,
+    )
+    return [_rb_result(batch[i], d) for i in range(len(batch))]
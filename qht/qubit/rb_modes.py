@@ -0,0 +1,294 @@
+"""Interleaved and simultaneous randomized benchmarking.
+
+**Interleaved RB** (IRB) estimates the error of one specific gate ``G``. A
+reference RB experiment and an interleaved one, ``C_1 G C_2 G ... C_m G R``,
+are run on the *same* random Clifford draws, so both curves share the sequence
+randomness. Their decays ``p_ref`` and ``p_int`` give
+
+    r_G = (d - 1) / d * (1 - p_int / p_ref)
+
+and :func:`fit_interleaved_rb` fits both curves jointly (shared SPAM ``A``,
+``B``), propagating the full covariance of ``(p_ref, p_int)`` into ``r_G``.
+
+**Simultaneous RB** drives every qubit of a chip at once with independent
+random sequences. Comparing its per-qubit decay with isolated RB exposes
+crosstalk (addressability errors). The sequences of every qubit and length are
+drawn as one array, composed with the Cayley tables in a single tree
+reduction and propagated through per-qubit noisy PTMs; the survival block is
+fit with :func:`~qht.qubit.randomized_benchmarking.fit_rb_batch`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .models import FitResult, _stack_jac, fit_curve, register_model
+from .ptm import depolarizing_ptm, rotation_ptm, unitary_ptm
+from .randomized_benchmarking import (
+    _cayley_tables,
+    _clifford_group,
+    _compose_sequences,
+    _identity_index_cached,
+    _ptm_survival,
+    _survival_stats,
+)
+
+
+def interleaved_rb_model(
+    x: np.ndarray, A: float, p_ref: float, p_int: float, B: float
+) -> np.ndarray:
+    """Joint reference/interleaved decay on ``x = (lengths, is_interleaved)``."""
+    m, interleaved = x
+    p = np.where(interleaved > 0, p_int, p_ref)
+    return A * np.power(p, m) + B
+
+
+def _interleaved_rb_value_and_jac(x, A, p_ref, p_int, B):
+    m, interleaved = x
+    flag = interleaved > 0
+    p = np.where(flag, p_int, p_ref)
+    pm = np.power(p, m)
+    value = A * pm + B
+    dp = A * m * np.power(p, np.maximum(m - 1, 0))
+    return value, _stack_jac(value, pm, np.where(flag, 0.0, dp), np.where(flag, dp, 0.0), 1.0)
+
+
+register_model(
+    interleaved_rb_model, _interleaved_rb_value_and_jac, ("A", "p_ref", "p_int", "B")
+)
+
+
+@dataclass
+class InterleavedRBResult:
+    """Joint interleaved-RB fit: both decays and the interleaved gate error."""
+
+    p_ref: float
+    p_ref_err: float
+    p_int: float
+    p_int_err: float
+    gate_error: float
+    gate_error_err: float
+    A: float
+    B: float
+    fit: FitResult
+
+    @property
+    def gate_fidelity(self) -> float:
+        return 1.0 - self.gate_error
+
+
+def simulate_interleaved_rb(
+    gate: int,
+    clifford_error: np.ndarray | None = None,
+    gate_error: np.ndarray | None = None,
+    lengths: np.ndarray | None = None,
+    n_sequences: int = 40,
+    n_shots: int = 4096,
+    seed: int | None = None,
+    max_block: int = 1 << 18,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Simulate reference and interleaved RB on shared random sequences.
+
+    Gate-level (PTM) propagation as in
+    :func:`~qht.qubit.randomized_benchmarking.simulate_rb_gate_level`.
+
+    Parameters
+    ----------
+    gate:
+        Index of the interleaved Clifford in the 24-element group.
+    clifford_error, gate_error:
+        Error PTMs following every random/recovery Clifford and every
+        interleaved ``gate`` respectively (``None`` = noiseless).
+
+    Returns
+    -------
+    (lengths, ref_survival, ref_sigma, int_survival, int_sigma)
+    """
+    rng = np.random.default_rng(seed)
+    if lengths is None:
+        lengths = np.unique(np.round(np.geomspace(1, 200, 12)).astype(int))
+    lengths = np.asarray(lengths, dtype=int)
+
+    group, _ = _clifford_group()
+    mult, inv = _cayley_tables()
+    ident = _identity_index_cached()
+    cliffords = unitary_ptm(group)
+    if clifford_error is not None:
+        cliffords = np.matmul(clifford_error, cliffords)
+    g_ptm = unitary_ptm(group[gate])
+    if gate_error is not None:
+        g_ptm = gate_error @ g_ptm
+    # Index 24 is the (noisy) interleaved gate; 0..23 the noisy Cliffords.
+    ptms = np.concatenate([cliffords, g_ptm[None]])
+    n = len(group)
+
+    ref = np.zeros((2, len(lengths)))
+    sem = np.zeros((2, len(lengths)))
+    for li, m in enumerate(lengths):
+        gates = rng.integers(0, n, size=(n_sequences, int(m)))
+        inter = np.full((n_sequences, 2 * int(m)), gate)
+        inter[:, 0::2] = gates
+
+        rec_ref = inv[_compose_sequences(gates, mult, ident)]
+        rec_int = inv[_compose_sequences(inter, mult, ident)]
+        inter[:, 1::2] = n  # PTM slot of the noisy interleaved gate
+        p0 = np.stack(
+            [
+                _ptm_survival(np.concatenate([gates, rec_ref[:, None]], axis=1), ptms, max_block),
+                _ptm_survival(np.concatenate([inter, rec_int[:, None]], axis=1), ptms, max_block),
+            ]
+        )
+        ref[:, li], sem[:, li] = _survival_stats(rng.binomial(n_shots, p0) / n_shots, n_shots)
+
+    return lengths.astype(float), ref[0], sem[0], ref[1], sem[1]
+
+
+def fit_interleaved_rb(
+    lengths: np.ndarray,
+    ref_survival: np.ndarray,
+    ref_sigma: np.ndarray | None,
+    int_survival: np.ndarray,
+    int_sigma: np.ndarray | None,
+    d: int = 2,
+) -> InterleavedRBResult:
+    """Joint fit of reference and interleaved decays with shared ``A``, ``B``.
+
+    ``gate_error_err`` is propagated from the fitted covariance of
+    ``(p_ref, p_int)``, including their correlation through the shared SPAM
+    parameters.
+    """
+    lengths = np.asarray(lengths, dtype=float)
+    x = np.stack(
+        [np.concatenate([lengths, lengths]), np.repeat([0.0, 1.0], lengths.size)]
+    )
+    y = np.concatenate([ref_survival, int_survival])
+    sigma = None
+    if ref_sigma is not None and int_sigma is not None:
+        sigma = np.concatenate([ref_sigma, int_sigma])
+
+    b0 = min(np.min(ref_survival), np.min(int_survival))
+    a0 = np.clip(ref_survival[0] - b0, 1e-3, 1.0)
+    fit = fit_curve(
+        interleaved_rb_model,
+        x,
+        y,
+        p0=[a0, 0.99, 0.99, b0],
+        names=("A", "p_ref", "p_int", "B"),
+        sigma=sigma,
+        bounds=([0.0, 0.0, 0.0, 0.0], [1.0, 1.0, 1.0, 1.0]),
+    )
+
+    p_ref, p_int = fit.value("p_ref"), fit.value("p_int")
+    scale = (d - 1) / d
+    gate_error = scale * (1.0 - p_int / p_ref)
+    grad = np.array([scale * p_int / p_ref**2, -scale / p_ref])
+    cov = fit.pcov[1:3, 1:3]
+    return InterleavedRBResult(
+        p_ref=p_ref,
+        p_ref_err=fit.error("p_ref"),
+        p_int=p_int,
+        p_int_err=fit.error("p_int"),
+        gate_error=gate_error,
+        gate_error_err=float(np.sqrt(grad @ cov @ grad)),
+        A=fit.value("A"),
+        B=fit.value("B"),
+        fit=fit,
+    )
+
+
+def _ragged_ptm_survival(slots: np.ndarray, start: np.ndarray, ptms: np.ndarray) -> np.ndarray:
+    """|0> survival of right-aligned sequences of different lengths.
+
+    Row ``r`` applies ``ptms[slots[r, k]]`` for ``k >= start[r]``; earlier
+    positions are padding and are skipped. The Pauli vectors of all rows
+    advance one position at a time, and with the rows sorted by ``start`` the
+    rows that have begun are a prefix, so padding costs no arithmetic.
+    """
+    order = np.argsort(start, kind="stable")
+    rows = slots[order]
+    begun = np.searchsorted(start[order], np.arange(slots.shape[1]), side="right")
+    state = np.zeros((len(rows), 4))
+    state[:, [0, 3]] = 1.0  # |0> = (1, 0, 0, 1)
+    for k, n in enumerate(begun):
+        state[:n] = np.matmul(ptms[rows[:n, k]], state[:n, :, None])[..., 0]
+    p0 = np.empty(len(rows))
+    p0[order] = 0.5 * (1.0 + state[:, 3])
+    return np.clip(p0, 0.0, 1.0)
+
+
+def simulate_simultaneous_rb(
+    p_depol: np.ndarray,
+    crosstalk: float | np.ndarray = 1.0,
+    lengths: np.ndarray | None = None,
+    n_sequences: int = 40,
+    n_shots: int = 4096,
+    seed: int | None = None,
+    crosstalk_angle: float | np.ndarray = 0.0,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Simultaneous single-qubit RB on ``n_qubits`` qubits.
+
+    Every (length, qubit, sequence) gets its own random Cliffords, drawn as
+    one ``(n_lengths, n_qubits, n_sequences, max(lengths))`` block in which
+    each sequence is right-aligned behind identity padding. One Cayley-table
+    reduction gives every recovery gate, and all sequences are propagated
+    together through per-qubit noisy Clifford PTMs (cf.
+    :func:`~qht.qubit.randomized_benchmarking.simulate_rb_gate_level`).
+
+    Parameters
+    ----------
+    p_depol:
+        Isolated per-Clifford depolarizing parameter of each qubit, ``(n_qubits,)``.
+    crosstalk:
+        Extra depolarizing factor per Clifford each qubit suffers while its
+        neighbours are driven (1 = no crosstalk); the simultaneous decay is
+        ``p_depol * crosstalk``.
+    crosstalk_angle:
+        Coherent Z rotation (rad) each qubit picks up per Clifford from its
+        driven neighbours (e.g. residual ZZ coupling); scalar or
+        ``(n_qubits,)``. Unlike depolarizing noise it does not commute with
+        the Cliffords, so the survival depends on the drawn sequence.
+
+    Returns
+    -------
+    (lengths, survival, sigma):
+        ``survival``/``sigma`` have shape ``(n_qubits, n_lengths)``; pass them
+        to :func:`~qht.qubit.randomized_benchmarking.fit_rb_batch`.
+    """
+    rng = np.random.default_rng(seed)
+    if lengths is None:
+        lengths = np.unique(np.round(np.geomspace(1, 200, 12)).astype(int))
+    lengths = np.asarray(lengths, dtype=int)
+    p_eff = np.atleast_1d(np.asarray(p_depol, dtype=float)) * np.asarray(crosstalk, dtype=float)
+    n_qubits = p_eff.size
+    angle = np.broadcast_to(np.asarray(crosstalk_angle, dtype=float), (n_qubits,))
+
+    group, _ = _clifford_group()
+    mult, inv = _cayley_tables()
+    ident = _identity_index_cached()
+    n = len(group)
+    # (n_qubits, n, 4, 4) noisy Cliffords, flattened so qubit q's table starts at q * n.
+    errors = np.matmul(
+        np.stack([depolarizing_ptm(p) for p in p_eff]),
+        np.stack([rotation_ptm((0.0, 0.0, 1.0), a) for a in angle]),
+    )
+    ptms = np.matmul(errors[:, None], unitary_ptm(group)).reshape(-1, 4, 4)
+
+    m_max = int(lengths.max(initial=0))
+    gates = rng.integers(0, n, size=(len(lengths), n_qubits, n_sequences, m_max))
+    start = m_max - lengths[:, None, None, None]
+    gates = np.where(np.arange(m_max) >= start, gates, ident)
+    recovery = inv[_compose_sequences(gates, mult, ident)]
+    slots = np.concatenate([gates, recovery[..., None]], axis=-1)
+    slots += n * np.arange(n_qubits)[:, None, None]
+
+    p0 = _ragged_ptm_survival(
+        slots.reshape(-1, m_max + 1),
+        np.broadcast_to(start[..., 0], slots.shape[:-1]).ravel(),
+        ptms,
+    )
+    survival, sigma = _survival_stats(
+        rng.binomial(n_shots, p0.reshape(slots.shape[:-1])) / n_shots, n_shots
+    )
+    return lengths.astype(float), survival.T, sigma.T
@@ -15,10 +15,20 @@ binomial shot noise -- exactly what is fit on real hardware.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Iterator
 
 import numpy as np
 
-from .models import FitResult, exp_decay, fit_curve, sample_shots
+from .models import (
+    FitResult,
+    exp_decay,
+    fit_curve,
+    fit_curve_batch,
+    qubit_rngs,
+    sample_shots,
+)
+from .prony import decay_guess, prony_fit
+from .template import DecayTemplate
 
 
 @dataclass
@@ -36,9 +46,12 @@ class T1Result:
         return self.T1 * 1e6
 
 
-def t1_delays(t1_true: float, n_points: int = 40, span: float = 4.0) -> np.ndarray:
-    """A sensible delay sweep: 0 out to ``span`` * T1 (a few e-foldings)."""
-    return np.linspace(0.0, span * t1_true, n_points)
+def t1_delays(t1_true: float | np.ndarray, n_points: int = 40, span: float = 4.0) -> np.ndarray:
+    """A sensible delay sweep: 0 out to ``span`` * T1 (a few e-foldings).
+
+    An array of ``t1_true`` gives one sweep per row, shape ``(n, n_points)``.
+    """
+    return np.linspace(0.0, span * np.asarray(t1_true, dtype=float), n_points, axis=-1)
 
 
 def simulate_t1(
@@ -78,34 +91,142 @@ def simulate_t1(
     return delays, p_hat, sigma
 
 
+def simulate_t1_batch(
+    t1_true: np.ndarray,
+    delays: np.ndarray | None = None,
+    A: float | np.ndarray = 0.98,
+    C: float | np.ndarray = 0.02,
+    n_shots: int | np.ndarray = 2048,
+    n_points: int = 40,
+    seed: int | None = None,
+    independent_streams: bool = True,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Simulate a whole chip of T1 curves at once.
+
+    ``t1_true`` (and optionally ``A``, ``C``) are per-qubit vectors; ``delays``
+    is shared ``(n_points,)`` or per-qubit ``(n_qubits, n_points)`` and
+    defaults to each qubit's own :func:`t1_delays` sweep. Returns
+    ``(delays, p_hat, sigma)`` with ``p_hat``/``sigma`` of shape
+    ``(n_qubits, n_points)``.
+
+    With ``independent_streams`` (the default) every qubit draws from its own
+    :func:`~qht.qubit.models.qubit_rngs` stream, so row ``i`` is reproducible
+    on its own and equals :func:`simulate_t1` seeded with that stream.
+    Otherwise the whole block is one binomial draw from ``default_rng(seed)``.
+    """
+    t1 = np.atleast_1d(np.asarray(t1_true, dtype=float))
+    n = t1.size
+    if delays is None:
+        delays = t1_delays(t1, n_points=n_points)
+    delays = np.asarray(delays, dtype=float)
+    A = np.broadcast_to(A, (n,))[:, None]
+    C = np.broadcast_to(C, (n,))[:, None]
+    p_true = exp_decay(delays, A, t1[:, None], C)
+    rng = qubit_rngs(seed, n) if independent_streams else np.random.default_rng(seed)
+    p_hat, sigma = sample_shots(p_true, n_shots, rng)
+    return delays, p_hat, sigma
+
+
+def simulate_t1_stream(
+    t1_true: float,
+    delays: np.ndarray | None = None,
+    A: float = 0.98,
+    C: float = 0.02,
+    batch_shots: int = 128,
+    max_shots: int = 2048,
+    n_points: int = 40,
+    seed: int | None = None,
+) -> Iterator[tuple[np.ndarray, int]]:
+    """Stream a T1 sweep as it would arrive from hardware.
+
+    Each item is ``(counts, batch_shots)``: the excited-state counts at every
+    delay from one more pass of ``batch_shots`` single shots. At most
+    ``max_shots`` shots per delay are produced, so exhausting the stream is the
+    same experiment as :func:`simulate_t1` with ``n_shots=max_shots``.
+    """
+    rng = np.random.default_rng(seed)
+    if delays is None:
+        delays = t1_delays(t1_true, n_points=n_points)
+    p_true = np.clip(exp_decay(np.asarray(delays, dtype=float), A, t1_true, C), 0.0, 1.0)
+    for _ in range(max_shots // batch_shots):
+        yield rng.binomial(batch_shots, p_true), batch_shots
+
+
+# Physical box for the (A, T1, C) fit.
+_T1_BOUNDS = ([0.0, 1e-12, -0.5], [1.5, np.inf, 1.0])
+
+
+def _t1_result(fit: FitResult) -> T1Result:
+    return T1Result(
+        T1=fit.value("T1"),
+        T1_err=fit.error("T1"),
+        A=fit.value("A"),
+        C=fit.value("C"),
+        fit=fit,
+    )
+
+
 def fit_t1(
-    delays: np.ndarray, p_hat: np.ndarray, sigma: np.ndarray | None = None
+    delays: np.ndarray,
+    p_hat: np.ndarray,
+    sigma: np.ndarray | None = None,
+    method: str = "curve_fit",
+    template: DecayTemplate | None = None,
+    p0: np.ndarray | None = None,
 ) -> T1Result:
-    """Fit ``A*exp(-t/T1)+C`` and return T1 with covariance-based uncertainty."""
+    """Fit ``A*exp(-t/T1)+C`` and return T1 with covariance-based uncertainty.
+
+    ``method="varpro"`` solves ``A`` and ``C`` in closed form and searches only
+    T1 (see :func:`fit_curve`); the error bars are unchanged.
+    ``method="prony"`` skips the iterative fit entirely and returns the
+    closed-form linearized-Prony estimate (:func:`.prony.prony_fit`) with
+    approximate, linearised error bars -- a fixed-cost fast path.
+    A :class:`~qht.qubit.template.DecayTemplate` built for ``delays`` seeds the
+    fit from its lookup table, so the solver only refines locally; an explicit
+    ``p0`` (e.g. the ``popt`` of a previous fit) warm-starts it instead.
+    """
     delays = np.asarray(delays, dtype=float)
     p_hat = np.asarray(p_hat, dtype=float)
-
-    # Robust initial guesses from the data shape.
-    c0 = float(np.min(p_hat))
-    a0 = float(np.clip(p_hat[0] - c0, 1e-3, 1.0))
-    # Estimate T1 from where the curve falls to 1/e of its initial contrast.
-    target = c0 + a0 / np.e
-    idx = int(np.argmin(np.abs(p_hat - target)))
-    t1_0 = max(delays[idx], (delays[-1] - delays[0]) / 4.0, 1e-9)
+    if method == "prony":
+        return _t1_result(prony_fit(delays, p_hat, sigma))
 
     fit = fit_curve(
         exp_decay,
         delays,
         p_hat,
-        p0=[a0, t1_0, c0],
+        p0=decay_guess(delays, p_hat, _T1_BOUNDS, template) if p0 is None else p0,
         names=("A", "T1", "C"),
         sigma=sigma,
-        bounds=([0.0, 1e-12, -0.5], [1.5, np.inf, 1.0]),
+        bounds=_T1_BOUNDS,
+        method=method,
     )
-    return T1Result(
-        T1=fit.value("T1"),
-        T1_err=fit.error("T1"),
-        A=fit.value("A"),
-        C=fit.value("C"),
-        fit=fit,
+    return _t1_result(fit)
+
+
+def fit_t1_batch(
+    delays: np.ndarray,
+    p_hat: np.ndarray,
+    sigma: np.ndarray | None = None,
+    template: DecayTemplate | None = None,
+) -> list[T1Result]:
+    """Fit a batch of T1 curves in lockstep (see :func:`fit_curve_batch`).
+
+    ``p_hat`` (and ``sigma``) have shape ``(n_curves, n_points)``; ``delays`` is
+    shared ``(n_points,)`` or per-curve. Returns one :class:`T1Result` per row,
+    equivalent to calling :func:`fit_t1` on each curve. With a ``template``
+    the whole block is seeded by one score-table matmul. Curves the lockstep
+    solver could not converge report ``res.fit.converged = False``.
+    """
+    delays = np.asarray(delays, dtype=float)
+    p_hat = np.atleast_2d(np.asarray(p_hat, dtype=float))
+
+    batch = fit_curve_batch(
+        exp_decay,
+        delays,
+        p_hat,
+        p0=decay_guess(delays, p_hat, _T1_BOUNDS, template),
+        names=("A", "T1", "C"),
+        sigma=sigma,
+        bounds=_T1_BOUNDS,
     )
+    return [_t1_result(batch[i]) for i in range(len(batch))]
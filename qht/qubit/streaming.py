@@ -0,0 +1,132 @@
+"""Streaming T1 / Ramsey estimators with early stopping on a target error bar.
+
+A fixed-``n_shots`` sweep spends the whole shot budget even when the error bar
+was already good enough half-way through. The estimators here instead accept
+shot batches as they arrive from the instrument, keep only the sufficient
+statistics of a binomial readout -- excited counts and shots per delay -- and
+refit after every batch, warm-starting the solver from the previous
+:class:`~qht.qubit.models.FitResult` so each refit is a few cheap iterations.
+Acquisition stops as soon as the relative error of the decay constant drops
+below ``target_rel_err``.
+
+Typical use with a (simulated or hardware) shot stream::
+
+    est = StreamingT1Estimator(delays, target_rel_err=0.02)
+    result = est.run(simulate_t1_stream(50e-6, delays=delays))
+    est.total_shots  # shots actually spent
+"""
+
+from __future__ import annotations
+
+import abc
+from typing import Iterable
+
+import numpy as np
+
+from .models import _binomial_sigma
+from .ramsey import RamseyResult, fit_ramsey
+from .relaxation import T1Result, fit_t1
+
+
+class _StreamingEstimator(abc.ABC):
+    """Shared accumulation / warm-start / stopping logic."""
+
+    def __init__(
+        self, delays: np.ndarray, target_rel_err: float = 0.02, method: str = "curve_fit"
+    ):
+        self.delays = np.asarray(delays, dtype=float)
+        self.target_rel_err = float(target_rel_err)
+        self.method = method
+        self.counts = np.zeros(self.delays.shape, dtype=np.int64)
+        self.shots = np.zeros(self.delays.shape, dtype=np.int64)
+        self.result = None
+        self.n_fits = 0
+
+    @property
+    def total_shots(self) -> int:
+        """Shots spent so far, summed over all delay points."""
+        return int(np.sum(self.shots))
+
+    @property
+    def p_hat(self) -> np.ndarray:
+        return self.counts / np.maximum(self.shots, 1)
+
+    @property
+    def sigma(self) -> np.ndarray:
+        return _binomial_sigma(self.p_hat, np.maximum(self.shots, 1))
+
+    @property
+    def rel_err(self) -> float:
+        """Relative 1-sigma error of the decay constant (``inf`` before a fit)."""
+        if self.result is None:
+            return np.inf
+        value, err = self._decay(self.result)
+        rel = abs(err / value) if value else np.inf
+        return rel if np.isfinite(rel) else np.inf
+
+    @property
+    def done(self) -> bool:
+        return self.rel_err < self.target_rel_err
+
+    def update(self, counts: np.ndarray, n_shots: np.ndarray | int):
+        """Fold in one batch of excited ``counts`` out of ``n_shots`` per delay.
+
+        ``n_shots`` may be a scalar or per-delay (adaptive schedules). Refits
+        once every delay has data and returns the current result, or ``None``
+        while there is not yet enough data to fit.
+        """
+        self.counts += np.asarray(counts, dtype=np.int64)
+        self.shots += np.broadcast_to(np.asarray(n_shots, dtype=np.int64), self.shots.shape)
+        if np.any(self.shots == 0):
+            return self.result
+        # Warm-start only from a fit that was itself well conditioned; a wild
+        # first fit on a handful of shots is better forgotten.
+        p0 = self.result.fit.popt if np.isfinite(self.rel_err) else None
+        try:
+            self.result = self._fit(p0)
+        except RuntimeError:
+            if p0 is None:
+                return self.result
+            self.result = self._fit(None)
+        self.n_fits += 1
+        return self.result
+
+    def run(self, stream: Iterable[tuple[np.ndarray, np.ndarray | int]]):
+        """Consume ``(counts, n_shots)`` batches until :attr:`done` or exhausted."""
+        for counts, n_shots in stream:
+            self.update(counts, n_shots)
+            if self.done:
+                break
+        return self.result
+
+    @abc.abstractmethod
+    def _fit(self, p0):
+        """Fit the accumulated data, warm-started from ``p0`` (``None``: default guess)."""
+
+    @abc.abstractmethod
+    def _decay(self, result) -> tuple[float, float]:
+        """Decay constant and its 1-sigma error from a fit result."""
+
+
+class StreamingT1Estimator(_StreamingEstimator):
+    """Incremental :func:`~qht.qubit.relaxation.fit_t1`; stops on ``T1_err/T1``."""
+
+    result: T1Result | None
+
+    def _fit(self, p0) -> T1Result:
+        return fit_t1(self.delays, self.p_hat, self.sigma, method=self.method, p0=p0)
+
+    def _decay(self, result: T1Result) -> tuple[float, float]:
+        return result.T1, result.T1_err
+
+
+class StreamingRamseyEstimator(_StreamingEstimator):
+    """Incremental :func:`~qht.qubit.ramsey.fit_ramsey`; stops on ``T2_err/T2``."""
+
+    result: RamseyResult | None
+
+    def _fit(self, p0) -> RamseyResult:
+        return fit_ramsey(self.delays, self.p_hat, self.sigma, method=self.method, p0=p0)
+
+    def _decay(self, result: RamseyResult) -> tuple[float, float]:
+        return result.T2, result.T2_err
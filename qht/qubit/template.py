@@ -0,0 +1,135 @@
+"""Precompiled fit templates for fixed delay grids.
+
+In production the delay axis of a T1 or echo sweep is the same run after run,
+so most of the work of a fit -- evaluating ``exp(-t/T)`` on that grid and
+solving the small linear problem for the amplitude and offset -- can be done
+once. A :class:`DecayTemplate` holds, for a dense log-spaced grid of candidate
+time constants ``T_j``:
+
+- the (weighted) basis columns ``e_j = exp(-t / T_j)``, and
+- the inverse 2x2 Gram matrices of ``[e_j, 1]``, i.e. the projection needed
+  to solve for ``A`` and ``C`` given ``T_j``.
+
+For a batch ``Y`` of curves the explained sum of squares of every candidate is
+then ``b_j^T G_j^-1 b_j`` with ``b_j = [e_j . y, 1 . y]``; the whole
+``(n_curves, n_candidates)`` score table costs one matrix multiply. The best
+candidate is refined by a parabola through its neighbours in ``log T`` and
+(optionally) polished by a few lockstep Levenberg-Marquardt iterations of
+:func:`~qht.qubit.models.fit_curve_batch` started right next to the optimum.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from .models import BatchFitResult, exp_decay, fit_curve_batch
+
+
+class DecayTemplate:
+    """Scoring basis for ``A*exp(-t/T)+C`` on one fixed delay grid.
+
+    Parameters
+    ----------
+    delays:
+        The delay grid every scored curve is sampled on, shape ``(m,)``.
+    sigma:
+        Optional nominal per-point errors used to weight the score (e.g. the
+        binomial error at the planned shot count). Refinement fits use each
+        curve's own ``sigma``.
+    t_min, t_max:
+        Range of candidate time constants. Defaults span from a tenth of the
+        smallest delay step to ten times the sweep length.
+    n_basis:
+        Number of log-spaced candidates.
+    """
+
+    def __init__(
+        self,
+        delays: np.ndarray,
+        sigma: np.ndarray | None = None,
+        t_min: float | None = None,
+        t_max: float | None = None,
+        n_basis: int = 256,
+    ):
+        self.delays = np.asarray(delays, dtype=float)
+        span = float(self.delays[-1] - self.delays[0])
+        step = float(np.min(np.diff(self.delays)))
+        t_min = 0.1 * step if t_min is None else t_min
+        t_max = 10.0 * span if t_max is None else t_max
+        self.taus = np.geomspace(t_min, t_max, n_basis)
+
+        w = np.ones_like(self.delays) if sigma is None else 1.0 / np.asarray(sigma, dtype=float)
+        self._w = w
+        basis = np.exp(-self.delays[:, None] / self.taus[None, :]) * w[:, None]
+        self._basis = basis  # (m, J), weighted columns e_j
+        gram = np.empty((n_basis, 2, 2))
+        gram[:, 0, 0] = np.sum(basis * basis, axis=0)
+        gram[:, 0, 1] = gram[:, 1, 0] = basis.T @ w
+        gram[:, 1, 1] = w @ w
+        self._ginv = np.linalg.pinv(gram, hermitian=True)
+
+    def matches(self, delays: np.ndarray) -> bool:
+        """True if ``delays`` is the grid this template was built for."""
+        delays = np.asarray(delays, dtype=float)
+        return delays.shape == self.delays.shape and np.allclose(delays, self.delays)
+
+    def score(self, p_hat: np.ndarray) -> np.ndarray:
+        """Weighted residual sum of squares for every (curve, candidate T).
+
+        ``p_hat`` has shape ``(n, m)``; the result is ``(n, n_basis)``.
+        """
+        yw = np.atleast_2d(np.asarray(p_hat, dtype=float)) * self._w
+        b1 = yw @ self._basis  # (n, J): the single large matmul
+        b2 = yw @ self._w  # (n,)
+        g = self._ginv
+        explained = g[:, 0, 0] * b1**2 + 2.0 * g[:, 0, 1] * b1 * b2[:, None] + g[:, 1, 1] * b2[:, None] ** 2
+        return np.sum(yw**2, axis=1, keepdims=True) - explained
+
+    def estimate(self, p_hat: np.ndarray) -> np.ndarray:
+        """``(A, T, C)`` per curve from the score table, shape ``(n, 3)``."""
+        y = np.atleast_2d(np.asarray(p_hat, dtype=float))
+        chi2 = self.score(y)
+        n_basis = self.taus.size
+        j = np.clip(np.argmin(chi2, axis=1), 1, n_basis - 2)
+        rows = np.arange(y.shape[0])
+        c_lo, c_0, c_hi = chi2[rows, j - 1], chi2[rows, j], chi2[rows, j + 1]
+        # Vertex of the parabola through the three neighbours (uniform in log T).
+        curv = c_lo - 2.0 * c_0 + c_hi
+        with np.errstate(divide="ignore", invalid="ignore"):
+            shift = np.where(curv > 0, 0.5 * (c_lo - c_hi) / curv, 0.0)
+        shift = np.clip(shift, -1.0, 1.0)
+        log_t = np.log(self.taus)
+        T = np.exp(log_t[j] + shift * (log_t[1] - log_t[0]))
+
+        w2 = self._w**2
+        e = np.exp(-self.delays[None, :] / T[:, None])
+        see = np.sum(w2 * e * e, axis=1)
+        se1 = e @ w2
+        s11 = np.sum(w2)
+        sey = np.sum(w2 * e * y, axis=1)
+        s1y = y @ w2
+        det = see * s11 - se1**2
+        A = (s11 * sey - se1 * s1y) / det
+        C = (see * s1y - se1 * sey) / det
+        return np.column_stack([A, T, C])
+
+    def fit(
+        self,
+        p_hat: np.ndarray,
+        sigma: np.ndarray | None = None,
+        names: Sequence[str] = ("A", "T1", "C"),
+        bounds: tuple | None = None,
+    ) -> BatchFitResult:
+        """Template estimate polished by a local batched least-squares refine."""
+        p_hat = np.atleast_2d(np.asarray(p_hat, dtype=float))
+        return fit_curve_batch(
+            exp_decay,
+            self.delays,
+            p_hat,
+            p0=self.estimate(p_hat),
+            names=names,
+            sigma=sigma,
+            bounds=bounds,
+        )
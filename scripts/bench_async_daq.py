@@ -0,0 +1,68 @@
+"""Benchmark concurrent AsyncDAQ reads and control-loop timing vs sensor count.
+
+For each bank size, every sensor is a LatencySensor (a Sensor behind a link
+with ``--latency`` seconds of query latency). Reports the time to read the
+bank one sensor after another (what DAQ.read_all does) and concurrently with
+AsyncDAQ, the resulting throughput, and the period jitter of a
+``--period`` control loop run by AsyncDAQ.run.
+
+Run from the repo root::
+
+    python scripts/bench_async_daq.py --latency 0.02 --period 0.1 --ticks 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from qht.cryocooler.sensor import Sensor  # noqa: E402
+from qht.daq.async_daq import AsyncDAQ, LatencySensor  # noqa: E402
+
+
+def _bank(n, latency):
+    return [LatencySensor(Sensor(i, fail_rate=0.0), latency=latency, seed=i) for i in range(n)]
+
+
+async def _sequential(sensors):
+    t0 = time.perf_counter()
+    for sensor in sensors:
+        await sensor.read(0.0)
+    return time.perf_counter() - t0
+
+
+async def _concurrent(daq):
+    t0 = time.perf_counter()
+    await daq.read_all(current_time=0.0)
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--period", type=float, default=0.1)
+    parser.add_argument("--ticks", type=int, default=50)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 4, 16, 64, 256, 1024])
+    args = parser.parse_args()
+
+    print(f"{'sensors':>8s}{'sequential':>13s}{'concurrent':>13s}{'reads/s':>11s}"
+          f"{'jitter':>10s}{'max late':>10s}{'overruns':>10s}")
+    for n in args.sizes:
+        sensors = _bank(n, args.latency)
+        daq = AsyncDAQ(sensors, timeout=args.period)
+        t_seq = asyncio.run(_sequential(sensors[:min(n, 16)])) * n / min(n, 16)  # extrapolated past 16
+        t_con = asyncio.run(_concurrent(daq))
+        report = asyncio.run(daq.run(lambda t, r, v: None, period=args.period, n_ticks=args.ticks))
+        print(f"{n:8d}{t_seq * 1e3:10.1f} ms{t_con * 1e3:10.1f} ms{n / t_con:11.0f}"
+              f"{report.jitter * 1e3:7.2f} ms{report.lateness.max() * 1e3:7.2f} ms{report.overruns:10d}")
+
+
+if __name__ == "__main__":
+    main()
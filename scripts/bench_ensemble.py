@@ -0,0 +1,83 @@
+"""Benchmark Monte Carlo closed-loop ensembles: serial scalar loops vs lockstep arrays.
+
+Each member is a ThermalModel + PID + Sensor loop with randomly drawn thermal
+mass, heat leak and sensor noise. The serial path runs the scalar classes one
+member at a time (timed on ``--serial-members`` and scaled linearly); the
+ensemble path advances all members together with :func:`simulate_ensemble`.
+
+Run from the repo root::
+
+    python scripts/bench_ensemble.py --members 10000 --steps 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import numpy as np  # noqa: E402
+
+from qht.cryocooler.ensemble import PIDArray, ThermalModelArray, simulate_ensemble  # noqa: E402
+from qht.cryocooler.pid import PID  # noqa: E402
+from qht.cryocooler.sensor import Sensor, SensorBank  # noqa: E402
+from qht.cryocooler.thermal_model import ThermalModel  # noqa: E402
+
+GAINS = dict(kp=-2.0, ki=-0.1, kd=0.0, setpoint=4.0, output_limits=(0, 2))
+
+
+def _serial(mass, leak, noise, n_steps, dt):
+    for m, h, s in zip(mass, leak, noise):
+        model = ThermalModel(initial_temp=4.2, thermal_mass=m, heat_leak_coefficient=h)
+        sensor = Sensor(0, base_temp=4.2, noise_level=s, response_time=0.5, fail_rate=0.0)
+        pid = PID(**GAINS)
+        for step in range(n_steps):
+            sensor.base_temp = model.update(dt)
+            reading = sensor.read(current_time=step * dt)
+            model.set_cooling_power(pid.update(reading, current_time=step * dt))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=10_000)
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--serial-members", type=int, default=20)
+    args = parser.parse_args()
+
+    k, dt = args.members, 0.1
+    rng = np.random.default_rng(0)
+    mass = rng.uniform(500, 1500, k)
+    leak = rng.uniform(0.0005, 0.002, k)
+    noise = rng.uniform(0.001, 0.01, k)
+
+    n = min(args.serial_members, k)
+    t0 = time.perf_counter()
+    _serial(mass[:n], leak[:n], noise[:n], args.steps, dt)
+    t_serial = (time.perf_counter() - t0) * k / n
+
+    t0 = time.perf_counter()
+    res = simulate_ensemble(
+        ThermalModelArray(k, initial_temp=4.2, thermal_mass=mass, heat_leak_coefficient=leak),
+        PIDArray(k, **GAINS),
+        n_steps=args.steps,
+        dt=dt,
+        sensors=SensorBank(k, base_temp=4.2, noise_level=noise, response_time=0.5, fail_rate=0.0, seed=1),
+        dtype=np.float32,
+    )
+    metrics = res.metrics(4.0)
+    t_ensemble = time.perf_counter() - t0
+
+    print(f"{k} members x {args.steps} steps")
+    print(f"  serial (extrapolated from {n}): {t_serial:8.1f} s")
+    print(f"  ensemble:                      {t_ensemble:8.2f} s   ({t_serial / t_ensemble:.0f}x)")
+    sse = metrics["steady_state_error"]
+    print(f"  steady-state error: median {np.median(sse):+.4f} K, 99th pct |e| {np.percentile(np.abs(sse), 99):.4f} K")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark the batched Levenberg-Marquardt engine against the per-curve loop.
+
+Simulates a chip's worth of shot-noisy T1 curves (one per qubit, spread of
+injected T1), then fits them twice: serially with :func:`fit_t1` (one
+``curve_fit`` call per curve), in lockstep with :func:`fit_t1_batch`, and in
+lockstep again seeded from a precompiled :class:`DecayTemplate`. Prints
+wall time, speedup and the worst disagreement in units of the fitted error bar.
+
+Run from the repo root::
+
+    python scripts/bench_fit_batch.py --curves 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import numpy as np  # noqa: E402
+
+from qht.qubit.relaxation import fit_t1, fit_t1_batch, simulate_t1  # noqa: E402
+from qht.qubit.template import DecayTemplate  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--curves", type=int, default=1000)
+    parser.add_argument("--points", type=int, default=40)
+    parser.add_argument("--shots", type=int, default=2048)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    t1s = rng.uniform(20e-6, 120e-6, args.curves)
+    delays = np.linspace(0.0, 400e-6, args.points)
+    rows = [
+        simulate_t1(t1, delays=delays, n_shots=args.shots, seed=i)
+        for i, t1 in enumerate(t1s)
+    ]
+    p_hat = np.array([r[1] for r in rows])
+    sigma = np.array([r[2] for r in rows])
+
+    t0 = time.perf_counter()
+    serial = [fit_t1(delays, p_hat[i], sigma[i]) for i in range(args.curves)]
+    t_serial = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    batched = fit_t1_batch(delays, p_hat, sigma)
+    t_batch = time.perf_counter() - t0
+
+    template = DecayTemplate(delays)
+    t0 = time.perf_counter()
+    templated = fit_t1_batch(delays, p_hat, sigma, template=template)
+    t_template = time.perf_counter() - t0
+
+    dev = max(abs(b.T1 - s.T1) / s.T1_err for b, s in zip(batched, serial))
+    print(f"curves           : {args.curves} x {args.points} points")
+    print(f"per-curve loop   : {t_serial * 1e3:9.1f} ms")
+    print(f"batched LM       : {t_batch * 1e3:9.1f} ms")
+    print(f"speedup          : {t_serial / t_batch:9.1f} x")
+    print(f"template + LM    : {t_template * 1e3:9.1f} ms")
+    print(f"max |dT1| / sigma: {dev:9.2e}")
+    dev = max(abs(b.T1 - s.T1) / s.T1_err for b, s in zip(templated, serial))
+    print(f"  (template)     : {dev:9.2e}")
+
+
+if __name__ == "__main__":
+    main()
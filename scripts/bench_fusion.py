@@ -0,0 +1,56 @@
+"""Benchmark the per-step cost of Kalman sensor fusion against sensor count.
+
+Times ``KalmanFusion.update`` on one masked SensorBank read for growing bank
+sizes, next to the old ``sum(readings) / len(readings)`` over the valid
+readings as a Python list (what ``run_test_cycle`` used to compute).
+
+Run from the repo root::
+
+    python scripts/bench_fusion.py --steps 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import numpy as np  # noqa: E402
+
+from qht.cryocooler.fusion import KalmanFusion  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=20_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'sensors':>8s}{'list mean':>14s}{'fusion':>14s}")
+    for n in (4, 16, 64, 256, 1024):
+        readings = 4.0 + rng.normal(0.0, 0.01, (64, n))
+        valid = rng.random((64, n)) > 0.01
+        readings[~valid] = np.nan
+        lists = [r[v].tolist() for r, v in zip(readings, valid)]
+
+        t0 = time.perf_counter()
+        for i in range(args.steps):
+            values = lists[i % 64]
+            sum(values) / len(values)
+        t_mean = (time.perf_counter() - t0) / args.steps
+
+        fusion = KalmanFusion(np.full(n, 1e-4), common_variance=2.5e-4)
+        t0 = time.perf_counter()
+        for i in range(args.steps):
+            fusion.update(readings[i % 64], valid[i % 64])
+        t_fused = (time.perf_counter() - t0) / args.steps
+        print(f"{n:8d}{t_mean * 1e6:11.2f} us{t_fused * 1e6:11.2f} us")
+
+
+if __name__ == "__main__":
+    main()
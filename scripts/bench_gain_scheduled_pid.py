@@ -0,0 +1,89 @@
+"""Benchmark the per-step cost of gain-scheduled PID control.
+
+Compares the pattern ``PIDTestScenario`` used to follow -- look up the tier
+gains and construct a fresh :class:`PID` every step (which also discards the
+integrator state) -- with one :class:`GainScheduledPID` whose ``update``
+interpolates the gains from its precomputed table. The plain fixed-gain
+``PID.update`` (NumPy ``clip`` on scalars) is shown for reference.
+
+Note that the old pattern is only cheap because a freshly constructed PID
+returns 0 from its first ``update`` without computing anything: it never
+actually applied control.
+
+Run from the repo root::
+
+    python scripts/bench_gain_scheduled_pid.py --steps 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import numpy as np  # noqa: E402
+
+from qht.cryocooler.pid import PID, GainScheduledPID  # noqa: E402
+
+
+def _tier_gains(temperature):
+    temp_diff = abs(temperature - 4.0)
+    if temp_diff > 1.0:
+        return 1.0, 0.2, 0.3
+    elif temp_diff > 0.5:
+        return 0.7, 0.1, 0.2
+    return 0.5, 0.05, 0.1
+
+
+def _per_step(fn, temps) -> float:
+    t0 = time.perf_counter()
+    fn(temps)
+    return (time.perf_counter() - t0) / len(temps)
+
+
+def _new_pid_each_step(temps):
+    for t, temp in enumerate(temps):
+        kp, ki, kd = _tier_gains(temp)
+        PID(kp=kp, ki=ki, kd=kd, setpoint=4.0, output_limits=(0, 2)).update(temp, current_time=t * 0.1)
+
+
+def _fixed_pid(temps):
+    pid = PID(kp=0.5, ki=0.05, kd=0.1, setpoint=4.0, output_limits=(0, 2))
+    for t, temp in enumerate(temps):
+        pid.update(temp, current_time=t * 0.1)
+
+
+def _scheduled_pid(temps):
+    pid = GainScheduledPID(
+        (0.25, 0.75, 1.25), ((0.5, 0.05, 0.1), (0.7, 0.1, 0.2), (1.0, 0.2, 0.3)),
+        setpoint=4.0, output_limits=(0, 2),
+    )
+    for t, temp in enumerate(temps):
+        pid.update(temp, current_time=t * 0.1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=200_000)
+    args = parser.parse_args()
+
+    temps = (4.0 + np.random.default_rng(0).normal(0.0, 0.7, args.steps)).tolist()
+    rows = [
+        ("new PID per step (old scenario)", _new_pid_each_step),
+        ("PID.update, fixed gains", _fixed_pid),
+        ("GainScheduledPID.update", _scheduled_pid),
+    ]
+    base = None
+    for name, fn in rows:
+        cost = _per_step(fn, temps)
+        base = base or cost
+        print(f"{name:34s}{cost * 1e6:8.2f} us/step{base / cost:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark RB sequence generation: per-gate matrix lookups vs Cayley-table gathers.
+
+The legacy path composes every random Clifford with :func:`_compose_index`
+(3x3 matmul, rounding, tuple key, dict lookup) in Python loops. The table path
+draws a whole ``(n_sequences, length)`` block and reduces it with
+:func:`_compose_sequences` (one 24x24 table gather per tree level). The legacy
+path is timed on ``--legacy-sequences`` sequences and scaled linearly to the
+full count, since running it in full at length 5000 takes minutes.
+
+Both paths time sequence generation alone (:func:`_random_sequences`: draw,
+compose, look up the recovery). That is the generator behind the gate-level,
+interleaved and simultaneous RB simulators; :func:`simulate_rb` itself is
+analytic and draws no sequences, so these figures say nothing about its run
+time.
+
+Run from the repo root::
+
+    python scripts/bench_rb_cayley.py --max-length 5000 --sequences 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import numpy as np  # noqa: E402
+
+from qht.qubit.randomized_benchmarking import (  # noqa: E402
+    _clifford_group,
+    _compose_index,
+    _identity_index,
+    _inverse_index,
+    _random_sequences,
+)
+
+
+def _legacy(rng: np.random.Generator, length: int, n_sequences: int) -> np.ndarray:
+    group, lookup = _clifford_group()
+    recovery = np.empty(n_sequences, dtype=int)
+    for s in range(n_sequences):
+        net = _identity_index(group, lookup)
+        for g in rng.integers(0, 24, size=length):
+            net = _compose_index(group, lookup, int(g), net)
+        recovery[s] = _inverse_index(group, lookup, net)
+    return recovery
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-length", type=int, default=5000)
+    parser.add_argument("--sequences", type=int, default=500)
+    parser.add_argument("--legacy-sequences", type=int, default=5)
+    args = parser.parse_args()
+
+    lengths = np.unique(np.round(np.geomspace(1, args.max_length, 8)).astype(int))
+    rng = np.random.default_rng(0)
+    _random_sequences(rng, 1, 1)  # build the tables outside the timing
+
+    print(f"{'length':>8s}{'legacy (ms)':>14s}{'tables (ms)':>14s}{'speedup':>10s}")
+    tot_legacy = tot_table = 0.0
+    for m in lengths:
+        t0 = time.perf_counter()
+        _legacy(rng, int(m), args.legacy_sequences)
+        t_legacy = (time.perf_counter() - t0) * args.sequences / args.legacy_sequences
+
+        t0 = time.perf_counter()
+        _random_sequences(rng, int(m), args.sequences)
+        t_table = time.perf_counter() - t0
+
+        tot_legacy += t_legacy
+        tot_table += t_table
+        print(f"{m:8d}{t_legacy * 1e3:14.1f}{t_table * 1e3:14.2f}{t_legacy / t_table:9.0f}x")
+    print(f"{'total':>8s}{tot_legacy * 1e3:14.1f}{tot_table * 1e3:14.2f}{tot_legacy / tot_table:9.0f}x")
+    print(f"({args.sequences} sequences per length; legacy extrapolated from {args.legacy_sequences})")
+
+
+if __name__ == "__main__":
+    main()
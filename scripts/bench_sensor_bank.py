@@ -0,0 +1,47 @@
+"""Benchmark DAQ reads: a list of Sensor objects vs one vectorized SensorBank.
+
+Times ``DAQ.read_all`` over a simulated run for growing rack sizes, with
+failures and packet loss disabled so both paths do the same work.
+
+Run from the repo root::
+
+    python scripts/bench_sensor_bank.py --reads 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from qht.cryocooler.sensor import Sensor, SensorBank  # noqa: E402
+from qht.daq.daq_system import DAQ  # noqa: E402
+
+
+def _time_reads(daq: DAQ, n_reads: int) -> float:
+    t0 = time.perf_counter()
+    for k in range(n_reads):
+        daq.read_all(current_time=0.2 * k)
+    return (time.perf_counter() - t0) / n_reads
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reads", type=int, default=2000)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[4, 16, 64, 256])
+    args = parser.parse_args()
+
+    print(f"{'sensors':>8s}{'Sensor list (us)':>18s}{'SensorBank (us)':>17s}{'speedup':>10s}")
+    for n in args.sizes:
+        t_list = _time_reads(DAQ([Sensor(i, fail_rate=0.0) for i in range(n)], packet_loss_rate=0.0), args.reads)
+        t_bank = _time_reads(DAQ(SensorBank(n, fail_rate=0.0, seed=0), packet_loss_rate=0.0), args.reads)
+        print(f"{n:8d}{t_list * 1e6:18.1f}{t_bank * 1e6:17.1f}{t_list / t_bank:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
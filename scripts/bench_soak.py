@@ -0,0 +1,67 @@
+"""Benchmark the adaptive-step soak simulation against the fixed-step loop.
+
+Runs the ``PIDTestScenario`` gain schedule on a cool-down from 4.2 K with the
+heat leak doubled half-way through, once with :func:`simulate_fixed_step`
+(Euler + controller every ``dt``) and once with :func:`simulate_soak`
+(``solve_ivp`` between controller events), and reports wall time, controller
+iterations and the final temperature of both.
+
+Run from the repo root::
+
+    python scripts/bench_soak.py --hours 24
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from qht.cryocooler.pid import GainScheduledPID  # noqa: E402
+from qht.cryocooler.soak import simulate_fixed_step, simulate_soak  # noqa: E402
+from qht.cryocooler.thermal_model import ThermalModel  # noqa: E402
+
+
+def _controller():
+    return GainScheduledPID(
+        (0.25, 0.75, 1.25), ((-5, -0.02, -0.1), (-7, -0.05, -0.2), (-10, -0.1, -0.3)),
+        setpoint=4.0, output_limits=(0, 2),
+    )
+
+
+def _double_heat_leak(model):
+    model.heat_leak_coefficient *= 2
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=float, default=24.0)
+    parser.add_argument("--dt", type=float, default=0.2)
+    args = parser.parse_args()
+    duration = args.hours * 3600.0
+
+    disturbances = [(duration / 2, _double_heat_leak)]
+
+    t0 = time.perf_counter()
+    _, temps, _ = simulate_fixed_step(ThermalModel(initial_temp=4.2), _controller(), duration,
+                                      args.dt, disturbances=disturbances)
+    t_fixed = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    res = simulate_soak(ThermalModel(initial_temp=4.2), _controller(), duration,
+                        control_period=args.dt, disturbances=disturbances)
+    t_soak = time.perf_counter() - t0
+
+    print(f"fixed step: {res.baseline_steps:9d} iterations {t_fixed:8.2f} s  final {temps[-1]:.4f} K")
+    print(f"soak:       {res.n_events:9d} events     {t_soak:8.2f} s  final {res.temperatures[-1]:.4f} K"
+          f"  ({t_fixed / t_soak:.1f}x faster)")
+    print(res.summary())
+
+
+if __name__ == "__main__":
+    main()
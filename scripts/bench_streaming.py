@@ -0,0 +1,80 @@
+"""Measure the shot savings of the early-stopping and adaptive T1 estimators.
+
+For a range of seeds, streams a T1 sweep batch by batch into
+:class:`StreamingT1Estimator` and stops once ``T1_err/T1`` is below the target;
+then runs :class:`AdaptiveT1Design` (Fisher-information shot placement) to the
+same goal. Prints the shots spent versus the fixed-budget sweep, and the
+fixed-budget error bar for reference.
+
+Run from the repo root::
+
+    python scripts/bench_streaming.py --target 0.02
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import numpy as np  # noqa: E402
+
+from qht.qubit.adaptive import AdaptiveT1Design, simulated_measurement  # noqa: E402
+from qht.qubit.relaxation import fit_t1, simulate_t1, simulate_t1_stream, t1_delays  # noqa: E402
+from qht.qubit.streaming import StreamingT1Estimator  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--t1", type=float, default=50e-6)
+    parser.add_argument("--target", type=float, default=0.02)
+    parser.add_argument("--max-shots", type=int, default=4096)
+    parser.add_argument("--batch-shots", type=int, default=128)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    delays = t1_delays(args.t1)
+    budget = args.max_shots * delays.size
+    spent, rel, hit = [], [], 0
+    for seed in range(args.runs):
+        est = StreamingT1Estimator(delays, target_rel_err=args.target)
+        est.run(
+            simulate_t1_stream(
+                args.t1,
+                delays=delays,
+                batch_shots=args.batch_shots,
+                max_shots=args.max_shots,
+                seed=seed,
+            )
+        )
+        spent.append(est.total_shots)
+        rel.append(est.rel_err)
+        hit += est.done
+    adaptive = []
+    candidates = np.linspace(0.0, 1.5 * delays[-1], delays.size)
+    for seed in range(args.runs):
+        design = AdaptiveT1Design(
+            candidates, p0=[1.0, args.t1, 0.0], target_rel_err=args.target
+        )
+        design.acquire(
+            simulated_measurement(simulate_t1, args.t1, seed=seed),
+            batch_shots=args.batch_shots * 16,
+            max_shots=budget,
+        )
+        adaptive.append(design.total_shots)
+    full = fit_t1(*simulate_t1(args.t1, delays=delays, n_shots=args.max_shots, seed=0))
+
+    print(f"target T1_err/T1    : {args.target:.3f}  (reached in {hit}/{args.runs} runs)")
+    print(f"fixed budget        : {budget} shots, T1_err/T1 = {full.T1_err / full.T1:.4f}")
+    print(f"streaming (mean)    : {np.mean(spent):.0f} shots, T1_err/T1 = {np.mean(rel):.4f}")
+    print(f"shot savings        : {1.0 - np.mean(spent) / budget:6.1%}")
+    print(f"adaptive (mean)     : {np.mean(adaptive):.0f} shots")
+    print(f"shot savings        : {1.0 - np.mean(adaptive) / budget:6.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark ThermalNetwork stepping with and without factorization reuse.
+
+Builds a chain of ``--stages`` nodes with temperature-dependent heat
+capacities and conductances, closes one PID heater loop per stage, and times
+``--steps`` implicit steps with the default ``refactor_tol`` (the sparse LU is
+reused until parameters drift) against ``refactor_tol=0`` (a new
+factorization every step).
+
+Run from the repo root::
+
+    python scripts/bench_thermal_network.py --stages 48 --steps 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import numpy as np  # noqa: E402
+
+from qht.cryocooler.pid import PID  # noqa: E402
+from qht.cryocooler.thermal_network import AMBIENT, Link, Stage, ThermalNetwork  # noqa: E402
+
+
+def _chain(n_stages, refactor_tol):
+    stages = [
+        Stage(f's{i}', heat_capacity=10.0 / (i + 1), initial_temp=50.0 / (i + 1),
+              cooler_conductance=1.0 / (i + 1), base_temp=40.0 / (i + 1), capacity_exponent=1.0)
+        for i in range(n_stages)
+    ]
+    links = [Link('s0', AMBIENT, 0.1)] + [
+        Link(f's{i}', f's{i + 1}', 0.01, exponent=1.0) for i in range(n_stages - 1)
+    ]
+    return ThermalNetwork(stages, links, refactor_tol=refactor_tol)
+
+
+def _run(n_stages, n_steps, refactor_tol, dt=0.5):
+    net = _chain(n_stages, refactor_tol)
+    net.set_heater_power(0.5 * net.cooler_conductance)
+    setpoints = net.steady_state()
+    net.set_heater_power(0.0)
+    pids = [PID(kp=2 * k, ki=0.2 * k, kd=0.0, setpoint=sp, output_limits=(0, 10))
+            for sp, k in zip(setpoints, net.cooler_conductance)]
+    t0 = time.perf_counter()
+    for step in range(n_steps):
+        temps = net.update(dt)
+        net.set_heater_power([pid.update(t, current_time=step * dt) for pid, t in zip(pids, temps)])
+    elapsed = time.perf_counter() - t0
+    return elapsed, net.n_factorizations, np.max(np.abs(net.temperature / setpoints - 1))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stages", type=int, default=48)
+    parser.add_argument("--steps", type=int, default=5000)
+    args = parser.parse_args()
+
+    base = None
+    for name, tol in (("refactor every step", 0.0), ("reuse factorization", 0.01)):
+        elapsed, n_fact, err = _run(args.stages, args.steps, tol)
+        base = base or elapsed
+        print(f"{name:22s}{elapsed / args.steps * 1e6:9.1f} us/step  {n_fact:6d} factorizations"
+              f"  max |T/T_sp - 1| {err:.1e}{base / elapsed:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,15 +7,14 @@ from qht.daq.daq_system import DAQ
 from qht.utils.report import generate_csv_report
 
 
-def test_data_logging_and_csv():
-    os.makedirs('data', exist_ok=True)
+def test_data_logging_and_csv(tmp_path):
     sensors = [Sensor(i, fail_rate=0.0) for i in range(2)]
     daq = DAQ(sensors, packet_loss_rate=0.0)
     log_entries = []
     for _ in range(5):
         data = daq.read_all()
         log_entries.append({'timestamp': _, 'sensor_data': data})
-    filename = 'data/test_log.csv'
+    filename = str(tmp_path / 'test_log.csv')
     generate_csv_report(log_entries, filename)
     assert os.path.exists(filename)
     df = pd.read_csv(filename)
@@ -1,21 +1,20 @@
 import os
+
 from qht.utils.report import generate_csv_report, generate_pdf_report
 
 
-def test_generate_csv_report():
-    os.makedirs('data', exist_ok=True)
+def test_generate_csv_report(tmp_path):
     log_entries = [
         {'timestamp': 1, 'avg_temp': 4.01, 'pid_output': 0.5},
         {'timestamp': 2, 'avg_temp': 3.99, 'pid_output': 0.6},
     ]
-    csv_file = 'data/test_log.csv'
+    csv_file = str(tmp_path / 'test_log.csv')
     generate_csv_report(log_entries, csv_file)
     assert os.path.exists(csv_file)
 
 
-def test_generate_pdf_report():
+def test_generate_pdf_report(tmp_path):
     """Exercise the real PDF report API (structured scenario results)."""
-    os.makedirs('data', exist_ok=True)
     test_results = {
         'summary': {'total_tests': 2, 'passed_tests': 2},
         'scenarios': [
@@ -29,6 +28,6 @@ def test_generate_pdf_report():
             }
         ],
     }
-    pdf_file = 'data/test_report.pdf'
+    pdf_file = str(tmp_path / 'test_report.pdf')
     generate_pdf_report(test_results, test_duration=10.0, setpoint=4.0, output_file=pdf_file)
     assert os.path.exists(pdf_file)
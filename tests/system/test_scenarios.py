@@ -3,7 +3,7 @@ import pandas as pd
 from datetime import datetime
 from pathlib import Path
 from qht.cryocooler.sensor import Sensor
-from qht.cryocooler.pid import PID
+from qht.cryocooler.pid import GainScheduledPID
 from qht.daq.daq_system import DAQ
 from qht.utils.report import generate_csv_report, generate_pdf_report
 from qht.cryocooler.thermal_model import ThermalModel
@@ -156,16 +156,20 @@ class PIDTestScenario(TestScenario):
         self.step_response_data = []
         self.disturbance_data = []
 
-    def get_pid_gains(self, temperature):
-        """Get temperature-dependent PID gains."""
-        # More aggressive gains at higher temperatures
-        temp_diff = abs(temperature - 4.0)
-        if temp_diff > 1.0:
-            return 1.0, 0.2, 0.3  # Higher gains for large deviations
-        elif temp_diff > 0.5:
-            return 0.7, 0.1, 0.2  # Medium gains for moderate deviations
-        else:
-            return 0.5, 0.05, 0.1  # Conservative gains near setpoint
+    # Temperature-dependent gains, interpolated in |T - setpoint|: conservative
+    # near setpoint, more aggressive for large deviations. The actuator is a
+    # cooler (a high temperature must raise the output), hence the sign.
+    GAIN_BREAKPOINTS = (0.25, 0.75, 1.25)
+    GAIN_TABLE = (
+        (-5.0, -0.02, -0.1),  # Conservative gains near setpoint
+        (-7.0, -0.05, -0.2),  # Medium gains for moderate deviations
+        (-10.0, -0.1, -0.3),  # Higher gains for large deviations
+    )
+
+    def make_controller(self):
+        """One gain-scheduled controller that keeps its state for a whole run."""
+        return GainScheduledPID(self.GAIN_BREAKPOINTS, self.GAIN_TABLE, setpoint=4.0,
+                                output_limits=(0, 2))
 
     def run(self):
         super().run()
@@ -182,6 +186,7 @@ class PIDTestScenario(TestScenario):
         outputs = []
         temperatures = []
         dt = 0.1  # Time step in seconds
+        pid = self.make_controller()
         
         for t in range(2000):  # 200 seconds simulation
             # Update thermal model and get temperature reading
@@ -190,11 +195,7 @@ class PIDTestScenario(TestScenario):
             current_temp = sensor.read(current_time=t * dt)
             temperatures.append(current_temp)
             
-            # Get temperature-dependent PID gains
-            kp, ki, kd = self.get_pid_gains(current_temp)
-            pid = PID(kp=kp, ki=ki, kd=kd, setpoint=4.0, output_limits=(0, 2))
-            
-            # Update PID and apply control
+            # Update PID (gains follow the temperature error) and apply control
             out = pid.update(current_temp, current_time=t * dt)
             outputs.append(out)
             thermal_model.set_cooling_power(out)
@@ -221,6 +222,8 @@ class PIDTestScenario(TestScenario):
         )
         sensor.base_temp = 4.0
         sensor.last_reading = 4.0
+        sensor.last_read_time = 0.0  # the clock restarts for this run
+        pid = self.make_controller()
         temperatures = []
         
         for t in range(2000):  # 200 seconds simulation
@@ -234,11 +237,7 @@ class PIDTestScenario(TestScenario):
             current_temp = sensor.read(current_time=t * dt)
             temperatures.append(current_temp)
             
-            # Get temperature-dependent PID gains
-            kp, ki, kd = self.get_pid_gains(current_temp)
-            pid = PID(kp=kp, ki=ki, kd=kd, setpoint=4.0, output_limits=(0, 2))
-            
-            # Update PID and apply control
+            # Update PID (gains follow the temperature error) and apply control
             out = pid.update(current_temp, current_time=t * dt)
             thermal_model.set_cooling_power(out)
 
@@ -0,0 +1,83 @@
+"""Tests for the adaptive (Fisher-information) sweep designers."""
+
+import numpy as np
+import pytest
+
+from qht.qubit.adaptive import (
+    AdaptiveRamseyDesign,
+    AdaptiveT1Design,
+    per_shot_information,
+    simulated_measurement,
+)
+from qht.qubit.models import exp_decay
+from qht.qubit.ramsey import simulate_ramsey, simulate_ramsey_stream
+from qht.qubit.relaxation import simulate_t1, simulate_t1_stream
+from qht.qubit.streaming import StreamingRamseyEstimator, StreamingT1Estimator
+
+
+def test_information_vanishes_where_t1_is_unidentifiable():
+    """At t=0 the population carries no information about T1."""
+    F = per_shot_information(exp_decay, np.array([0.0, 50e-6]), np.array([1.0, 50e-6, 0.0]))
+    assert F.shape == (2, 3, 3)
+    assert F[0, 1, 1] == 0.0
+    assert F[1, 1, 1] > 0.0
+
+
+def test_pilot_then_concentrated_allocation():
+    cand = np.linspace(0.0, 300e-6, 40)
+    design = AdaptiveT1Design(cand, p0=[1.0, 50e-6, 0.0], pilot_shots=16)
+    pilot = design.propose(2048)
+    np.testing.assert_array_equal(pilot, 16)
+    measure = simulated_measurement(simulate_t1, 50e-6, seed=0)
+    design.update(measure(cand, pilot), pilot)
+    alloc = design.propose(2048)
+    assert alloc.sum() == 2048
+    assert np.count_nonzero(alloc) <= 6
+
+
+def test_acquire_never_exceeds_max_shots():
+    cand = np.linspace(0.0, 300e-6, 40)
+    design = AdaptiveT1Design(cand, p0=[1.0, 50e-6, 0.0], pilot_shots=32, target_rel_err=1e-6)
+    design.acquire(simulated_measurement(simulate_t1, 50e-6, seed=0), max_shots=500)
+    assert 0 < design.total_shots <= 500
+    assert design.shots.min() == 500 // 40  # the pilot shrank to fit the budget
+
+    with pytest.raises(ValueError):
+        AdaptiveT1Design(cand, p0=[1.0, 50e-6, 0.0]).acquire(
+            simulated_measurement(simulate_t1, 50e-6, seed=0), max_shots=39
+        )
+
+
+def test_t1_goal_with_fewer_shots_than_uniform_sweep():
+    cand = np.linspace(0.0, 300e-6, 40)
+    delays = np.linspace(0.0, 200e-6, 40)
+    for seed in range(3):
+        design = AdaptiveT1Design(cand, p0=[1.0, 75e-6, 0.0], target_rel_err=0.02)
+        res = design.acquire(simulated_measurement(simulate_t1, 50e-6, seed=seed), batch_shots=2048)
+        assert design.done
+        assert abs(res.T1 - 50e-6) < 4 * res.T1_err
+
+        uniform = StreamingT1Estimator(delays, target_rel_err=0.02)
+        uniform.run(simulate_t1_stream(50e-6, delays=delays, max_shots=4096, seed=seed))
+        assert design.total_shots < 0.7 * uniform.total_shots
+
+
+def test_ramsey_t2_goal():
+    cand = np.linspace(0.0, 60e-6, 100)
+    design = AdaptiveRamseyDesign(cand, p0=[0.5, 15e-6, 0.5e6, 0.0, 0.5], target_rel_err=0.03)
+    measure = simulated_measurement(simulate_ramsey, 20e-6, 0.5e6, seed=3)
+    res = design.acquire(measure, batch_shots=4096)
+    assert design.done
+    assert abs(res.T2 - 20e-6) < 4 * res.T2_err
+
+    uniform = StreamingRamseyEstimator(cand, target_rel_err=0.03)
+    uniform.run(simulate_ramsey_stream(20e-6, 0.5e6, cand, max_shots=4096, seed=3))
+    assert design.total_shots < uniform.total_shots
+
+
+def test_budget_cap_respected():
+    cand = np.linspace(0.0, 300e-6, 40)
+    design = AdaptiveT1Design(cand, p0=[1.0, 50e-6, 0.0], target_rel_err=1e-6)
+    design.acquire(simulated_measurement(simulate_t1, 50e-6, seed=1), batch_shots=1000, max_shots=5000)
+    assert design.total_shots == 5000
+    assert not design.done
@@ -0,0 +1,106 @@
+import asyncio
+import time
+
+import numpy as np
+
+from qht.cryocooler.sensor import Sensor
+from qht.daq.async_daq import AsyncDAQ, LatencySensor
+
+
+def slow_sensors(n, latency, **kwargs):
+    return [LatencySensor(Sensor(i, fail_rate=0.0), latency=latency, seed=i, **kwargs) for i in range(n)]
+
+
+class HangsOnce(LatencySensor):
+    """Never answers its first query, then behaves normally."""
+
+    async def read(self, current_time=None):
+        if not getattr(self, '_asked', False):
+            self._asked = True
+            await asyncio.Event().wait()
+        return await super().read(current_time)
+
+
+def test_reads_are_concurrent():
+    daq = AsyncDAQ(slow_sensors(20, latency=0.05, jitter=0.0))
+    t0 = time.perf_counter()
+    readings = asyncio.run(daq.read_all(current_time=0.0))
+    elapsed = time.perf_counter() - t0
+    assert len(readings) == 20 and daq.last_valid.all()
+    assert elapsed < 0.25 * 20 * 0.05  # far below the serialized 1 s
+
+
+def test_timeouts_retry_and_give_up():
+    sensors = slow_sensors(2, latency=0.005)
+    sensors.append(HangsOnce(Sensor(2, fail_rate=0.0), latency=0.005))
+    sensors.append(LatencySensor(Sensor(3, fail_rate=0.0), latency=0.005, hang_rate=1.0))
+    daq = AsyncDAQ(sensors, timeout=0.05, retries=2, backoff=0.005, seed=0)
+    readings = asyncio.run(daq.read_all(current_time=0.0))
+    assert len(readings) == 3
+    np.testing.assert_array_equal(daq.last_valid, [True, True, True, False])
+    assert daq.n_timeouts == 1 + 3 and daq.n_retries == 1 + 2
+
+
+def test_failed_sensor_is_reset_and_retried():
+    sensor = Sensor(0, fail_rate=0.0)
+    sensor.failed = True
+    daq = AsyncDAQ([LatencySensor(sensor, latency=0.001)], retries=1, backoff=0.001)
+    readings = asyncio.run(daq.read_all(current_time=0.0))
+    assert len(readings) == 1 and daq.n_errors == 1 and not sensor.failed
+
+
+class FakeClock:
+    """Simulated time for the scheduler: sleeping advances it exactly."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.now += max(seconds, 0.0)
+        await asyncio.sleep(0)
+
+
+def run_on(clock, daq, callback, period, n_ticks):
+    return asyncio.run(daq.run(callback, period=period, n_ticks=n_ticks, clock=clock.time, sleep=clock.sleep))
+
+
+def test_scheduler_holds_the_period():
+    clock = FakeClock()
+    seen = []
+
+    def control(t, readings, valid):
+        seen.append((t, len(readings)))
+        clock.now += 0.013  # work inside the tick
+
+    report = run_on(clock, AsyncDAQ([]), control, period=0.05, n_ticks=12)
+    assert report.overruns == 0
+    np.testing.assert_allclose(report.deadlines, np.arange(12) * 0.05)
+    # Ticks start exactly on their absolute deadlines: no drift from the work.
+    np.testing.assert_allclose(report.tick_times, report.deadlines, atol=1e-12)
+    assert report.jitter < 1e-12
+    assert [t for t, _ in seen] == list(report.tick_times)
+
+
+def test_scheduler_skips_missed_deadlines():
+    clock = FakeClock()
+    work = iter([0.08, 0.01, 0.12, 0.01])
+
+    def control(t, readings, valid):
+        clock.now += next(work)
+
+    report = run_on(clock, AsyncDAQ([]), control, period=0.05, n_ticks=4)
+    # 0.08 overruns the 0.05 deadline -> resume at 0.10; 0.12 from 0.15 -> 0.30.
+    np.testing.assert_allclose(report.deadlines, [0.0, 0.1, 0.15, 0.3])
+    np.testing.assert_allclose(report.tick_times, report.deadlines)
+    assert report.overruns == 1 + 2
+
+
+def test_scheduler_smoke_on_the_real_clock():
+    daq = AsyncDAQ(slow_sensors(4, latency=0.005))
+    seen = []
+    report = asyncio.run(daq.run(lambda t, r, v: seen.append(len(r)), period=0.05, n_ticks=5))
+    assert seen == [4] * 5
+    assert report.tick_times[-1] < 1.0  # loose: only checks the loop runs and terminates
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from qht.cryocooler.autotune import OBJECTIVES, autotune, pareto_front
+from qht.cryocooler.ensemble import ScheduledPIDArray
+from qht.cryocooler.pid import GainScheduledPID
+
+SMALL = dict(n_candidates=12, n_rounds=2, n_plants=3, n_steps=300, batch_size=8, seed=0)
+
+
+def test_pareto_front():
+    obj = np.array([[1.0, 5.0], [2.0, 2.0], [3.0, 3.0], [5.0, 1.0], [1.0, 5.0]])
+    np.testing.assert_array_equal(pareto_front(obj), [0, 1, 3, 4])
+
+
+def test_scheduled_pid_interpolates_like_gain_scheduled_pid():
+    table = np.array([[0.5, 0.05, 0.1], [0.7, 0.1, 0.2], [1.0, 0.2, 0.3]])
+    pid = ScheduledPIDArray(4, [0.5, 1.0, 2.0], table, setpoint=4.0, output_limits=(0, 2))
+    scalar = GainScheduledPID([0.5, 1.0, 2.0], table, setpoint=4.0)
+    abs_error = np.array([0.1, 0.75, 1.5, 3.0])
+    np.testing.assert_array_equal(pid.gains(abs_error), [scalar.gains(e) for e in abs_error])
+
+
+def test_scheduled_pid_array_matches_gain_scheduled_pid():
+    # Non-zero kd: both must difference the measurement, not the last error.
+    breakpoints = np.array([[0.25, 0.75, 1.25], [0.1, 0.5, 2.0]])
+    tables = np.array([
+        [(-5.0, -0.02, -0.1), (-7.0, -0.05, -0.2), (-10.0, -0.1, -0.3)],
+        [(-2.0, -0.01, -0.5), (-4.0, -0.02, -0.4), (-6.0, -0.2, -0.8)],
+    ])
+    array = ScheduledPIDArray(2, breakpoints, tables, setpoint=4.0, output_limits=(0, 2))
+    scalars = [GainScheduledPID(b, t, setpoint=4.0, output_limits=(0, 2)) for b, t in zip(breakpoints, tables)]
+    rng = np.random.default_rng(0)
+    for step in range(300):
+        measurement = 4.0 + rng.normal(0, 1.0, 2)
+        out = array.update(measurement, current_time=step * 0.1)
+        expected = [pid.update(m, current_time=step * 0.1) for pid, m in zip(scalars, measurement)]
+        np.testing.assert_allclose(out, expected, rtol=1e-12, atol=1e-12)
+
+
+def test_autotune_returns_signed_table_and_front():
+    res = autotune(n_tiers=2, **SMALL)
+    assert res.gain_tables.shape == (24, 2, 3) and res.breakpoints.shape == (24, 2)
+    assert res.objectives.shape == (24, len(OBJECTIVES))
+    assert np.all(res.gain_tables < 0)  # reverse-acting cooler
+    table = res.gain_table()
+    assert len(table) == 2 and table[0][0] < table[1][0]
+    GainScheduledPID([row[0] for row in table], [row[1:] for row in table], setpoint=4.0)
+    assert res.best in res.pareto  # a positive-weight optimum is never dominated
+    assert res.costs[res.best] <= np.median(res.costs)
+
+
+def test_process_pool_matches_serial():
+    serial = autotune(**SMALL)
+    pooled = autotune(n_workers=2, **SMALL)
+    np.testing.assert_allclose(pooled.objectives, serial.objectives)
+    assert pooled.gain_table() == pytest.approx(serial.gain_table())
@@ -0,0 +1,71 @@
+"""Tests for the chip-scale (vectorized over qubits) simulators."""
+
+import numpy as np
+import pytest
+
+from qht.qubit.hahn_echo import simulate_hahn_echo, simulate_hahn_echo_batch
+from qht.qubit.models import qubit_rngs, sample_shots
+from qht.qubit.rabi import simulate_rabi, simulate_rabi_batch
+from qht.qubit.ramsey import simulate_ramsey, simulate_ramsey_batch
+from qht.qubit.relaxation import fit_t1_batch, simulate_t1, simulate_t1_batch
+
+
+def _children(seed, n):
+    return np.random.SeedSequence(seed).spawn(n)
+
+
+def test_t1_rows_match_scalar_simulator():
+    t1 = np.array([20e-6, 50e-6, 90e-6])
+    d, p, s = simulate_t1_batch(t1, seed=7)
+    assert d.shape == p.shape == s.shape == (3, 40)
+    for i, child in enumerate(_children(7, 3)):
+        di, pi, si = simulate_t1(t1[i], seed=child)
+        np.testing.assert_allclose(d[i], di)
+        np.testing.assert_array_equal(p[i], pi)
+        np.testing.assert_array_equal(s[i], si)
+
+
+def test_ramsey_rabi_echo_rows_match_scalar_simulators():
+    children = _children(3, 2)
+    delays = np.linspace(0.0, 60e-6, 120)
+    _, p, _ = simulate_ramsey_batch([20e-6, 25e-6], [0.5e6, 0.7e6], delays=delays, seed=3)
+    for i, (t2, df) in enumerate([(20e-6, 0.5e6), (25e-6, 0.7e6)]):
+        np.testing.assert_array_equal(p[i], simulate_ramsey(t2, df, delays=delays, seed=children[i])[1])
+
+    d, p, _ = simulate_rabi_batch([8e6, 12e6], seed=3)
+    for i, fr in enumerate([8e6, 12e6]):
+        di, pi, _ = simulate_rabi(fr, seed=children[i])
+        np.testing.assert_allclose(d[i], di)
+        np.testing.assert_array_equal(p[i], pi)
+
+    d, p, _ = simulate_hahn_echo_batch([80e3, 120e3], 100e-6, echo=True, seed=3)
+    for i, sf in enumerate([80e3, 120e3]):
+        di, pi, _ = simulate_hahn_echo(sf, 100e-6, echo=True, seed=children[i])
+        np.testing.assert_allclose(d[i], di)
+        np.testing.assert_array_equal(p[i], pi)
+
+
+def test_qubit_stream_independent_of_chip_size():
+    small = simulate_t1_batch(np.full(4, 50e-6), seed=11)[1]
+    large = simulate_t1_batch(np.full(200, 50e-6), seed=11)[1]
+    np.testing.assert_array_equal(small, large[:4])
+
+
+def test_single_draw_mode_and_fit_round_trip():
+    rng = np.random.default_rng(0)
+    t1 = rng.uniform(20e-6, 120e-6, 200)
+    delays = np.linspace(0.0, 400e-6, 40)
+    d, p, s = simulate_t1_batch(t1, delays=delays, seed=5, independent_streams=False)
+    assert p.shape == (200, 40)
+    fits = fit_t1_batch(d, p, s)
+    pulls = np.array([(f.T1 - t) / f.T1_err for f, t in zip(fits, t1)])
+    assert abs(np.mean(pulls)) < 0.3
+    assert np.std(pulls) == pytest.approx(1.0, abs=0.2)
+
+
+def test_sample_shots_per_row_shot_counts():
+    p1 = np.full((3, 5), 0.3)
+    n = np.array([[10], [100], [1000]])
+    p_hat, sigma = sample_shots(p1, n, qubit_rngs(0, 3))
+    assert p_hat.shape == (3, 5)
+    assert np.all(sigma[0] > sigma[2])
@@ -0,0 +1,110 @@
+"""Tests for the two-qubit Clifford encoding and two-qubit RB."""
+
+import numpy as np
+import pytest
+
+from qht.qubit.clifford2q import (
+    N_CLIFFORD_2Q,
+    _pauli_matrices,
+    clifford_2q_tables,
+    compose_sequences_2q,
+    random_sequences_2q,
+)
+from qht.qubit.randomized_benchmarking import (
+    _pauli_frame_survival,
+    epc_from_p,
+    fit_rb,
+    simulate_rb_2q,
+)
+
+
+def _same_up_to_phase(u, v):
+    return abs(abs(np.trace(u @ v.conj().T)) - 4.0) < 1e-8
+
+
+def test_tables_shape_and_compact_storage():
+    t = clifford_2q_tables()
+    assert N_CLIFFORD_2Q == 11520
+    assert t.mult.shape == t.corr.shape == (720, 720)
+    assert t.conj.shape == (720, 16)
+    assert sum(a.nbytes for a in (t.conj, t.mult, t.corr, t.inv, t.inv_corr)) < 2_000_000
+    # Symplectic part of the multiplication table is a Latin square (group).
+    assert np.all(np.sort(t.mult, axis=1) == np.arange(720))
+
+
+def test_compose_and_inverse_match_unitaries():
+    t = clifford_2q_tables()
+    rng = np.random.default_rng(0)
+    for g, h in rng.integers(0, N_CLIFFORD_2Q, size=(200, 2)):
+        assert _same_up_to_phase(t.unitary(t.compose(g, h)), t.unitary(g) @ t.unitary(h))
+        assert _same_up_to_phase(t.unitary(t.inverse(g)), t.unitary(g).conj().T)
+
+
+def test_distinct_elements_are_distinct_unitaries():
+    t = clifford_2q_tables()
+    rng = np.random.default_rng(1)
+    g = rng.choice(N_CLIFFORD_2Q, size=60, replace=False)
+    for i in range(len(g)):
+        for j in range(i + 1, len(g)):
+            assert not _same_up_to_phase(t.unitary(g[i]), t.unitary(g[j]))
+
+
+def test_recovery_returns_identity():
+    t = clifford_2q_tables()
+    gates, recovery = random_sequences_2q(np.random.default_rng(2), 200, 1000)
+    full = np.concatenate([gates, recovery[:, None]], axis=1)
+    assert np.all(compose_sequences_2q(full, t) == 0)
+    u = np.eye(4)
+    for g in full[0]:
+        u = t.unitary(g) @ u
+    assert _same_up_to_phase(u, np.eye(4))
+
+
+def test_two_qubit_rb_recovers_p_and_epc():
+    p_true = 0.98
+    lengths, survival, sigma = simulate_rb_2q(p_true, n_sequences=200, seed=0)
+    res = fit_rb(lengths, survival, sigma, d=4)
+    assert abs(res.p - p_true) < 5 * res.p_err + 1e-4
+    assert res.epc == pytest.approx(epc_from_p(p_true, d=4), abs=1e-3)
+    assert res.epc_err == pytest.approx(0.75 * res.p_err)
+    assert res.B == pytest.approx(0.25, abs=0.01)
+
+
+def _density_matrix_survival(seq, pauli_error, tables):
+    """|00> survival of one sequence by brute-force density-matrix evolution."""
+    paulis = _pauli_matrices()
+    rho = np.zeros((4, 4), dtype=complex)
+    rho[0, 0] = 1.0
+    for g in seq:
+        u = tables.unitary(g)
+        rho = u @ rho @ u.conj().T
+        rho = np.einsum("e,eij,jk,elk->il", pauli_error, paulis, rho, paulis.conj())
+    return rho[0, 0].real
+
+
+def test_pauli_frame_matches_density_matrix_evolution():
+    # Exercises the conjugation, composition and inversion tables: a wrong
+    # entry in any of them changes the brute-force survival but not the frame.
+    t = clifford_2q_tables()
+    rng = np.random.default_rng(3)
+    pauli_error = rng.dirichlet(np.full(16, 0.3)) * 0.2
+    pauli_error[0] += 0.8
+    for m in (0, 1, 4, 12):
+        gates, recovery = random_sequences_2q(rng, m, 6)
+        seqs = np.concatenate([gates, recovery[:, None]], axis=1)
+        expected = [_density_matrix_survival(row, pauli_error, t) for row in seqs]
+        np.testing.assert_allclose(_pauli_frame_survival(seqs, pauli_error), expected, atol=1e-12)
+
+
+def test_two_qubit_rb_with_biased_pauli_noise():
+    pauli_error = np.zeros(16)
+    pauli_error[[0, 1, 4]] = [0.97, 0.02, 0.01]  # mostly X1, some Z1
+    _, survival, sigma = simulate_rb_2q(
+        1.0, lengths=[1, 5, 50], n_sequences=50, seed=1, pauli_error=pauli_error
+    )
+    assert survival[0] > survival[1] > survival[2] > 0.25
+    # Each sequence twirls the biased channel differently: the spread across
+    # sequences is well above shot noise alone.
+    assert sigma[1] > 2 * np.sqrt(survival[1] * (1 - survival[1]) / (4096 * 50))
+    with pytest.raises(ValueError):
+        simulate_rb_2q(1.0, pauli_error=np.full(16, 0.1))
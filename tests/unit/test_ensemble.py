@@ -0,0 +1,76 @@
+import time
+
+import numpy as np
+import pytest
+
+from qht.cryocooler.ensemble import (
+    PIDArray,
+    ThermalModelArray,
+    ensemble_metrics,
+    simulate_ensemble,
+)
+from qht.cryocooler.pid import PID
+from qht.cryocooler.sensor import SensorBank
+from qht.cryocooler.thermal_model import ThermalModel
+
+
+def _scalar_loop(thermal_mass, heat_leak, kp, n_steps, dt):
+    model = ThermalModel(initial_temp=4.5, thermal_mass=thermal_mass, heat_leak_coefficient=heat_leak)
+    pid = PID(kp=kp, ki=0.05, kd=0.1, setpoint=4.0, output_limits=(0, 2))
+    temps = []
+    for step in range(n_steps):
+        temp = model.update(dt)
+        model.set_cooling_power(pid.update(temp, current_time=step * dt))
+        temps.append(temp)
+    return np.array(temps)
+
+
+def test_ensemble_matches_scalar_classes_member_by_member():
+    thermal_mass = np.array([200.0, 1000.0, 50.0])
+    heat_leak = np.array([0.001, 0.002, 0.0005])
+    kp = np.array([0.5, 1.0, 3.0])
+    thermal = ThermalModelArray(3, initial_temp=4.5, thermal_mass=thermal_mass, heat_leak_coefficient=heat_leak)
+    pid = PIDArray(3, kp=kp, ki=0.05, kd=0.1, setpoint=4.0, output_limits=(0, 2))
+    res = simulate_ensemble(thermal, pid, n_steps=500, dt=0.1)
+    assert res.temperature.shape == res.output.shape == (3, 500)
+    for i in range(3):
+        ref = _scalar_loop(thermal_mass[i], heat_leak[i], kp[i], 500, 0.1)
+        np.testing.assert_allclose(res.temperature[i], ref, rtol=1e-12)
+    np.testing.assert_array_equal(res.measurement, res.temperature)
+
+
+def test_metrics():
+    times = np.arange(6.0)
+    temps = np.array([
+        [5.0, 4.5, 4.1, 4.0, 4.0, 4.0],  # settles at t=2
+        [4.0, 4.0, 4.0, 4.0, 4.0, 4.5],  # leaves the band at the end
+    ])
+    m = ensemble_metrics(times, temps, 4.0, band=0.05, tail=3)
+    np.testing.assert_allclose(m['settling_time'], [2.0, np.nan])
+    np.testing.assert_allclose(m['overshoot'], [1.0, 0.5])
+    np.testing.assert_allclose(m['steady_state_error'], [0.0, 0.5 / 3])
+
+
+def test_ten_thousand_members_with_sensor_noise():
+    k = 10_000
+    rng = np.random.default_rng(0)
+    thermal = ThermalModelArray(
+        k, initial_temp=4.2, thermal_mass=rng.uniform(500, 1500, k),
+        heat_leak_coefficient=rng.uniform(0.0005, 0.002, k),
+    )
+    # Cooling is reverse-acting: a temperature above setpoint must raise the output.
+    pid = PIDArray(k, kp=-2.0, ki=-0.1, kd=0.0, setpoint=4.0, output_limits=(0, 2))
+    sensors = SensorBank(k, base_temp=4.2, noise_level=rng.uniform(0.001, 0.01, k),
+                         response_time=0.5, fail_rate=0.0, seed=1)
+    t0 = time.perf_counter()
+    res = simulate_ensemble(thermal, pid, n_steps=2000, dt=0.1, sensors=sensors, dtype=np.float32)
+    metrics = res.metrics(4.0)
+    assert time.perf_counter() - t0 < 30.0
+    assert res.measurement.shape == (k, 2000)
+    assert np.all(np.abs(metrics['steady_state_error']) < 0.15)
+    assert not np.isnan(metrics['settling_time']).any()
+
+
+def test_member_count_mismatch():
+    with pytest.raises(ValueError):
+        simulate_ensemble(ThermalModelArray(2), PIDArray(3, 1.0, 0.1, 0.0, 4.0), n_steps=10)
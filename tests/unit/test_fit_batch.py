@@ -0,0 +1,116 @@
+"""Tests for the batched Levenberg-Marquardt fitting engine."""
+
+import numpy as np
+import pytest
+
+from qht.qubit.models import exp_decay, fit_curve, fit_curve_batch, BatchFitResult
+from qht.qubit.relaxation import simulate_t1, fit_t1, fit_t1_batch
+from qht.qubit.hahn_echo import simulate_hahn_echo, fit_hahn_echo, fit_hahn_echo_batch
+from qht.qubit.ramsey import simulate_ramsey, fit_ramsey, fit_ramsey_batch
+from qht.qubit.rabi import simulate_rabi, fit_rabi, fit_rabi_batch
+from qht.qubit.randomized_benchmarking import simulate_rb, fit_rb, fit_rb_batch
+
+
+def _stack(sim, n, **kwargs):
+    rows = [sim(seed=i, **kwargs) for i in range(n)]
+    x = rows[0][0]
+    return x, np.array([r[1] for r in rows]), np.array([r[2] for r in rows])
+
+
+def test_batch_matches_single_curve_fit():
+    """Each row of the batch reproduces fit_curve to a tiny fraction of sigma."""
+    delays, p_hat, sigma = _stack(simulate_t1, 8, t1_true=40e-6)
+    batch = fit_curve_batch(
+        exp_decay, delays, p_hat, p0=[0.9, 30e-6, 0.02], names=("A", "T1", "C"), sigma=sigma
+    )
+    assert isinstance(batch, BatchFitResult)
+    assert len(batch) == 8
+    assert batch.converged.all()
+    for i in range(8):
+        ref = fit_curve(
+            exp_decay, delays, p_hat[i], p0=[0.9, 30e-6, 0.02], names=("A", "T1", "C"), sigma=sigma[i]
+        )
+        assert abs(batch[i].value("T1") - ref.value("T1")) < 1e-3 * ref.error("T1")
+        np.testing.assert_allclose(batch[i].perr, ref.perr, rtol=1e-3)
+        np.testing.assert_allclose(batch[i].perr, np.sqrt(np.diag(batch[i].pcov)))
+
+
+def test_batch_unweighted_covariance_rescaled():
+    """Without sigma the covariance is scaled by the reduced chi-squared, like curve_fit."""
+    rng = np.random.default_rng(0)
+    t = np.linspace(0, 1e-4, 60)
+    y = exp_decay(t, 1.0, 40e-6, 0.0) + rng.normal(0, 0.01, (3, t.size))
+    batch = fit_curve_batch(exp_decay, t, y, p0=[1.0, 30e-6, 0.0], names=("A", "T1", "C"))
+    for i in range(3):
+        ref = fit_curve(exp_decay, t, y[i], p0=[1.0, 30e-6, 0.0], names=("A", "T1", "C"))
+        np.testing.assert_allclose(batch[i].perr, ref.perr, rtol=1e-3)
+
+
+def test_batch_respects_bounds():
+    t = np.linspace(0, 1e-4, 40)
+    y = np.tile(exp_decay(t, 1.0, 40e-6, 0.0), (2, 1))
+    batch = fit_curve_batch(
+        exp_decay, t, y, p0=[0.5, 30e-6, 0.1], names=("A", "T1", "C"),
+        bounds=([0.0, 1e-12, 0.05], [0.95, np.inf, 1.0]),
+    )
+    assert np.all(batch.value("A") <= 0.95)
+    assert np.all(batch.value("C") >= 0.05)
+
+
+def test_per_curve_grids_and_seeds():
+    """Per-curve x grids and initial guesses are supported."""
+    t1s = np.array([20e-6, 50e-6, 90e-6])
+    x = np.array([np.linspace(0, 4 * t1, 40) for t1 in t1s])
+    y = exp_decay(x, 0.95, t1s[:, None], 0.03)
+    p0 = np.column_stack([np.full(3, 0.9), t1s * 0.7, np.zeros(3)])
+    batch = fit_curve_batch(exp_decay, x, y, p0=p0, names=("A", "T1", "C"))
+    np.testing.assert_allclose(batch.value("T1"), t1s, rtol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "sim, fit, fit_batch, kwargs, key",
+    [
+        (simulate_t1, fit_t1, fit_t1_batch, {"t1_true": 50e-6}, "T1"),
+        (simulate_ramsey, fit_ramsey, fit_ramsey_batch, {"t2_true": 30e-6, "delta_f_true": 0.3e6}, "T2"),
+        (simulate_rabi, fit_rabi, fit_rabi_batch, {"f_rabi_true": 8e6}, "f_rabi"),
+        (simulate_rb, fit_rb, fit_rb_batch, {"p_depol": 0.99, "n_sequences": 10}, "p"),
+    ],
+)
+def test_experiment_batch_fitters_match_serial(sim, fit, fit_batch, kwargs, key):
+    x, y, s = _stack(sim, 4, **kwargs)
+    batched = fit_batch(x, y, s)
+    for i, res in enumerate(batched):
+        ref = fit(x, y[i], s[i])
+        assert getattr(res, key) == pytest.approx(getattr(ref, key), rel=1e-4)
+
+
+def test_hahn_echo_batch_matches_serial():
+    delays = np.linspace(0.0, 60e-6, 60)
+    rows = [
+        simulate_hahn_echo(80e3, 100e-6, echo=True, delays=delays, seed=i) for i in range(3)
+    ]
+    y = np.array([r[1] for r in rows])
+    s = np.array([r[2] for r in rows])
+    for i, res in enumerate(fit_hahn_echo_batch(delays, y, s)):
+        assert res.T1 == pytest.approx(fit_hahn_echo(delays, y[i], s[i]).T1, rel=1e-4)
+
+
+def test_unfittable_curve_is_not_converged():
+    """A curve no step can improve drops out of the batch flagged as not converged."""
+    t = np.linspace(0, 1e-4, 40)
+    y = np.tile(exp_decay(t, 1.0, 40e-6, 0.0), (3, 1))
+    y[1, 5] = np.nan  # cost is NaN for every trial point
+    batch = fit_curve_batch(exp_decay, t, y, p0=[0.9, 30e-6, 0.02], names=("A", "T1", "C"))
+    np.testing.assert_array_equal(batch.converged, [True, False, True])
+    assert batch.n_iter < 200  # it left the active set instead of exhausting the budget
+    np.testing.assert_allclose(batch.value("T1")[[0, 2]], 40e-6, rtol=1e-6)
+
+
+def test_experiment_batch_fit_reports_convergence_per_curve():
+    """A step that no exponential can follow is flagged on its own per-qubit result."""
+    delays = np.linspace(0, 2e-4, 30)
+    decay = exp_decay(delays, 0.9, 50e-6, 0.05)
+    step = np.where(delays < 1e-4, 1.0, 0.0)
+    results = fit_t1_batch(delays, np.vstack([decay, step, decay]))
+    assert [r.fit.converged for r in results] == [True, False, True]
+    assert results[0].T1 == pytest.approx(50e-6, rel=1e-6)
@@ -0,0 +1,74 @@
+import random
+
+import numpy as np
+import pytest
+
+from qht.cryocooler.cryocooler import CryocoolerTest
+from qht.cryocooler.fusion import KalmanFusion, steady_state_gain
+from qht.cryocooler.sensor import SensorBank
+from qht.cryocooler.thermal_network import ThermalNetwork
+
+
+def test_steady_state_gain_is_a_riccati_fixed_point():
+    q, r = 1e-6, 3e-4
+    gain, var = steady_state_gain(q, r)
+    predicted = var + q
+    assert predicted * r / (predicted + r) == pytest.approx(var)
+    assert gain == pytest.approx(predicted / (predicted + r))
+
+
+def test_inverse_variance_weighting_and_masks():
+    fusion = KalmanFusion([1e-4, 4e-4, 1e-4])
+    est, var = fusion.update([4.0, 4.5, np.nan])
+    assert est == pytest.approx((4.0 / 1e-4 + 4.5 / 4e-4) / (1 / 1e-4 + 1 / 4e-4))
+    assert var == pytest.approx(1 / (1 / 1e-4 + 1 / 4e-4))
+
+    # A masked-out sensor is ignored even if it reports a value.
+    fusion.reset()
+    est, var = fusion.update([4.0, 100.0, 4.0], valid=np.array([True, False, True]))
+    assert est == pytest.approx(4.0)
+
+    # With nothing valid the filter only predicts: estimate held, variance grows.
+    assert fusion.update([np.nan] * 3) == (est, pytest.approx(var + fusion.process_variance))
+
+
+def test_full_sensor_set_runs_at_the_precomputed_gain():
+    fusion = KalmanFusion([1e-4] * 4, process_variance=1e-6, common_variance=2.5e-4)
+    fusion.update(np.full(4, 4.0))
+    fusion.update(np.full(4, 4.1))
+    assert fusion.gain == fusion.steady_gain and fusion.variance == fusion.steady_variance
+    fusion.update(np.array([4.1, np.nan, np.nan, 4.1]))
+    assert fusion.gain != fusion.steady_gain
+    for _ in range(500):
+        fusion.update(np.full(4, 4.1))
+    assert fusion.gain == fusion.steady_gain
+
+
+def test_fusion_tightens_a_noisy_bank_and_ignores_dropouts():
+    bank = SensorBank(8, base_temp=4.0, noise_level=np.linspace(0.005, 0.05, 8), fail_rate=0.02, seed=3)
+    fusion = KalmanFusion(bank.noise_level ** 2, common_variance=CryocoolerTest.SENSOR_COMMON_VARIANCE)
+    mean, fused = [], []
+    for step in range(3000):
+        readings, valid = bank.read(current_time=step * 0.2)
+        bank.reset(~valid)
+        if valid.any():
+            mean.append(np.nanmean(readings))
+        fused.append(fusion.update(readings, valid)[0])
+    assert np.std(fused[1000:]) < 0.5 * np.std(mean[1000:])
+    assert abs(np.mean(fused[1000:]) - 4.0) < 0.01
+
+
+def test_cryocooler_test_stability_improves_with_fusion():
+    """Fusion steadies the plant itself, not just the estimate the PID sees."""
+    stability = {}
+    for fusion in (False, True):
+        random.seed(7)
+        np.random.seed(7)
+        plant = ThermalNetwork.dilution_refrigerator()
+        test = CryocoolerTest(test_duration=1800, setpoint=4.0, plant=plant, stage='4K',
+                              heater_full_scale=5.0, fusion=fusion)
+        telemetry = test.run_test_cycle(plot=False)
+        stability[fusion] = test.test_results['stability']
+        # Both modes report the same measured quantity: the stage temperature.
+        assert stability[fusion] == pytest.approx(np.std(telemetry['stage_temp'][-100:]))
+    assert stability[True] < 0.85 * stability[False]
@@ -0,0 +1,81 @@
+"""Import-time regression tests: heavy dependencies must load on first use."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - t0
+print(json.dumps({{"elapsed": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def _import_in_fresh_interpreter(module):
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout)
+
+
+@pytest.mark.parametrize(
+    "module, heavy",
+    [
+        ("qht.qubit", ("scipy", "qutip", "qht.qubit.models")),
+        ("qht.cryocooler.cryocooler", ("pandas", "matplotlib", "reportlab")),
+    ],
+)
+def test_heavy_imports_are_deferred(module, heavy):
+    loaded = set(_import_in_fresh_interpreter(module)["modules"])
+    assert not loaded & set(heavy)
+
+
+def test_import_time_budget():
+    # numpy dominates; a regression that re-introduces eager scipy, pandas or
+    # matplotlib imports typically costs several hundred milliseconds.
+    for module in ("qht.qubit", "qht.cryocooler.cryocooler"):
+        assert _import_in_fresh_interpreter(module)["elapsed"] < 1.0
+
+
+def test_lazy_attributes_resolve():
+    import qht.qubit as qubit
+
+    assert set(qubit.__all__) <= set(dir(qubit))
+    assert qubit.fit_t1 is __import__("qht.qubit.relaxation", fromlist=["fit_t1"]).fit_t1
+    with pytest.raises(AttributeError):
+        qubit.not_a_function
+
+
+def test_submodules_resolve_as_attributes():
+    import importlib
+
+    import qht.qubit as qubit
+
+    assert qubit.relaxation is importlib.import_module("qht.qubit.relaxation")
+    assert qubit.rb_modes.simulate_simultaneous_rb is qubit.simulate_simultaneous_rb
+    with pytest.raises(AttributeError):
+        qubit.not_a_submodule
+
+
+def test_type_checking_imports_match_exports():
+    import ast
+
+    import qht.qubit as qubit
+
+    tree = ast.parse(Path(qubit.__file__).read_text())
+    block = next(node for node in tree.body if isinstance(node, ast.If)
+                 and isinstance(node.test, ast.Name) and node.test.id == "TYPE_CHECKING")
+    static = {node.module: tuple(alias.name for alias in node.names)
+              for node in block.body if isinstance(node, ast.ImportFrom)}
+    assert static == qubit._SUBMODULE_EXPORTS
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from qht.cryocooler.cryocooler import CryocoolerTest
+from qht.cryocooler.metrics import OnlineMetrics
+from qht.cryocooler.telemetry import TelemetryBuffer
+
+
+def cooldown(n, seed=0):
+    rng = np.random.default_rng(seed)
+    times = np.arange(n) * 0.2
+    return times, 4.0 + 0.8 * np.exp(-times / 20.0) + rng.normal(0, 0.01, n)
+
+
+def batch_metrics(times, temps, setpoint=4.0):
+    test = CryocoolerTest(test_duration=1, setpoint=setpoint, fusion=False)
+    buf = TelemetryBuffer(n_sensors=0, capacity=len(times))
+    for t, temp in zip(times, temps):
+        buf.append(t, temp, 0.0, [])
+    test.calculate_metrics(buf)
+    return test.test_results
+
+
+def test_matches_calculate_metrics_at_any_point_of_the_run():
+    times, temps = cooldown(1000)
+    online = OnlineMetrics(setpoint=4.0)
+    for i, (t, temp) in enumerate(zip(times, temps), start=1):
+        online.update(t, temp)
+        if i in (2, 50, 100, 101, 537, 1000):
+            expected = batch_metrics(times[:i], temps[:i])
+            got = online.results()
+            for key, value in expected.items():
+                if value is None:
+                    assert got[key] is None
+                else:
+                    assert got[key] == pytest.approx(value, rel=1e-9, abs=1e-12), key
+
+
+def test_window_stays_exact_over_long_runs():
+    rng = np.random.default_rng(1)
+    temps = 4.0 + 1e3 * rng.standard_normal(200_003)
+    online = OnlineMetrics(setpoint=4.0)
+    for i, temp in enumerate(temps):
+        online.update(i * 0.2, temp)
+    assert online.stability == pytest.approx(np.std(temps[-100:]), rel=1e-9)
+    assert online.variance == pytest.approx(np.var(temps), rel=1e-9)
+
+
+def test_hold_time_ignores_brief_visits_to_the_band():
+    times = np.arange(60) * 1.0
+    temps = np.full(60, 5.0)
+    temps[10:12] = 4.0  # brief dip into the band
+    temps[30:] = 4.05
+    plain, held = OnlineMetrics(4.0), OnlineMetrics(4.0, hold_time=5.0)
+    for t, temp in zip(times, temps):
+        plain.update(t, temp)
+        held.update(t, temp)
+    assert plain.settling_time == 10.0
+    assert held.settling_time == 30.0
+
+
+def test_cryocooler_test_reports_streaming_metrics():
+    test = CryocoolerTest(test_duration=40, setpoint=4.0)
+    assert test.metrics.results()['stability'] is None
+    telemetry = test.run_test_cycle(plot=False)
+    streamed = dict(test.test_results)
+    test.calculate_metrics(telemetry)
+    for key, value in test.test_results.items():
+        if value is not None:
+            assert streamed[key] == pytest.approx(value, rel=1e-9)
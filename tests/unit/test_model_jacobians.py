@@ -0,0 +1,98 @@
+"""Tests for the analytic-Jacobian model registry."""
+
+import numpy as np
+import pytest
+
+from qht.qubit import models
+from qht.qubit.models import (
+    exp_decay,
+    ramsey_decay,
+    rabi_cosine,
+    fit_curve,
+    fit_curve_batch,
+    get_model_spec,
+    register_model,
+)
+from qht.qubit.randomized_benchmarking import rb_survival_model
+
+
+CASES = [
+    (exp_decay, np.linspace(0, 2e-4, 50), [0.95, 40e-6, 0.03]),
+    (ramsey_decay, np.linspace(0, 1e-4, 80), [0.48, 30e-6, 0.4e6, 0.3, 0.5]),
+    (rabi_cosine, np.linspace(0, 3e-7, 60), [0.97, 9e6, 0.015]),
+    (rb_survival_model, np.arange(0, 200, 10, dtype=float), [0.5, 0.985, 0.5]),
+]
+
+
+@pytest.mark.parametrize("model, x, params", CASES)
+def test_registered_jacobian_matches_finite_differences(model, x, params):
+    spec = get_model_spec(model)
+    assert spec is not None
+    value, jac = spec.value_and_jac(x, *params)
+    np.testing.assert_allclose(value, model(x, *params))
+    assert jac.shape == (x.size, len(params))
+    for j, pj in enumerate(params):
+        h = 1e-6 * max(abs(pj), 1e-3)
+        up = list(params)
+        dn = list(params)
+        up[j] += h
+        dn[j] -= h
+        fd = (model(x, *up) - model(x, *dn)) / (2 * h)
+        np.testing.assert_allclose(jac[:, j], fd, rtol=1e-5, atol=1e-6 * np.max(np.abs(fd)) + 1e-12)
+
+
+@pytest.mark.parametrize("model, x, params", CASES)
+def test_analytic_and_numeric_fits_agree(model, x, params):
+    rng = np.random.default_rng(0)
+    y = model(x, *params) + rng.normal(0, 0.005, x.size)
+    sigma = np.full(x.size, 0.005)
+    p0 = [v * 1.02 for v in params]
+    names = get_model_spec(model).names
+    analytic = fit_curve(model, x, y, p0=p0, names=names, sigma=sigma)
+    numeric = fit_curve(model, x, y, p0=p0, names=names, sigma=sigma, jac="2-point")
+    np.testing.assert_allclose(analytic.popt, numeric.popt, rtol=1e-5, atol=1e-9)
+    np.testing.assert_allclose(analytic.perr, numeric.perr, rtol=1e-3)
+
+
+def test_batch_jacobian_broadcasts():
+    """The same value_and_jac serves a (n, m) batch with (n, 1) parameter columns."""
+    spec = get_model_spec(exp_decay)
+    t = np.linspace(0, 1e-4, 30)
+    T1 = np.array([[20e-6], [50e-6]])
+    value, jac = spec.value_and_jac(np.broadcast_to(t, (2, 30)), 1.0, T1, 0.0)
+    assert value.shape == (2, 30)
+    assert jac.shape == (2, 30, 3)
+
+
+@pytest.fixture
+def isolated_registry(monkeypatch):
+    """Models registered by a test are dropped again when it finishes."""
+    monkeypatch.setattr(models, "_MODEL_REGISTRY", dict(models._MODEL_REGISTRY))
+
+
+def test_value_and_jacobian_share_one_evaluation(isolated_registry):
+    """fit_curve reuses the model evaluation when curve_fit asks for the Jacobian."""
+    calls = {"n": 0}
+
+    def line(x, a, b):
+        return a * x + b
+
+    def line_value_and_jac(x, a, b):
+        calls["n"] += 1
+        value = a * x + b
+        return value, np.stack([np.broadcast_to(x, value.shape), np.ones_like(value)], axis=-1)
+
+    register_model(line, line_value_and_jac, ("a", "b"))
+    x = np.linspace(0, 1, 20)
+    y = 2.0 * x + 1.0 + np.random.default_rng(1).normal(0, 0.01, 20)
+    res = fit_curve(line, x, y, p0=[1.0, 0.0], names=("a", "b"))
+    assert res.value("a") == pytest.approx(2.0, abs=0.05)
+    # One joint evaluation per model evaluation; every Jacobian request is
+    # served from the cache instead of costing a call of its own.
+    assert calls["n"] == res.nfev
+
+    calls["n"] = 0
+    batch = fit_curve_batch(line, x, np.tile(y, (3, 1)), p0=[1.0, 0.0], names=("a", "b"))
+    np.testing.assert_allclose(batch.value("a"), res.value("a"), rtol=1e-6)
+    assert calls["n"] == batch.n_iter + 1  # the starting point, then one per iteration
+
@@ -1,7 +1,7 @@
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose
-from qht.cryocooler.pid import PID
+from qht.cryocooler.pid import GainScheduledPID, PID
 
 def test_pid_step_response():
     # Create PID controller with conservative gains
@@ -43,3 +43,29 @@ def test_pid_random_fluctuations():
     # Check the average of the last 20 values
     avg_value = np.mean(values[-20:])
     assert_allclose(avg_value, 4.0, atol=0.5)  # Use numpy's testing function
+
+def test_gain_schedule_interpolates_and_holds_ends():
+    pid = GainScheduledPID([0.5, 1.0], [(1.0, 0.1, 0.0), (3.0, 0.3, 0.2)], setpoint=4.0)
+    assert pid.gains(0.0) == (1.0, 0.1, 0.0)
+    assert_allclose(pid.gains(0.75), (2.0, 0.2, 0.1))
+    assert pid.gains(5.0) == (3.0, 0.3, 0.2)
+    with pytest.raises(ValueError):
+        GainScheduledPID([1.0, 0.5], [(1, 0, 0), (2, 0, 0)], setpoint=4.0)
+
+def test_gain_schedule_is_bumpless_and_keeps_state():
+    # ki doubles when |error| crosses 0.5 -> 1.0; the integral term must not jump.
+    pid = GainScheduledPID([0.5, 1.0], [(0.0, 1.0, 0.0), (0.0, 2.0, 0.0)], setpoint=0.0,
+                           output_limits=(-100, 100))
+    pid.update(0.0, current_time=0.0)
+    out_a = pid.update(-0.5, current_time=1.0)  # i_term = 1.0 * 0.5 * 1
+    out_b = pid.update(-1.0, current_time=1.0 + 1e-9)  # tiny step at twice the gain
+    assert out_a == pytest.approx(0.5)
+    assert out_b == pytest.approx(0.5, abs=1e-6)
+
+def test_gain_schedule_matches_pid_with_constant_gains():
+    pid = PID(kp=2.0, ki=0.1, kd=0.0, setpoint=4.0, output_limits=(0, 10))
+    sched = GainScheduledPID([0.0], [(2.0, 0.1, 0.0)], setpoint=4.0, output_limits=(0, 10))
+    rng = np.random.default_rng(0)
+    for t in range(200):
+        value = 4.0 + rng.normal(0, 0.3)
+        assert sched.update(value, current_time=t * 0.1) == pytest.approx(pid.update(value, current_time=t * 0.1))
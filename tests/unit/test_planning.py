@@ -0,0 +1,71 @@
+"""Tests for the Fisher-information shot-budget planner."""
+
+import argparse
+
+import numpy as np
+import pytest
+
+from qht.qubit.__main__ import run_plan
+from qht.qubit.models import exp_decay, rabi_cosine, ramsey_decay
+from qht.qubit.planning import fisher_information, min_shots, predicted_errors
+from qht.qubit.rabi import fit_rabi, rabi_durations, simulate_rabi
+from qht.qubit.ramsey import fit_ramsey, ramsey_delays, simulate_ramsey
+from qht.qubit.relaxation import fit_t1, simulate_t1, t1_delays
+
+
+def test_t1_prediction_matches_fitted_error_bar():
+    d = t1_delays(50e-6)
+    pred = predicted_errors(exp_decay, d, (0.98, 50e-6, 0.02), 2048)
+    res = fit_t1(*simulate_t1(50e-6, delays=d, n_shots=2048, seed=0))
+    assert res.T1_err == pytest.approx(pred[1], rel=0.1)
+
+
+def test_t1_prediction_matches_monte_carlo_spread():
+    d = t1_delays(50e-6)
+    pred = predicted_errors(exp_decay, d, (0.98, 50e-6, 0.02), 1024)[1]
+    t1s = [fit_t1(*simulate_t1(50e-6, delays=d, n_shots=1024, seed=s)).T1 for s in range(200)]
+    assert np.std(t1s) == pytest.approx(pred, rel=0.15)
+
+
+def test_ramsey_and_rabi_predictions():
+    d = ramsey_delays(30e-6, 0.5e6)
+    pred = predicted_errors(ramsey_decay, d, (0.48, 30e-6, 0.5e6, 0.0, 0.5), 4096)
+    res = fit_ramsey(*simulate_ramsey(30e-6, 0.5e6, delays=d, seed=1))
+    assert res.T2_err == pytest.approx(pred[1], rel=0.1)
+    assert res.delta_f_err == pytest.approx(pred[2], rel=0.1)
+
+    d = rabi_durations(10e6)
+    pred = predicted_errors(rabi_cosine, d, (0.97, 10e6, 0.015), 4096)
+    res = fit_rabi(*simulate_rabi(10e6, durations=d, seed=2))
+    assert res.f_rabi_err == pytest.approx(pred[1], rel=0.2)
+
+
+def test_vectorized_over_grids_and_shot_counts():
+    params = (0.98, 50e-6, 0.02)
+    grids = np.stack([np.linspace(0, s * 50e-6, 40) for s in (1.0, 2.0, 4.0, 8.0)])
+    assert fisher_information(exp_decay, grids, params).shape == (4, 3, 3)
+    err = predicted_errors(exp_decay, grids, params, 1000)
+    for g, e in zip(grids, err):
+        np.testing.assert_allclose(e, predicted_errors(exp_decay, g, params, 1000))
+
+    shots = np.array([100, 400, 1600])
+    scan = predicted_errors(exp_decay, grids[2], params, shots[:, None])
+    assert scan.shape == (3, 3)
+    np.testing.assert_allclose(scan[:-1, 1] / scan[1:, 1], 2.0)
+
+
+def test_min_shots_meets_target():
+    d = t1_delays(50e-6)
+    params = (0.98, 50e-6, 0.02)
+    n = int(min_shots(exp_decay, d, params, 0.01, param="T1", relative=True))
+    assert predicted_errors(exp_decay, d, params, n)[1] <= 0.01 * 50e-6
+    assert predicted_errors(exp_decay, d, params, n - 1)[1] > 0.01 * 50e-6
+
+
+def test_cli_plan_prints_budget(capsys):
+    args = argparse.Namespace(
+        t1_us=50.0, t2_us=30.0, detuning_mhz=0.5, rabi_mhz=10.0, shots=4096, target_rel_err=0.01
+    )
+    run_plan(args)
+    out = capsys.readouterr().out
+    assert "T1" in out and "Ramsey T2*" in out and "Rabi rate" in out
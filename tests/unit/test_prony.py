@@ -0,0 +1,69 @@
+"""Tests for the closed-form (linearized Prony) decay estimator."""
+
+import numpy as np
+import pytest
+
+from qht.qubit.models import exp_decay
+from qht.qubit.prony import decay_guess, prony_decay, prony_fit
+from qht.qubit.relaxation import simulate_t1, fit_t1, _T1_BOUNDS
+from qht.qubit.hahn_echo import _ECHO_BOUNDS, simulate_hahn_echo, fit_hahn_echo
+
+
+def test_exact_on_noiseless_curve():
+    t = np.linspace(0, 200e-6, 400)
+    y = exp_decay(t, 0.95, 40e-6, 0.03)
+    A, T, C = prony_decay(t, y)
+    assert T == pytest.approx(40e-6, rel=1e-3)
+    assert A == pytest.approx(0.95, rel=1e-3)
+    assert C == pytest.approx(0.03, abs=1e-3)
+
+
+def test_close_to_least_squares_optimum():
+    """On shot-noisy data the estimate sits within ~1 sigma of the LS fit."""
+    for seed in range(5):
+        d, p, s = simulate_t1(50e-6, n_shots=2048, seed=seed)
+        ls = fit_t1(d, p, s)
+        fast = fit_t1(d, p, s, method="prony")
+        assert abs(fast.T1 - ls.T1) < ls.T1_err
+        assert fast.T1_err == pytest.approx(ls.T1_err, rel=0.1)
+        assert fast.fit.nfev == 1
+
+
+def test_batched_rows_and_nonuniform_grid():
+    d = np.geomspace(1e-7, 250e-6, 60)
+    rows = np.array([simulate_t1(60e-6, delays=d, n_shots=8192, seed=i)[1] for i in range(3)])
+    est = prony_decay(d, rows)
+    assert est.shape == (3, 3)
+    np.testing.assert_allclose(est[:, 1], 60e-6, rtol=0.05)
+
+
+def test_flat_curve_has_no_estimate():
+    t = np.linspace(0, 1e-4, 30)
+    assert np.all(np.isnan(prony_decay(t, np.full(30, 0.5))))
+    with pytest.raises(RuntimeError):
+        prony_fit(t, np.full(30, 0.5))
+
+
+def test_initial_guess_falls_back_to_heuristic():
+    """A rising curve gets the data-shape seed instead of a nan."""
+    t = np.linspace(0, 1e-4, 30)
+    seeds = decay_guess(t, np.linspace(0.1, 0.9, 30), _T1_BOUNDS)
+    assert np.all(np.isfinite(seeds))
+
+
+def test_guess_is_checked_against_the_caller_bounds():
+    """An echo offset above 1 is out of the T1 box but inside the echo one."""
+    t = np.linspace(0, 1e-4, 30)
+    y = exp_decay(t, 0.2, 30e-6, 1.1)
+    echo = decay_guess(t, y, _ECHO_BOUNDS)
+    np.testing.assert_allclose(echo, prony_decay(t, y), rtol=1e-6)
+    assert echo[2] > 1.0
+    assert decay_guess(t, y, _T1_BOUNDS)[2] != pytest.approx(echo[2])
+
+
+def test_hahn_echo_prony_fast_path():
+    delays = np.linspace(0.0, 270e-6, 60)
+    d, p, s = simulate_hahn_echo(120e3, 90e-6, echo=True, delays=delays, n_shots=32000, seed=2)
+    res = fit_hahn_echo(d, p, s, method="prony")
+    assert res.fit.names == ("A", "T2", "C")
+    assert abs(res.T1 - 90e-6) / 90e-6 < 0.05
@@ -12,6 +12,9 @@ from qht.qubit.randomized_benchmarking import (
     _compose_index,
     _inverse_index,
     _identity_index,
+    _cayley_tables,
+    _compose_sequences,
+    _random_sequences,
 )
 
 
@@ -66,3 +69,49 @@ def test_rb_model_shape():
     y = rb_survival_model(m, A=0.5, p=0.99, B=0.5)
     assert y[0] == pytest.approx(1.0)
     assert np.all(np.diff(y) <= 0)
+
+
+def test_cayley_tables_match_matrix_composition():
+    group, lookup = _clifford_group()
+    mult, inv = _cayley_tables()
+    assert mult.shape == (24, 24) and inv.shape == (24,)
+    for a in range(24):
+        assert inv[a] == _inverse_index(group, lookup, a)
+        for b in range(24):
+            assert mult[a, b] == _compose_index(group, lookup, a, b)
+
+
+def test_tree_composition_matches_sequential_fold():
+    group, lookup = _clifford_group()
+    mult, _ = _cayley_tables()
+    ident = _identity_index(group, lookup)
+    rng = np.random.default_rng(3)
+    for m in (0, 1, 2, 7, 64, 129):
+        gates = rng.integers(0, 24, size=(5, m))
+        net = _compose_sequences(gates, mult, ident)
+        for row, got in zip(gates, net):
+            ref = ident
+            for g in row:
+                ref = _compose_index(group, lookup, int(g), ref)
+            assert got == ref
+
+
+def test_recovery_inverts_every_sequence():
+    mult, _ = _cayley_tables()
+    ident = _identity_index(*_clifford_group())
+    gates, recovery = _random_sequences(np.random.default_rng(0), 500, 50)
+    full = np.concatenate([gates, recovery[:, None]], axis=1)
+    assert np.all(_compose_sequences(full, mult, ident) == ident)
+
+
+def test_ragged_sequences_and_per_sequence_matrix():
+    lengths = np.array([1, 10, 100])
+    L, S, sg, per_seq = simulate_rb(
+        0.99, lengths=lengths, n_sequences=[5, 20, 50], seed=4, return_per_sequence=True
+    )
+    np.testing.assert_array_equal(L, lengths)
+    assert per_seq.shape == (3, 50)
+    np.testing.assert_array_equal((~np.isnan(per_seq)).sum(axis=1), [5, 20, 50])
+    np.testing.assert_allclose(S, np.nanmean(per_seq, axis=1))
+    sem = np.nanstd(per_seq, axis=1, ddof=1) / np.sqrt([5, 20, 50])
+    np.testing.assert_allclose(sg, np.maximum(sem, 0.5 / 4096))
@@ -0,0 +1,71 @@
+"""Tests for the gate-level (PTM) randomized-benchmarking engine."""
+
+import numpy as np
+import pytest
+
+from qht.qubit.ptm import (
+    amplitude_damping_ptm,
+    depolarizing_ptm,
+    rotation_ptm,
+    tree_matmul,
+    unitary_ptm,
+)
+from qht.qubit.randomized_benchmarking import (
+    _clifford_group,
+    fit_rb,
+    simulate_rb_gate_level,
+)
+
+
+def test_tree_matmul_matches_sequential_product():
+    rng = np.random.default_rng(0)
+    mats = rng.normal(size=(3, 11, 4, 4))
+    ref = np.broadcast_to(np.eye(4), (3, 4, 4)).copy()
+    for k in range(11):
+        ref = mats[:, k] @ ref
+    np.testing.assert_allclose(tree_matmul(mats), ref, rtol=1e-10, atol=1e-12)
+    np.testing.assert_allclose(tree_matmul(mats[:, :0]), np.broadcast_to(np.eye(4), (3, 4, 4)))
+
+
+def test_channel_ptms():
+    group, _ = _clifford_group()
+    ptms = unitary_ptm(group)
+    assert ptms.shape == (24, 4, 4)
+    np.testing.assert_allclose(ptms @ ptms.transpose(0, 2, 1), np.broadcast_to(np.eye(4), (24, 4, 4)))
+    # Amplitude damping drives |1> = (1, 0, 0, -1) toward |0>.
+    out = amplitude_damping_ptm(0.3) @ np.array([1.0, 0.0, 0.0, -1.0])
+    assert out[3] == pytest.approx(-0.4)
+    np.testing.assert_allclose(rotation_ptm([0, 0, 1], np.pi / 2)[1:, 1:] @ [1, 0, 0], [0, 1, 0], atol=1e-12)
+
+
+def test_noiseless_sequences_survive():
+    _, survival, _ = simulate_rb_gate_level(None, lengths=[1, 50, 300], n_sequences=20, seed=0)
+    np.testing.assert_allclose(survival, 1.0)
+
+
+def test_depolarizing_reproduces_analytic_engine():
+    p = 0.99
+    lengths, survival, sigma = simulate_rb_gate_level(depolarizing_ptm(p), n_sequences=30, seed=0)
+    np.testing.assert_allclose(survival, 0.5 * (1 + p ** (lengths + 1)), atol=4 * sigma.max())
+    assert fit_rb(lengths, survival, sigma).p == pytest.approx(p, abs=0.003)
+
+
+def test_coherent_over_rotation_matches_average_fidelity():
+    """A fixed over-rotation is twirled by RB into depolarizing p = 2*F_avg - 1."""
+    theta = 0.1
+    lengths = np.arange(1, 400, 25)
+    L, S, sg = simulate_rb_gate_level(
+        rotation_ptm([0, 0, 1], theta), lengths=lengths, n_sequences=1000, seed=1, max_block=4096
+    )
+    f_avg = (2 * np.cos(theta / 2) ** 2 + 1) / 3
+    res = fit_rb(L, S, sg)
+    assert abs(res.p - (2 * f_avg - 1)) < 4 * res.p_err
+
+
+def test_gate_dependent_errors():
+    errs = np.broadcast_to(np.eye(4), (24, 4, 4)).copy()
+    errs[5] = depolarizing_ptm(0.9)  # one bad Clifford
+    L, S, sg = simulate_rb_gate_level(errs, n_sequences=40, seed=2)
+    res = fit_rb(L, S, sg)
+    # On average one gate in 24 is hit (the recovery is also drawn uniformly).
+    assert res.p == pytest.approx(1 - 0.1 / 24, abs=0.002)
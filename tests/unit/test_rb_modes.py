@@ -0,0 +1,83 @@
+"""Tests for interleaved and simultaneous randomized benchmarking."""
+
+import time
+
+import numpy as np
+import pytest
+
+from qht.qubit.ptm import depolarizing_ptm, rotation_ptm
+from qht.qubit.randomized_benchmarking import _ptm_survival, fit_rb_batch
+from qht.qubit.rb_modes import (
+    _ragged_ptm_survival,
+    fit_interleaved_rb,
+    interleaved_rb_model,
+    simulate_interleaved_rb,
+    simulate_simultaneous_rb,
+)
+
+
+def test_noiseless_interleaved_sequences_survive():
+    _, ref, _, inter, _ = simulate_interleaved_rb(7, lengths=[1, 20, 100], n_sequences=10, seed=0)
+    np.testing.assert_allclose(ref, 1.0)
+    np.testing.assert_allclose(inter, 1.0)
+
+
+def test_interleaved_gate_error_with_propagated_uncertainty():
+    p_gate = 0.99
+    data = simulate_interleaved_rb(
+        3, depolarizing_ptm(0.995), depolarizing_ptm(p_gate), n_sequences=100, seed=0
+    )
+    res = fit_interleaved_rb(*data)
+    r_true = 0.5 * (1 - p_gate)
+    assert res.p_ref == pytest.approx(0.995, abs=5 * res.p_ref_err + 1e-4)
+    assert 0 < res.gate_error_err < 1e-3
+    assert abs(res.gate_error - r_true) < 5 * res.gate_error_err + 1e-4
+    assert res.gate_fidelity == pytest.approx(1 - res.gate_error)
+
+
+def test_joint_model_shares_spam():
+    x = np.stack([np.array([1.0, 2.0, 1.0, 2.0]), np.array([0.0, 0.0, 1.0, 1.0])])
+    y = interleaved_rb_model(x, 0.5, 0.9, 0.8, 0.5)
+    np.testing.assert_allclose(y, [0.95, 0.905, 0.9, 0.82])
+
+
+def test_simultaneous_rb_exposes_crosstalk():
+    p = np.linspace(0.99, 0.999, 50)
+    t0 = time.perf_counter()
+    lengths, survival, sigma = simulate_simultaneous_rb(p, crosstalk=0.998, n_sequences=100, seed=1)
+    fits = fit_rb_batch(lengths, survival, sigma)
+    assert time.perf_counter() - t0 < 5.0
+    assert survival.shape == (50, lengths.size)
+    p_fit = np.array([f.p for f in fits])
+    p_err = np.array([f.p_err for f in fits])
+    assert np.all(np.abs(p_fit - 0.998 * p) < 5 * p_err + 1e-4)
+
+
+def test_noiseless_simultaneous_sequences_survive():
+    # Holds only if every recovery from the Cayley-table reduction inverts its
+    # sequence, padding included.
+    _, survival, _ = simulate_simultaneous_rb(np.ones(3), lengths=[1, 2, 17, 100], n_sequences=20, seed=0)
+    np.testing.assert_array_equal(survival, 1.0)
+
+
+def test_coherent_crosstalk_depends_on_the_sequences():
+    lengths = [1, 10, 100]
+    _, survival, sigma = simulate_simultaneous_rb(
+        np.ones(2), crosstalk_angle=[0.0, 0.05], lengths=lengths, n_sequences=40, seed=0
+    )
+    np.testing.assert_array_equal(survival[0], 1.0)
+    assert survival[1, -1] < 0.99
+    # The spread across sequences far exceeds what shot noise alone gives.
+    shot_sem = np.sqrt(survival[1, -1] * (1 - survival[1, -1]) / (4096 * 40))
+    assert sigma[1, -1] > 5 * shot_sem
+
+
+def test_ragged_propagation_matches_tree_reduction():
+    rng = np.random.default_rng(2)
+    ptms = np.stack(
+        [rotation_ptm(rng.normal(size=3), a) @ depolarizing_ptm(0.97) for a in rng.uniform(0, 1, 6)]
+    )
+    slots = rng.integers(0, 6, size=(9, 12))
+    start = rng.integers(0, 12, size=9)
+    expected = [_ptm_survival(row[s:][None], ptms, 1 << 10)[0] for row, s in zip(slots, start)]
+    np.testing.assert_allclose(_ragged_ptm_survival(slots, start, ptms), expected, rtol=1e-12)
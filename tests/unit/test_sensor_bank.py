@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from qht.cryocooler.sensor import Sensor, SensorBank
+from qht.daq.daq_system import DAQ
+
+
+def test_bank_reads_all_sensors_at_once():
+    bank = SensorBank(64, base_temp=4.0, fail_rate=0.0, seed=0)
+    readings, valid = bank.read(current_time=0.0)
+    assert readings.shape == (64,) and valid.all()
+    # dt = 0 on the first read: thermal inertia keeps the initial reading.
+    np.testing.assert_allclose(readings, bank.last_reading)
+    for t in np.arange(0.2, 60.0, 0.2):
+        readings, _ = bank.read(current_time=t)
+    assert np.all(np.abs(readings - 4.0) < 0.2)
+
+
+def test_bank_matches_sensor_physics_without_noise():
+    sensor = Sensor(0, base_temp=3.0, noise_level=0.0, response_time=0.5, fail_rate=0.0)
+    bank = SensorBank(1, base_temp=3.0, noise_level=0.0, response_time=0.5, fail_rate=0.0, seed=1)
+    bank.last_reading[:] = sensor.last_reading
+    for t in (0.0, 0.3, 1.0, 7.5):
+        assert bank.read(current_time=t)[0][0] == pytest.approx(sensor.read(current_time=t))
+
+
+def test_bank_failures_are_masked_and_reset():
+    bank = SensorBank(8, fail_rate=[0.0] * 7 + [1.0], seed=2)
+    readings, valid = bank.read(current_time=1.0)
+    np.testing.assert_array_equal(valid, [True] * 7 + [False])
+    assert np.isnan(readings[7]) and bank.failed[7]
+    bank.reset()
+    assert not bank.failed.any() and bank.last_reading[7] == bank.base_temp[7]
+
+
+def test_daq_accepts_sensor_bank():
+    bank = SensorBank(4, fail_rate=[0.0, 1.0, 0.0, 0.0], seed=3)
+    daq = DAQ(bank, packet_loss_rate=0.0)
+    data = daq.read_all(current_time=0.5)
+    assert len(data) == 3 and all(isinstance(t, float) for t in data)
+    np.testing.assert_array_equal(daq.last_valid, [True, False, True, True])
+    assert not bank.failed.any()  # the DAQ resets failed sensors, as for Sensor objects
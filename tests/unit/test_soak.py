@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from qht.cryocooler.pid import PID, GainScheduledPID
+from qht.cryocooler.soak import simulate_fixed_step, simulate_soak
+from qht.cryocooler.thermal_model import ThermalModel
+
+
+def make_controller():
+    # The PIDTestScenario gain table (reverse-acting: cooling lowers the temperature).
+    return GainScheduledPID((0.25, 0.75, 1.25), ((-5, -0.02, -0.1), (-7, -0.05, -0.2), (-10, -0.1, -0.3)),
+                            setpoint=4.0, output_limits=(0, 2))
+
+
+def test_derivative_matches_update_for_small_steps():
+    model = ThermalModel(initial_temp=4.2)
+    model.set_cooling_power(1.1)
+    rate = model.derivative(model.temperature)
+    assert (model.update(1e-3) - 4.2) / 1e-3 == pytest.approx(rate)
+
+
+def test_soak_matches_fixed_step_with_far_fewer_events():
+    duration = 1800.0
+    _, temps, _ = simulate_fixed_step(ThermalModel(initial_temp=4.2), make_controller(), duration)
+    res = simulate_soak(ThermalModel(initial_temp=4.2), make_controller(), duration)
+
+    assert res.baseline_steps == len(temps)
+    assert res.n_events < res.baseline_steps / 4
+    assert res.temperatures[-1] == pytest.approx(temps[-1], abs=0.02)
+    assert abs(res.temperatures[-1] - 4.0) < 0.02
+    assert np.all(np.diff(res.times) > 0)
+
+
+def test_disturbance_forces_events():
+    duration = 3600.0
+
+    def heat_leak_step(model):
+        model.heat_leak_coefficient *= 3
+
+    quiet = simulate_soak(ThermalModel(initial_temp=4.0), make_controller(), duration)
+    hit = simulate_soak(ThermalModel(initial_temp=4.0), make_controller(), duration,
+                        disturbances=[(1800.0, heat_leak_step)])
+    assert 1800.0 in hit.times
+    assert hit.n_events > quiet.n_events
+    assert abs(hit.temperatures[-1] - 4.0) < 0.05
+
+
+def test_setpoint_crossings_match_fixed_step():
+    # An underdamped loop that rings through the setpoint.
+    make = lambda: PID(kp=-2, ki=-1, kd=0, setpoint=4.0, output_limits=(0, 2))  # noqa: E731
+    times, temps, _ = simulate_fixed_step(ThermalModel(initial_temp=4.2), make(), 600.0)
+    res = simulate_soak(ThermalModel(initial_temp=4.2), make(), 600.0)
+
+    sign = np.sign(temps - 4.0)
+    fixed = times[1:][sign[1:] * sign[:-1] < 0]
+    assert len(res.crossings) >= 2
+    assert res.crossings[:2] == pytest.approx(fixed[:2], abs=1.0)
@@ -0,0 +1,63 @@
+"""Tests for the streaming (early-stopping) T1 / Ramsey estimators."""
+
+import numpy as np
+import pytest
+
+from qht.qubit.ramsey import simulate_ramsey_stream
+from qht.qubit.relaxation import simulate_t1, simulate_t1_stream, fit_t1, t1_delays
+from qht.qubit.streaming import StreamingRamseyEstimator, StreamingT1Estimator
+
+
+def test_t1_stops_early_at_target_and_saves_shots():
+    delays = t1_delays(50e-6)
+    full_budget = 2048 * delays.size
+    for seed in range(3):
+        est = StreamingT1Estimator(delays, target_rel_err=0.02)
+        res = est.run(simulate_t1_stream(50e-6, delays=delays, max_shots=2048, seed=seed))
+        assert est.done
+        assert res.T1_err / res.T1 < 0.02
+        assert abs(res.T1 - 50e-6) < 4 * res.T1_err
+        assert est.total_shots <= full_budget / 2
+
+
+def test_exhausted_stream_equals_batch_fit():
+    """With an unreachable target the stream spends the full budget and agrees
+    with fitting the accumulated counts in one go."""
+    delays = t1_delays(50e-6)
+    est = StreamingT1Estimator(delays, target_rel_err=1e-6)
+    res = est.run(simulate_t1_stream(50e-6, delays=delays, max_shots=1024, seed=4))
+    assert not est.done
+    assert est.total_shots == 1024 * delays.size
+    ref = fit_t1(delays, est.p_hat, est.sigma)
+    assert res.T1 == pytest.approx(ref.T1, rel=1e-5)
+
+
+def test_sufficient_statistics_match_fixed_sweep_noise():
+    delays = t1_delays(50e-6)
+    est = StreamingT1Estimator(delays)
+    for counts, n in simulate_t1_stream(50e-6, delays=delays, batch_shots=256, max_shots=2048, seed=0):
+        est.update(counts, n)
+    _, _, sigma = simulate_t1(50e-6, delays=delays, n_shots=2048, seed=0)
+    np.testing.assert_allclose(est.sigma, sigma, rtol=0.2)
+
+
+def test_ramsey_stream():
+    delays = np.linspace(0.0, 60e-6, 100)
+    est = StreamingRamseyEstimator(delays, target_rel_err=0.03)
+    res = est.run(simulate_ramsey_stream(20e-6, 0.5e6, delays, max_shots=4096, seed=1))
+    assert est.done
+    assert abs(res.delta_f - 0.5e6) < 5 * res.delta_f_err
+    assert est.total_shots < 4096 * delays.size
+
+
+def test_no_result_before_every_delay_has_shots():
+    est = StreamingT1Estimator(np.linspace(0, 1e-4, 10))
+    assert est.update(np.zeros(10, dtype=int), np.r_[np.zeros(5, int), np.full(5, 8)]) is None
+    assert not est.done
+
+
+def test_base_estimator_is_abstract():
+    from qht.qubit.streaming import _StreamingEstimator
+
+    with pytest.raises(TypeError):
+        _StreamingEstimator(np.linspace(0, 1e-4, 10))
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from qht.cryocooler.cryocooler import CryocoolerTest
+from qht.cryocooler.telemetry import TelemetryBuffer
+
+
+def _fill(buf, n):
+    for i in range(n):
+        buf.append(0.2 * i, 4.0 + i, 10.0 - i, [i, i + 0.5])
+
+
+def test_growable_buffer_keeps_every_row():
+    buf = TelemetryBuffer(n_sensors=2, capacity=3)
+    _fill(buf, 10)
+    assert len(buf) == 10 and buf.capacity >= 10
+    np.testing.assert_allclose(buf['avg_temp'], 4.0 + np.arange(10))
+    np.testing.assert_allclose(buf.sensor_readings[:, 1], np.arange(10) + 0.5)
+    assert buf.columns == ('elapsed_time', 'avg_temp', 'pid_output', 'sensor_0', 'sensor_1')
+
+
+def test_ring_buffer_keeps_latest_window_contiguous():
+    buf = TelemetryBuffer(n_sensors=2, capacity=4, ring=True)
+    _fill(buf, 3)
+    np.testing.assert_allclose(buf['pid_output'], [10.0, 9.0, 8.0])
+    _fill(buf, 11)  # restarts the ramp: rows 3..13 overall
+    assert len(buf) == 4 and buf.total_rows == 14
+    np.testing.assert_allclose(buf['sensor_0'], [7.0, 8.0, 9.0, 10.0])
+
+
+def test_to_dataframe_is_zero_copy():
+    pd = pytest.importorskip("pandas")
+    for ring in (False, True):
+        buf = TelemetryBuffer(n_sensors=2, capacity=4, ring=ring)
+        _fill(buf, 6)
+        df = buf.to_dataframe()
+        assert isinstance(df, pd.DataFrame) and list(df.columns) == list(buf.columns)
+        assert np.shares_memory(df.to_numpy(), buf._data)
+        np.testing.assert_allclose(df['avg_temp'], buf['avg_temp'])
+
+
+def test_extra_columns_sit_between_base_and_sensor_columns():
+    buf = TelemetryBuffer(n_sensors=2, capacity=2, extra_columns=('fused_temp',))
+    buf.append(0.0, 4.0, 1.0, [3.9, 4.1], (4.05,))
+    buf.append(0.2, 4.1, 1.1, [4.0, np.nan], (4.06,))
+    assert buf.columns[3] == 'fused_temp'
+    np.testing.assert_allclose(buf['fused_temp'], [4.05, 4.06])
+    np.testing.assert_allclose(buf.sensor_readings, [[3.9, 4.1], [4.0, np.nan]])
+
+
+def test_cryocooler_test_records_telemetry(capsys):
+    test = CryocoolerTest(test_duration=20, setpoint=4.0)
+    telemetry = test.run_test_cycle(plot=False)
+    assert telemetry is test.telemetry
+    assert 0 < len(telemetry) <= 101  # float time accumulation may add a final step
+    # Averages agree with the per-sensor columns (failed sensors are NaN).
+    np.testing.assert_allclose(
+        np.nanmean(telemetry.sensor_readings, axis=1), telemetry['avg_temp']
+    )
+    # Metrics describe the measured average, not the fused estimate the PID acted on.
+    assert test.test_results['temperature_variance'] == pytest.approx(np.var(telemetry['avg_temp']))
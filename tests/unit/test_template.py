@@ -0,0 +1,66 @@
+"""Tests for the precompiled decay fit template."""
+
+import numpy as np
+import pytest
+
+from qht.qubit.models import exp_decay
+from qht.qubit.relaxation import simulate_t1, fit_t1, fit_t1_batch, t1_delays
+from qht.qubit.hahn_echo import simulate_hahn_echo, fit_hahn_echo
+from qht.qubit.template import DecayTemplate
+
+
+def test_lookup_recovers_noiseless_parameters():
+    t = np.linspace(0, 200e-6, 50)
+    tpl = DecayTemplate(t)
+    y = np.stack([exp_decay(t, 0.95, T, 0.03) for T in (8e-6, 40e-6, 150e-6)])
+    est = tpl.estimate(y)
+    np.testing.assert_allclose(est[:, 1], [8e-6, 40e-6, 150e-6], rtol=1e-3)
+    np.testing.assert_allclose(est[:, 0], 0.95, rtol=1e-3)
+    np.testing.assert_allclose(est[:, 2], 0.03, atol=1e-3)
+
+
+def test_score_table_shape_and_minimum():
+    t = np.linspace(0, 200e-6, 40)
+    tpl = DecayTemplate(t, n_basis=64)
+    chi2 = tpl.score(exp_decay(t, 1.0, 30e-6, 0.0))
+    assert chi2.shape == (1, 64)
+    best = tpl.taus[np.argmin(chi2[0])]
+    assert best == pytest.approx(30e-6, rel=0.15)
+
+
+def test_seeded_fit_matches_default_fit():
+    delays = t1_delays(50e-6)
+    tpl = DecayTemplate(delays)
+    for seed in range(3):
+        d, p, s = simulate_t1(50e-6, delays=delays, seed=seed)
+        ref = fit_t1(d, p, s)
+        res = fit_t1(d, p, s, template=tpl)
+        assert res.T1 == pytest.approx(ref.T1, rel=1e-5)
+        assert res.T1_err == pytest.approx(ref.T1_err, rel=1e-3)
+
+
+def test_batch_block_through_template():
+    delays = np.linspace(0.0, 400e-6, 40)
+    t1s = np.array([25e-6, 60e-6, 110e-6])
+    p = np.array([simulate_t1(t, delays=delays, seed=i)[1] for i, t in enumerate(t1s)])
+    tpl = DecayTemplate(delays)
+    via_fit = tpl.fit(p)
+    via_t1 = fit_t1_batch(delays, p, template=tpl)
+    assert len(via_fit) == 3
+    for i, t1 in enumerate(t1s):
+        assert abs(via_t1[i].T1 - t1) < 5 * via_t1[i].T1_err
+        assert via_fit.value("T1")[i] == pytest.approx(via_t1[i].T1, rel=1e-3)
+
+
+def test_hahn_echo_template():
+    delays = np.linspace(0.0, 270e-6, 60)
+    d, p, s = simulate_hahn_echo(120e3, 90e-6, echo=True, delays=delays, n_shots=32000, seed=2)
+    res = fit_hahn_echo(d, p, s, template=DecayTemplate(delays))
+    assert abs(res.T1 - 90e-6) / 90e-6 < 0.05
+
+
+def test_grid_mismatch_rejected():
+    tpl = DecayTemplate(np.linspace(0, 1e-4, 30))
+    d, p, s = simulate_t1(50e-6, seed=0)
+    with pytest.raises(ValueError):
+        fit_t1(d, p, s, template=tpl)
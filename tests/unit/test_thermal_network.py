@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from qht.cryocooler.cryocooler import CryocoolerTest
+from qht.cryocooler.pid import PID
+from qht.cryocooler.thermal_network import AMBIENT, Link, Stage, ThermalNetwork
+
+
+def chain(n_stages, exponent=1.0):
+    stages = [
+        Stage(f's{i}', heat_capacity=10.0 / (i + 1), initial_temp=50.0 / (i + 1),
+              cooler_conductance=1.0 / (i + 1), base_temp=40.0 / (i + 1), capacity_exponent=exponent)
+        for i in range(n_stages)
+    ]
+    links = [Link('s0', AMBIENT, 0.1)] + [
+        Link(f's{i}', f's{i + 1}', 0.01, exponent=exponent) for i in range(n_stages - 1)
+    ]
+    return ThermalNetwork(stages, links)
+
+
+def test_dilution_refrigerator_starts_in_equilibrium():
+    net = ThermalNetwork.dilution_refrigerator()
+    assert net.names == ['50K', '4K', 'still', 'cold_plate', 'mixing_chamber']
+    assert np.all(np.diff(net.temperature) < 0)
+    start = net.temperature.copy()
+    for _ in range(100):
+        net.update(0.2)
+    np.testing.assert_allclose(net.temperature, start, rtol=1e-9)
+    assert net.n_factorizations == 1
+
+
+def test_implicit_step_converges_to_steady_state_and_reuses_factorization():
+    net = ThermalNetwork.dilution_refrigerator()
+    net.set_heater_power(1e-5, 'mixing_chamber')
+    target = net.steady_state()
+    assert target[-1] > net.temperature[-1]
+    for _ in range(5000):
+        net.update(0.2)
+    np.testing.assert_allclose(net.temperature, target, rtol=1e-6)
+    # Only the temperature-dependent parameters' drift forced refactorizations.
+    assert net.n_factorizations < 20
+
+    before = net.n_factorizations
+    net.set_cooling_power(0.9, 'still')
+    net.update(0.2)
+    assert net.n_factorizations == before + 1
+
+
+def test_single_stage_matches_backward_euler():
+    net = ThermalNetwork([Stage('a', heat_capacity=2.0, initial_temp=10.0, cooler_conductance=0.5,
+                                base_temp=4.0)], [Link('a', AMBIENT, 0.1)])
+    temp = 10.0
+    for _ in range(10):
+        temp = (2.0 * temp + 0.5 * (0.5 * 4.0 + 0.1 * 300.0)) / (2.0 + 0.5 * (0.5 + 0.1))
+        net.update(0.5)
+    assert net.temperature[0] == pytest.approx(temp)
+    assert net.derivative()[0] == pytest.approx(net.net_heat()[0] / 2.0)
+
+
+def test_per_stage_pid_loops_on_a_large_network():
+    net = chain(40)
+    # Reachable setpoints: the equilibrium with some heat on every stage.
+    net.set_heater_power(0.5 * net.cooler_conductance)
+    setpoints = net.steady_state()
+    net.set_heater_power(0.0)
+    pids = [PID(kp=2 * k, ki=0.2 * k, kd=0.0, setpoint=sp, output_limits=(0, 10))
+            for sp, k in zip(setpoints, net.cooler_conductance)]
+    for step in range(2000):
+        temps = net.update(0.5)
+        net.set_heater_power([pid.update(t, current_time=step * 0.5) for pid, t in zip(pids, temps)])
+    np.testing.assert_allclose(net.temperature, setpoints, rtol=1e-3)
+    assert net.n_factorizations < 200
+
+
+def test_unknown_stage_raises():
+    with pytest.raises(KeyError):
+        ThermalNetwork.dilution_refrigerator().index('1K pot')
+
+
+def test_cryocooler_test_can_target_a_stage():
+    net = ThermalNetwork.dilution_refrigerator()
+    test = CryocoolerTest(test_duration=600, setpoint=4.0, plant=net, stage='4K', heater_full_scale=5.0)
+    telemetry = test.run_test_cycle(plot=False)
+    assert net.heater_power[1] > 0 and np.all(net.heater_power[[0, 2, 3, 4]] == 0)
+    assert abs(np.mean(telemetry['avg_temp'][-200:]) - 4.0) < 0.1
@@ -0,0 +1,69 @@
+"""Tests for the variable-projection fitting mode."""
+
+import numpy as np
+import pytest
+
+from qht.qubit.models import exp_decay, fit_curve, ramsey_decay
+from qht.qubit.relaxation import simulate_t1, fit_t1
+from qht.qubit.hahn_echo import simulate_hahn_echo, fit_hahn_echo
+from qht.qubit.ramsey import simulate_ramsey, fit_ramsey
+from qht.qubit.rabi import simulate_rabi, fit_rabi
+from qht.qubit.randomized_benchmarking import simulate_rb, fit_rb
+
+
+@pytest.mark.parametrize(
+    "sim, fit, kwargs, key",
+    [
+        (simulate_t1, fit_t1, {"t1_true": 50e-6}, "T1"),
+        (simulate_ramsey, fit_ramsey, {"t2_true": 30e-6, "delta_f_true": 0.5e6}, "T2"),
+        (simulate_rabi, fit_rabi, {"f_rabi_true": 10e6}, "t_pi"),
+        (simulate_rb, fit_rb, {"p_depol": 0.99}, "epc"),
+    ],
+)
+def test_varpro_matches_joint_fit(sim, fit, kwargs, key):
+    """Same optimum and same (joint-covariance) error bars as the joint fit."""
+    x, y, s = sim(seed=3, **kwargs)
+    joint = fit(x, y, s)
+    vp = fit(x, y, s, method="varpro")
+    assert getattr(vp, key) == pytest.approx(getattr(joint, key), rel=1e-5)
+    assert getattr(vp, key + "_err") == pytest.approx(getattr(joint, key + "_err"), rel=1e-2)
+    k = len(joint.fit.names)
+    assert vp.fit.pcov.shape == (k, k)
+    np.testing.assert_allclose(vp.fit.pcov, joint.fit.pcov, rtol=2e-2, atol=1e-30)
+
+
+def test_varpro_ramsey_recovers_phase():
+    t = np.linspace(0, 90e-6, 120)
+    y = ramsey_decay(t, 0.45, 30e-6, 0.4e6, 0.8, 0.5)
+    fit = fit_curve(
+        ramsey_decay, t, y, p0=[0.1, 20e-6, 0.41e6, 0.0, 0.0],
+        names=("A", "T2", "delta_f", "phi", "C"), method="varpro",
+    )
+    np.testing.assert_allclose(fit.popt, [0.45, 30e-6, 0.4e6, 0.8, 0.5], rtol=1e-6)
+
+
+def test_varpro_ignores_bad_linear_seeds():
+    """Amplitude/offset seeds play no role: they are solved, not searched."""
+    t = np.linspace(0, 2e-4, 50)
+    y = exp_decay(t, 0.9, 40e-6, 0.05)
+    fit = fit_curve(
+        exp_decay, t, y, p0=[-5.0, 30e-6, 7.0], names=("A", "T1", "C"), method="varpro"
+    )
+    assert fit.value("T1") == pytest.approx(40e-6, rel=1e-6)
+    assert fit.value("A") == pytest.approx(0.9, rel=1e-6)
+
+
+def test_varpro_hahn_echo():
+    delays = np.linspace(0.0, 270e-6, 60)
+    d, p, s = simulate_hahn_echo(120e3, 90e-6, echo=True, delays=delays, seed=2)
+    assert fit_hahn_echo(d, p, s, method="varpro").T1 == pytest.approx(
+        fit_hahn_echo(d, p, s).T1, rel=1e-5
+    )
+
+
+def test_unknown_method_and_unregistered_model_rejected():
+    t = np.linspace(0, 1, 10)
+    with pytest.raises(ValueError):
+        fit_curve(exp_decay, t, t, p0=[1, 1, 0], names=("A", "T1", "C"), method="magic")
+    with pytest.raises(ValueError):
+        fit_curve(lambda x, a: a * x, t, t, p0=[1.0], names=("a",), method="varpro")